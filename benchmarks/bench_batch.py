@@ -0,0 +1,64 @@
+"""Compare render_many() against a per-call render loop.
+
+Usage:
+    python benchmarks/bench_batch.py [--rows 5000] [--repeat 5]
+"""
+
+import argparse
+import timeit
+
+from fasthtml.common import to_xml
+
+from faststrap_community import StatCard, TimelineCard, render_many
+
+
+def _timeline_rows(n: int) -> list[dict]:
+    return [
+        {
+            "title": f"Deployment #{i}",
+            "description": f"Release {i} shipped to production",
+            "timestamp": f"{i} minutes ago",
+            "icon": "🚀",
+        }
+        for i in range(n)
+    ]
+
+
+def _stat_rows(n: int) -> list[dict]:
+    return [
+        {"title": f"Metric {i}", "value": f"{i * 37:,}", "trend": f"+{i % 9}.5%", "icon": "📈"}
+        for i in range(n)
+    ]
+
+
+def _bench(label: str, component, rows: list[dict], repeat: int) -> None:
+    def loop() -> str:
+        return "".join(to_xml(component(**row)) for row in rows)
+
+    def batch() -> str:
+        return render_many(component, rows)
+
+    assert loop() == batch(), f"{label}: batch output differs from per-call output"
+
+    t_loop = min(timeit.repeat(loop, number=1, repeat=repeat))
+    t_batch = min(timeit.repeat(batch, number=1, repeat=repeat))
+    n = len(rows)
+    print(
+        f"{label:<14} rows={n:<6} loop={t_loop * 1e3:8.1f} ms ({n / t_loop:9.0f} rows/s)  "
+        f"render_many={t_batch * 1e3:8.1f} ms ({n / t_batch:9.0f} rows/s)  "
+        f"speedup={t_loop / t_batch:5.1f}x"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    _bench("TimelineCard", TimelineCard, _timeline_rows(args.rows), args.repeat)
+    _bench("StatCard", StatCard, _stat_rows(args.rows), args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,313 @@
+"""Micro-benchmark every registered community component.
+
+Each component is rendered to HTML (component call + ``to_xml``) with small,
+typical and pathological argument sets. For every case the suite reports
+renders per second, the peak memory allocated by one render (tracemalloc) and
+the size of the HTML produced.
+
+Results can be saved as a JSON baseline and later runs compared against it;
+the comparison exits with status 1 when a case got slower than the threshold
+or its allocations or output grew.
+
+Usage:
+    python benchmarks/bench_components.py [--only StatCard,TagInput] [--sizes typical]
+    python benchmarks/bench_components.py --save baseline.json
+    python benchmarks/bench_components.py --compare baseline.json [--threshold 0.15]
+"""
+
+import argparse
+import json
+import platform
+import sys
+import timeit
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from fasthtml.common import Div, P, to_xml
+
+from faststrap_community.registry import get_component, list_components
+
+SIZES = ("small", "typical", "pathological")
+
+Case = tuple[tuple, dict[str, Any]]
+
+
+def _menu(fanout: tuple[int, ...], prefix: str = "") -> list[dict[str, Any]]:
+    """VerticalMegaMenu items with ``fanout[i]`` children per node at depth ``i``."""
+    items = []
+    for i in range(fanout[0]):
+        label = f"{prefix}{i}"
+        item: dict[str, Any] = {"label": f"Item {label}", "href": f"/{label}", "icon": "folder"}
+        if len(fanout) > 1:
+            item["children"] = _menu(fanout[1:], f"{label}.")
+        items.append(item)
+    return items
+
+
+_LONG_TEXT = 'Shipped <release> & "hotfix" to production. ' * 200
+
+# Component -> size -> (args, kwargs). Arguments are built once, outside the timings.
+CASES: dict[str, dict[str, Case]] = {
+    "FlipCard": {
+        "small": (("Front", "Back"), {}),
+        "typical": ((Div(P("Front side"), cls="p-3"), Div(P("Back side"), cls="p-3")), {}),
+        "pathological": (
+            (
+                Div(*[P(f"Line {i}") for i in range(500)]),
+                Div(*[P(f"Line {i}") for i in range(500)]),
+            ),
+            {},
+        ),
+    },
+    "GlowCard": {
+        "small": (("Glow",), {}),
+        "typical": ((P("Some content"), P("More content")), {"glow_color": "#ff00ff"}),
+        "pathological": (tuple(P(f"Paragraph {i}") for i in range(1000)), {}),
+    },
+    "PricingCard": {
+        "small": ((), {"title": "Free", "price": "$0"}),
+        "typical": (
+            (),
+            {"title": "Pro", "price": "$29", "features": [f"Feature {i}" for i in range(8)]},
+        ),
+        "pathological": (
+            (),
+            {"title": "Enterprise", "price": "$999", "features": [f"F {i}" for i in range(500)]},
+        ),
+    },
+    "ProfileCard": {
+        "small": ((), {"name": "Ada"}),
+        "typical": (
+            (),
+            {"name": "Ada Lovelace", "title": "Engineer", "avatar": "/a.png", "bio": "Notes."},
+        ),
+        "pathological": ((), {"name": "Ada Lovelace", "bio": _LONG_TEXT}),
+    },
+    "RevealCard": {
+        "small": ((), {"img_src": "/img.png", "title": "Title"}),
+        "typical": ((), {"img_src": "/img.png", "title": "Title", "description": "Caption text"}),
+        "pathological": ((), {"img_src": "/img.png", "title": "Title", "description": _LONG_TEXT}),
+    },
+    "StatCard": {
+        "small": ((), {"title": "Users", "value": "1,204"}),
+        "typical": ((), {"title": "Revenue", "value": "$12,400", "trend": "+4.2%", "icon": "📈"}),
+        "pathological": ((), {"title": _LONG_TEXT, "value": _LONG_TEXT, "trend": "-0.1%"}),
+    },
+    "TiltCard": {
+        "small": (("Tilt",), {}),
+        "typical": ((Div(P("Content"), cls="p-4"),), {}),
+        "pathological": (tuple(P(f"Paragraph {i}") for i in range(1000)), {}),
+    },
+    "TimelineCard": {
+        "small": ((), {"title": "Deployed"}),
+        "typical": (
+            (),
+            {"title": "Deployed", "description": "v1.2", "timestamp": "2m ago", "icon": "🚀"},
+        ),
+        "pathological": ((), {"title": "Deployed", "description": _LONG_TEXT}),
+    },
+    "DotsLoader": {"small": ((), {}), "typical": ((), {"variant": "primary"})},
+    "LazyFragment": {
+        "small": (("/panels/revenue",), {}),
+        "typical": (
+            ("/panels/revenue",),
+            {"skeleton": Div(P("Loading..."), cls="placeholder-glow")},
+        ),
+    },
+    "PolygonLoader": {"small": ((), {}), "typical": ((), {"id": "loader"})},
+    "ProgressRing": {
+        "small": ((), {"value": 40}),
+        "typical": ((), {"value": 72, "size": "120px", "variant": "success"}),
+    },
+    "PulseLoader": {"small": ((), {}), "typical": ((), {"variant": "info", "size": "48px"})},
+    "RingLoader": {"small": ((), {}), "typical": ((), {"variant": "info", "size": "48px"})},
+    "SkeletonLoader": {
+        "small": ((), {}),
+        "typical": ((), {"lines": 4, "avatar": True}),
+        "pathological": ((), {"lines": 1000, "avatar": True}),
+    },
+    "ShadowLoader": {"small": ((), {}), "typical": ((), {"text": "Fetching results"})},
+    "TypewriterLoader": {"small": ((), {}), "typical": ((), {"text": "Fetching results"})},
+    "WaveLoader": {"small": ((), {}), "typical": ((), {"variant": "primary"})},
+    "AnimatedInput": {
+        "small": ((), {"label": "Email", "name": "email"}),
+        "typical": (
+            (),
+            {"label": "Email", "name": "email", "input_type": "email", "required": True},
+        ),
+    },
+    "SearchBar": {
+        "small": ((), {}),
+        "typical": ((), {"placeholder": "Search docs", "action": "/docs/search"}),
+    },
+    "TagInput": {
+        "small": ((), {"name": "tags"}),
+        "typical": ((), {"name": "tags", "tags": ["python", "htmx", "fasthtml", "css"]}),
+        "pathological": ((), {"name": "tags", "tags": [f"tag-{i}" for i in range(500)]}),
+    },
+    "FloatingActionButton": {
+        "small": ((), {"icon": "plus"}),
+        "typical": ((), {"icon": "plus", "variant": "success", "position": "bottom-left"}),
+    },
+    "GradientButton": {
+        "small": ((), {"text": "Go"}),
+        "typical": ((), {"text": "Get started", "size": "lg", "href": "/start"}),
+    },
+    "IconButton": {
+        "small": ((), {"icon": "heart"}),
+        "typical": ((), {"icon": "heart", "text": "Like", "variant": "danger"}),
+    },
+    "MegaMenuItem": {
+        "small": ((), {"label": "Products", "content": "Menu"}),
+        "typical": (
+            (),
+            {"label": "Products", "content": Div(*[P(f"Product {i}") for i in range(12)])},
+        ),
+    },
+    "MegaMenuNavbar": {
+        "small": ((), {"brand": "Brand"}),
+        "typical": ((), {"brand": "Brand", "items": [P(f"Item {i}") for i in range(6)]}),
+    },
+    "MorphingToggler": {"small": ((), {"target_id": "nav"})},
+    "SlideMenuNavbar": {
+        "small": ((), {"items": [("Home", "/")]}),
+        "typical": ((), {"items": [(f"Page {i}", f"/{i}") for i in range(8)], "brand": "Brand"}),
+        "pathological": ((), {"items": [(f"Page {i}", f"/{i}") for i in range(1000)]}),
+    },
+    "SlideToggler": {"small": ((), {"target_id": "menu"})},
+    "VerticalMegaMenu": {
+        "small": ((), {"items": _menu((3,))}),
+        "typical": ((), {"items": _menu((6, 8))}),
+        # 10 x 10 x 50 = 5,110 nodes
+        "pathological": ((), {"items": _menu((10, 10, 50))}),
+    },
+    "ParallaxSection": {
+        "small": ((), {"img_src": "/bg.jpg"}),
+        "typical": ((Div(P("Hero copy"), cls="container"),), {"img_src": "/bg.jpg"}),
+    },
+    "ScrollReveal": {
+        "small": ((), {"content": "Reveal"}),
+        "typical": ((), {"content": Div(P("Content")), "direction": "left", "delay": "0.2s"}),
+        "pathological": ((), {"content": Div(*[P(f"Line {i}") for i in range(1000)])}),
+    },
+}
+
+
+def _measure(render: Callable[[], str], repeat: int) -> dict[str, float]:
+    html = render()
+    timer = timeit.Timer(render)
+    number, _ = timer.autorange()
+    best = min(timer.repeat(repeat=repeat, number=number)) / number
+
+    tracemalloc.start()
+    try:
+        render()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "ops_per_sec": 1 / best,
+        "alloc_peak_bytes": peak,
+        "html_bytes": len(html.encode("utf-8")),
+    }
+
+
+def run(only: set[str] | None, sizes: tuple[str, ...], repeat: int) -> dict[str, dict]:
+    results: dict[str, dict] = {}
+    for name in list_components():
+        if only and name not in only:
+            continue
+        cases = CASES.get(name)
+        if cases is None:
+            print(f"{name:<22} (no benchmark cases)")
+            continue
+        component = get_component(name)
+        for size in sizes:
+            if size not in cases:
+                continue
+            args, kwargs = cases[size]
+
+            def render(component=component, args=args, kwargs=kwargs) -> str:
+                return to_xml(component(*args, **kwargs))
+
+            result = results[f"{name}/{size}"] = _measure(render, repeat)
+            print(
+                f"{name + '/' + size:<34} {result['ops_per_sec']:>11,.0f} ops/s  "
+                f"{result['alloc_peak_bytes'] / 1024:>9.1f} KiB peak  "
+                f"{result['html_bytes']:>9,} B html"
+            )
+    return results
+
+
+def compare(results: dict[str, dict], baseline: dict[str, dict], threshold: float) -> int:
+    """Print changes against a baseline; return the number of regressions."""
+    regressions = 0
+    print(f"\nCompared with baseline (threshold {threshold:.0%}):")
+    for case, new in results.items():
+        old = baseline.get(case)
+        if old is None:
+            print(f"  {case:<34} new case")
+            continue
+        speed = new["ops_per_sec"] / old["ops_per_sec"] - 1
+        alloc = new["alloc_peak_bytes"] / max(old["alloc_peak_bytes"], 1) - 1
+        problems = []
+        if speed < -threshold:
+            problems.append(f"{speed:+.0%} ops/s")
+        if alloc > threshold:
+            problems.append(f"{alloc:+.0%} peak alloc")
+        if new["html_bytes"] != old["html_bytes"]:
+            problems.append(f"html {old['html_bytes']:,} -> {new['html_bytes']:,} B")
+        if problems:
+            regressions += 1
+            print(f"  {case:<34} REGRESSION: {', '.join(problems)}")
+    for case in baseline.keys() - results.keys():
+        print(f"  {case:<34} missing from this run")
+    if not regressions:
+        print("  no regressions")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--only", help="Comma-separated component names")
+    parser.add_argument("--sizes", default=",".join(SIZES), help="Comma-separated case sizes")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--save", metavar="PATH", help="Write the results as a JSON baseline")
+    parser.add_argument("--compare", metavar="PATH", help="Compare against a JSON baseline")
+    parser.add_argument(
+        "--threshold", type=float, default=0.10, help="Allowed slowdown / growth (default: 0.10)"
+    )
+    args = parser.parse_args()
+
+    only = set(args.only.split(",")) if args.only else None
+    sizes = tuple(s for s in args.sizes.split(",") if s)
+    results = run(only, sizes, args.repeat)
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            baseline = {
+                "python": platform.python_version(),
+                "machine": platform.machine(),
+                "results": results,
+            }
+            json.dump(baseline, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"\nSaved baseline to {args.save}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+        # Only compare the cases selected for this run
+        baseline = {
+            case: result
+            for case, result in baseline.items()
+            if (not only or case.split("/")[0] in only) and case.split("/")[1] in sizes
+        }
+        if compare(results, baseline, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
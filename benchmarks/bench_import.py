@@ -0,0 +1,60 @@
+"""Measure ``import faststrap_community`` with ``python -X importtime``.
+
+Each scenario runs in a fresh interpreter. Reported times are the median
+cumulative import time of ``faststrap_community`` and of everything imported.
+
+Usage:
+    python benchmarks/bench_import.py [--repeat 7]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+SCENARIOS = {
+    "import": "import faststrap_community",
+    "setup_community": "from faststrap_community import setup_community",
+    "one component": "from faststrap_community import StatCard",
+    "all exports": ("import faststrap_community as fc\nfor name in fc.__all__: getattr(fc, name)"),
+}
+
+
+def _importtime(code: str) -> tuple[int, int]:
+    """Return (package cumulative us, total us) for one run of ``code``."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    package = total = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        # Top-level imports are not indented; their cumulative times add up to the total
+        if not name.startswith("  "):
+            total += int(cumulative)
+        if name.strip() == "faststrap_community":
+            package = int(cumulative)
+    return package, total
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=7)
+    args = parser.parse_args()
+
+    for label, code in SCENARIOS.items():
+        runs = [_importtime(code) for _ in range(args.repeat)]
+        package = statistics.median(r[0] for r in runs)
+        total = statistics.median(r[1] for r in runs)
+        print(
+            f"{label:<16} faststrap_community={package / 1e3:7.1f} ms  "
+            f"all imports={total / 1e3:7.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+"""Load-test a FastHTML app in-process through an ASGI transport.
+
+Requests go through the whole stack (middleware, routing, rendering,
+serialization, static serving) without a server or network, so results show
+what a page built from community components costs a worker. Each route is
+driven by ``--concurrency`` concurrent clients until ``--requests`` responses
+have been received, and the harness reports requests/sec, p50/p95/p99
+latency and response sizes per route.
+
+Routes are paths, optionally prefixed with ``hx:`` to send them as HTMX
+fragment requests (``HX-Request: true``). By default the app's ``/`` is
+requested as a full page and as a fragment, and the community CSS bundle is
+fetched with ``Accept-Encoding: gzip``.
+
+Usage:
+    python benchmarks/bench_load.py [--app examples/showcase.py:app]
+        [--route / --route hx:/ ...] [--concurrency 16] [--requests 1000]
+        [--json results.json]
+"""
+
+import argparse
+import asyncio
+import importlib.util
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from faststrap_community.assets import get_css_bundle
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def load_app(spec: str) -> Any:
+    """Import ``path/to/module.py:attr`` (or ``package.module:attr``) and return the app."""
+    target, _, attr = spec.partition(":")
+    if target.endswith(".py"):
+        path = Path(target)
+        if not path.is_absolute():
+            path = ROOT / path
+        module_spec = importlib.util.spec_from_file_location(path.stem, path)
+        module = importlib.util.module_from_spec(module_spec)
+        sys.modules[path.stem] = module
+        module_spec.loader.exec_module(module)
+    else:
+        module = importlib.import_module(target)
+    return getattr(module, attr or "app")
+
+
+def default_routes() -> list[str]:
+    routes = ["/", "hx:/"]
+    bundle = get_css_bundle()
+    if bundle:
+        routes.append(f"/community-static/{bundle}")
+    return routes
+
+
+def _percentile(ordered: list[float], q: float) -> float:
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+async def drive(
+    client: httpx.AsyncClient, route: str, requests: int, concurrency: int
+) -> dict[str, Any]:
+    """Send ``requests`` requests to one route from ``concurrency`` clients."""
+    htmx = route.startswith("hx:")
+    path = route.removeprefix("hx:")
+    headers = {"Accept-Encoding": "gzip, br"}
+    if htmx:
+        headers["HX-Request"] = "true"
+
+    latencies: list[float] = []
+    sizes: list[int] = []
+    statuses: dict[int, int] = {}
+    remaining = requests
+
+    async def worker() -> None:
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            start = time.perf_counter()
+            response = await client.get(path, headers=headers)
+            latencies.append(time.perf_counter() - start)
+            # Bytes on the wire: the encoded body when compressed
+            sizes.append(int(response.headers.get("content-length", len(response.content))))
+            statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    ordered = sorted(latencies)
+    return {
+        "route": route,
+        "requests": len(latencies),
+        "concurrency": concurrency,
+        "rps": len(latencies) / elapsed,
+        "p50_ms": _percentile(ordered, 0.50) * 1e3,
+        "p95_ms": _percentile(ordered, 0.95) * 1e3,
+        "p99_ms": _percentile(ordered, 0.99) * 1e3,
+        "mean_bytes": statistics.fmean(sizes),
+        "statuses": statuses,
+    }
+
+
+async def run(app: Any, routes: list[str], requests: int, concurrency: int, warmup: int) -> list:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+        results = []
+        for route in routes:
+            if warmup:
+                await drive(client, route, warmup, min(warmup, concurrency))
+            result = await drive(client, route, requests, concurrency)
+            results.append(result)
+            statuses = ",".join(f"{code}x{n}" for code, n in sorted(result["statuses"].items()))
+            print(
+                f"{route:<48} {result['rps']:>9,.0f} req/s  "
+                f"p50={result['p50_ms']:7.2f} ms  p95={result['p95_ms']:7.2f} ms  "
+                f"p99={result['p99_ms']:7.2f} ms  {result['mean_bytes']:>9,.0f} B  [{statuses}]"
+            )
+        return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--app", default="examples/showcase.py:app", help="module:attr")
+    parser.add_argument("--route", action="append", help="Path to request, hx: for HTMX")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=1000, help="Requests per route")
+    parser.add_argument("--warmup", type=int, default=20, help="Unmeasured requests per route")
+    parser.add_argument("--json", metavar="PATH", help="Write the results as JSON")
+    args = parser.parse_args()
+
+    app = load_app(args.app)
+    routes = args.route or default_routes()
+    print(f"{args.app}: {args.requests} requests per route, concurrency {args.concurrency}")
+    results = asyncio.run(run(app, routes, args.requests, args.concurrency, args.warmup))
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+            f.write("\n")
+
+
+if __name__ == "__main__":
+    main()
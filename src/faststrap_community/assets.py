@@ -0,0 +1,228 @@
+"""CSS bundling, minification and fingerprinting for community static assets.
+
+The stylesheets under ``static/css/`` are concatenated in a fixed order,
+minified and written to a single ``css/community.<hash>.css`` bundle whose name
+changes whenever its content does. ``static/manifest.json`` maps the logical
+name ``css/community.css`` to the current bundle, so ``setup_community`` emits
+one ``<link>`` instead of five and the file can be cached forever.
+
+The bundle is built at release time with::
+
+    python -m faststrap_community.assets
+
+and ``python -m faststrap_community.assets --check`` (run in CI) fails when the
+committed bundle doesn't match the sources. At runtime the package directory
+is only read: a missing or stale bundle is reported with a warning and the
+separate stylesheets are linked instead.
+"""
+
+import argparse
+import hashlib
+import json
+import re
+import sys
+import threading
+import warnings
+from pathlib import Path
+from typing import Any
+
+from fasthtml.common import Link
+
+STATIC_DIR = Path(__file__).parent / "static"
+
+# Source stylesheets, in cascade order
+CSS_SOURCES: tuple[str, ...] = (
+    "css/community-base.css",
+    "css/cards.css",
+    "css/loaders.css",
+    "css/navbars.css",
+    "css/effects.css",
+)
+
+CSS_BUNDLE = "css/community.css"
+MANIFEST_FILE = "manifest.json"
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+# Fingerprinted file names: name.<10+ hex chars>.ext
+_FINGERPRINT_RE = re.compile(r"\.[0-9a-f]{10,}\.[a-z0-9]+$")
+
+_STRING_OR_COMMENT_RE = re.compile(r"(\"(?:\\.|[^\"\\])*\"|'(?:\\.|[^'\\])*')|/\*.*?\*/", re.DOTALL)
+_SPACE_RE = re.compile(r"\s+")
+_PUNCT_RE = re.compile(r"\s*([{};,>])\s*")
+_COLON_RE = re.compile(r":\s+")
+
+_BUNDLES: dict[Path, str | None] = {}
+_BUNDLES_LOCK = threading.Lock()
+
+
+def minify_css(css: str) -> str:
+    """Minify a stylesheet: drop comments and redundant whitespace.
+
+    String literals are preserved verbatim. Whitespace around parentheses and
+    operators is kept, since it is significant in media queries and ``calc()``.
+
+    Args:
+        css: Stylesheet source
+
+    Returns:
+        Minified stylesheet
+    """
+    strings: list[str] = []
+
+    def stash(match: re.Match) -> str:
+        if match.group(1) is None:
+            return " "
+        strings.append(match.group(1))
+        return f"\x00{len(strings) - 1}\x00"
+
+    css = _STRING_OR_COMMENT_RE.sub(stash, css)
+    css = _SPACE_RE.sub(" ", css)
+    css = _PUNCT_RE.sub(r"\1", css)
+    css = _COLON_RE.sub(":", css)
+    css = css.replace(";}", "}").strip()
+    return re.sub("\x00(\\d+)\x00", lambda m: strings[int(m.group(1))], css)
+
+
+def is_fingerprinted(name: str) -> bool:
+    """Whether a file name carries a content hash (``name.<hash>.ext``)."""
+    return bool(_FINGERPRINT_RE.search(name))
+
+
+def _sources_digest(static_dir: Path) -> str:
+    """Hash the source stylesheets, to detect a stale bundle."""
+    digest = hashlib.sha256()
+    for name in CSS_SOURCES:
+        digest.update(name.encode())
+        digest.update((static_dir / name).read_bytes())
+    return digest.hexdigest()
+
+
+def load_manifest(static_dir: Path = STATIC_DIR) -> dict[str, Any]:
+    """Read the asset manifest, or return an empty dict if it doesn't exist."""
+    try:
+        return json.loads((static_dir / MANIFEST_FILE).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def build_css_bundle(static_dir: Path = STATIC_DIR) -> dict[str, Any]:
+    """Concatenate, minify and fingerprint the community stylesheets.
+
+    Writes ``css/community.<hash>.css`` and ``manifest.json`` into
+    ``static_dir`` and removes bundles from previous builds.
+
+    Args:
+        static_dir: Static directory containing ``css/`` (default: package static dir)
+
+    Returns:
+        The manifest that was written
+    """
+    parts = []
+    for name in CSS_SOURCES:
+        css = minify_css((static_dir / name).read_text(encoding="utf-8"))
+        parts.append(f"/* {Path(name).name} */\n{css}\n")
+    bundle = "".join(parts).encode("utf-8")
+
+    fingerprint = hashlib.sha256(bundle).hexdigest()[:10]
+    stem, ext = CSS_BUNDLE.rsplit(".", 1)
+    bundle_name = f"{stem}.{fingerprint}.{ext}"
+
+    css_dir = static_dir / Path(CSS_BUNDLE).parent
+    for old in css_dir.glob(f"{Path(stem).name}.*.{ext}"):
+        if _FINGERPRINT_RE.search(old.name) and old.name != Path(bundle_name).name:
+            old.unlink()
+    (static_dir / bundle_name).write_bytes(bundle)
+
+    manifest = load_manifest(static_dir)
+    manifest[CSS_BUNDLE] = {
+        "file": bundle_name,
+        "sources": list(CSS_SOURCES),
+        "source_hash": _sources_digest(static_dir),
+    }
+    (static_dir / MANIFEST_FILE).write_text(
+        json.dumps(manifest, indent=2, sort_keys=True) + "\n", encoding="utf-8"
+    )
+    return manifest
+
+
+def get_css_bundle(static_dir: Path = STATIC_DIR) -> str | None:
+    """Return the bundle path relative to the static dir (e.g. ``css/community.<hash>.css``).
+
+    The manifest is checked once per process and nothing is written. Returns
+    None (with a warning) if the bundle is missing or doesn't match the
+    sources, in which case callers fall back to the separate stylesheets.
+    """
+    with _BUNDLES_LOCK:
+        if static_dir in _BUNDLES:
+            return _BUNDLES[static_dir]
+
+        bundle = _current_bundle(static_dir)
+        if bundle is None:
+            warnings.warn(
+                f"The community CSS bundle in {static_dir} is missing or stale; linking the "
+                "separate stylesheets. Rebuild it with `python -m faststrap_community.assets`.",
+                RuntimeWarning,
+                stacklevel=2,
+            )
+
+        _BUNDLES[static_dir] = bundle
+        return bundle
+
+
+def _current_bundle(static_dir: Path) -> str | None:
+    """Return the manifest's bundle if it exists and matches the sources."""
+    entry = load_manifest(static_dir).get(CSS_BUNDLE, {})
+    bundle = entry.get("file")
+    if (
+        bundle is not None
+        and (static_dir / bundle).is_file()
+        and entry.get("source_hash") == _sources_digest(static_dir)
+    ):
+        return bundle
+    return None
+
+
+def clear_bundle_cache() -> None:
+    """Forget resolved bundle paths so the manifest is read again."""
+    with _BUNDLES_LOCK:
+        _BUNDLES.clear()
+
+
+def get_community_assets(static_url: str = "/community-static", bundle: bool = True) -> list[Link]:
+    """Get Link elements for community CSS files.
+
+    Args:
+        static_url: URL prefix for community static files
+        bundle: Link the single minified, fingerprinted bundle (default). Pass
+            False to link the separate source stylesheets, e.g. while debugging.
+    """
+    base = static_url.rstrip("/")
+    bundle_file = get_css_bundle() if bundle else None
+    if bundle_file:
+        return [Link(rel="stylesheet", href=f"{base}/{bundle_file}")]
+    return [Link(rel="stylesheet", href=f"{base}/{name}") for name in CSS_SOURCES]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Build the community CSS bundle.")
+    parser.add_argument(
+        "--check", action="store_true", help="only verify the bundle matches the sources"
+    )
+    args = parser.parse_args(argv)
+
+    if args.check:
+        bundle = _current_bundle(STATIC_DIR)
+        if bundle is None:
+            print("CSS bundle is stale: run `python -m faststrap_community.assets`")
+            return 1
+        print(f"{STATIC_DIR / bundle} is up to date")
+        return 0
+
+    result = build_css_bundle()
+    print(f"Wrote {STATIC_DIR / result[CSS_BUNDLE]['file']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,208 @@
+"""Batch rendering for list-heavy community components.
+
+Activity feeds and metric walls render the same component thousands of times
+with different text. ``render_many`` hoists the per-call work out of the loop:
+each distinct row *shape* (which optional fields are present, variant,
+classes, ...) is rendered once with placeholder slots, and every row is then
+produced by joining its escaped values into that precompiled template. The
+output is identical to calling the component and ``to_xml`` once per row.
+"""
+
+import inspect
+import re
+import threading
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from html import escape
+from typing import Any
+
+from fasthtml.common import NotStr, to_xml
+
+from . import defaults as _defaults
+from .registry import get_component
+
+# Arguments that only ever end up as text or attribute values, never in logic
+# beyond a truthiness check. Only these (plus pass-through **kwargs) are
+# substituted into templates; everything else is part of the row shape.
+_BATCH_SLOTS: dict[str, tuple[str, ...]] = {
+    "StatCard": ("title", "value", "trend", "icon", "variant"),
+    "TimelineCard": ("title", "description", "timestamp", "icon", "variant"),
+    "PricingCard": ("title", "price", "period", "features", "cta_text", "cta_href"),
+    "ProfileCard": ("name", "title", "avatar", "bio"),
+}
+
+# Pass-through attributes that components transform rather than copy verbatim
+_SHAPE_KWARGS = frozenset({"cls", "style"})
+
+_TEMPLATE_MAXSIZE = 256
+_TEMPLATES: dict[tuple, tuple[list[str], list[int], frozenset[int]]] = {}
+_TEMPLATES_LOCK = threading.Lock()
+
+_SLOT_RE = re.compile("\x02(\\d+)\x03")
+
+
+def register_batch_slots(component: str, *fields: str) -> None:
+    """Declare which arguments of a component can be batch-substituted.
+
+    Only declare arguments the component copies into its output as text or
+    attribute values (optionally behind an ``if value:`` check). Arguments that
+    select classes from a table, drive loops or are validated must stay out.
+
+    Args:
+        component: Registered component name
+        *fields: Argument names; sequence arguments (e.g. ``features``) are
+            substituted item by item
+    """
+    _BATCH_SLOTS[component] = fields
+
+
+def _iter_rows(rows: Iterable[Mapping[str, Any]] | Mapping[str, Any]) -> Iterator[Mapping]:
+    """Yield row mappings from row-oriented or columnar (dict of lists) input."""
+    if isinstance(rows, Mapping):
+        names = list(rows.keys())
+        for values in zip(*(rows[n] for n in names), strict=True):
+            yield dict(zip(names, values, strict=True))
+    else:
+        yield from rows
+
+
+def _is_text(value: Any) -> bool:
+    """Whether a value renders as plain escaped text (Safe/NotStr strings don't)."""
+    if hasattr(value, "__html__"):
+        return False
+    return isinstance(value, str) or (
+        isinstance(value, (int, float)) and not isinstance(value, bool)
+    )
+
+
+def _build_template(fn: Callable, call: dict[str, Any]) -> tuple[list[str], list[int], frozenset]:
+    """Render a shape once and split it into literal chunks and slot indexes."""
+    html = to_xml(fn(**call))
+    parts = _SLOT_RE.split(html)
+    literals = parts[0::2]
+    slots = [int(i) for i in parts[1::2]]
+
+    # Slots inside a tag are attribute values: quotes there change how
+    # to_xml quotes the attribute, so such rows fall back to a full render.
+    attr_slots = set()
+    in_tag = False
+    for literal, slot in zip(literals, slots, strict=False):
+        lt, gt = literal.rfind("<"), literal.rfind(">")
+        if lt != gt:
+            in_tag = lt > gt
+        if in_tag:
+            attr_slots.add(slot)
+
+    return literals, slots, frozenset(attr_slots)
+
+
+def iter_many(
+    component: Callable | str,
+    rows: Iterable[Mapping[str, Any]] | Mapping[str, Any],
+    **common: Any,
+) -> Iterator[str]:
+    """Render a component once per row, yielding each row's HTML.
+
+    Args:
+        component: Component function or registered component name
+        rows: Iterable of keyword-argument mappings, or columnar input as a
+            mapping of argument name to equal-length sequences
+        **common: Keyword arguments shared by every row (rows override them)
+
+    Yields:
+        HTML string for each row, identical to ``to_xml(component(**row))``
+    """
+    fn = get_component(component) if isinstance(component, str) else component
+    if fn is None:
+        raise KeyError(f"Unknown community component: {component!r}")
+
+    name = fn.__name__
+    slot_fields = _BATCH_SLOTS.get(name)
+    if slot_fields is None:
+        for row in _iter_rows(rows):
+            yield to_xml(fn(**{**common, **row}))
+        return
+
+    # Invariant work, done once per batch instead of once per row
+    params = inspect.signature(fn).parameters
+    accepts_kwargs = any(p.kind is inspect.Parameter.VAR_KEYWORD for p in params.values())
+    defaults_key = tuple(sorted(_defaults.resolve_community_defaults(name).items()))
+    version = _defaults.get_defaults_version()
+
+    for row in _iter_rows(rows):
+        call = {**common, **row}
+        shape = []
+        values: list[Any] = []
+        template_call: dict[str, Any] = {}
+        for key, value in call.items():
+            slotted = (key in slot_fields) or (
+                accepts_kwargs and key not in params and key not in _SHAPE_KWARGS
+            )
+            if slotted and value and _is_text(value):
+                template_call[key] = f"\x02{len(values)}\x03"
+                values.append(value)
+                shape.append((key, str))
+            elif (
+                slotted
+                and value
+                and isinstance(value, (list, tuple))
+                and all(_is_text(v) for v in value)
+            ):
+                template_call[key] = [f"\x02{len(values) + i}\x03" for i in range(len(value))]
+                values.extend(value)
+                shape.append((key, list, len(value)))
+            else:
+                template_call[key] = value
+                shape.append((key, value))
+
+        try:
+            key = (fn, version, defaults_key, tuple(shape))
+            hash(key)
+        except TypeError:
+            yield to_xml(fn(**call))
+            continue
+
+        template = _TEMPLATES.get(key)
+        if template is None:
+            template = _build_template(fn, template_call)
+            with _TEMPLATES_LOCK:
+                if len(_TEMPLATES) >= _TEMPLATE_MAXSIZE:
+                    _TEMPLATES.clear()
+                _TEMPLATES[key] = template
+
+        literals, slots, attr_slots = template
+        texts = [escape(str(v), quote=False) for v in values]
+        if any(('"' in texts[i] or "'" in texts[i]) for i in attr_slots):
+            yield to_xml(fn(**call))
+            continue
+
+        out = [literals[0]]
+        for slot, literal in zip(slots, literals[1:], strict=True):
+            out.append(texts[slot])
+            out.append(literal)
+        yield "".join(out)
+
+
+def render_many(
+    component: Callable | str,
+    rows: Iterable[Mapping[str, Any]] | Mapping[str, Any],
+    **common: Any,
+) -> NotStr:
+    """Render a component for many rows and return the concatenated HTML.
+
+    Example:
+        >>> from faststrap_community import TimelineCard, render_many
+        >>> render_many(TimelineCard, [
+        ...     {"title": "Deployed", "timestamp": "2 hours ago", "icon": "🚀"},
+        ...     {"title": "Reviewed", "timestamp": "3 hours ago", "icon": "👀"},
+        ... ], variant="success")
+        >>>
+        >>> # Columnar input works too
+        >>> render_many(StatCard, {"title": ["Users", "Orders"], "value": ["1,204", "87"]})
+    """
+    return NotStr("".join(iter_many(component, rows, **common)))
+
+
+def clear_batch_templates() -> None:
+    """Drop all precompiled batch templates."""
+    with _TEMPLATES_LOCK:
+        _TEMPLATES.clear()
@@ -4,7 +4,7 @@ from fasthtml.common import Button as HtmlButton
 from fasthtml.common import Span
 from faststrap.core.base import merge_classes
 
-from ..defaults import get_community_defaults
+from ..defaults import resolve_community_defaults
 from ..registry import register_component
 
 
@@ -22,7 +22,7 @@ def FloatingActionButton(
     Example:
         >>> FloatingActionButton("➕", variant="success", position="bottom-right")
     """
-    defaults = get_community_defaults("FloatingActionButton")
+    defaults = resolve_community_defaults("FloatingActionButton")
     v = variant or defaults.get("variant", "primary")
     pos = position or defaults.get("position", "bottom-right")
 
@@ -3,7 +3,7 @@
 from fasthtml.common import Button as HtmlButton
 from faststrap.core.base import merge_classes
 
-from ..defaults import get_community_defaults
+from ..defaults import resolve_community_defaults
 from ..registry import register_component
 
 
@@ -19,7 +19,7 @@ def GradientButton(text: str, gradient: str = None, size: str = None, **kwargs)
     Example:
         >>> GradientButton("Get Started", gradient="purple", size="lg")
     """
-    defaults = get_community_defaults("GradientButton")
+    defaults = resolve_community_defaults("GradientButton")
     grad = gradient or defaults.get("gradient", "purple")
 
     # Gradient presets
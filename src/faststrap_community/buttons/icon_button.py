@@ -4,7 +4,7 @@ from fasthtml.common import Button as HtmlButton
 from fasthtml.common import Span
 from faststrap.core.base import merge_classes
 
-from ..defaults import get_community_defaults
+from ..defaults import resolve_community_defaults
 from ..registry import register_component
 
 
@@ -30,7 +30,7 @@ def IconButton(
         >>> IconButton("🚀", "Launch", variant="primary")
         >>> IconButton("⚙️", variant="secondary")  # Icon only
     """
-    defaults = get_community_defaults("IconButton")
+    defaults = resolve_community_defaults("IconButton")
     v = variant or defaults.get("variant", "primary")
 
     user_cls = kwargs.pop("cls", "")
@@ -4,8 +4,8 @@ from typing import Any
 
 from fasthtml.common import Div
 from faststrap.core.base import merge_classes
-from faststrap.core.theme import resolve_defaults
 
+from ..defaults import resolve_community_defaults
 from ..registry import register_component
 
 
@@ -22,13 +22,13 @@ def FlipCard(
         duration: Duration of the flip animation (default: 0.6s)
         **kwargs: Additional attributes like cls, style, click handlers
     """
-    # Resolve global defaults (if set via set_component_defaults("FlipCard", ...))
-    cfg = resolve_defaults("FlipCard", height=height, width=width, duration=duration)
+    # Resolve global defaults (core set_component_defaults or set_community_defaults)
+    defaults = resolve_community_defaults("FlipCard")
 
-    # Extract resolved values or use hardcoded fallbacks
-    h = cfg.get("height") or "300px"
-    w = cfg.get("width") or "100%"
-    d = cfg.get("duration") or "0.6s"
+    # Explicit arguments win, then defaults, then hardcoded fallbacks
+    h = height or defaults.get("height") or "300px"
+    w = width or defaults.get("width") or "100%"
+    d = duration or defaults.get("duration") or "0.6s"
 
     # Extract user-provided style and class
     user_cls = kwargs.pop("cls", "")
@@ -60,4 +60,4 @@ def FlipCard(
 
 
 # Register with community registry
-register_component("FlipCard", FlipCard)
+register_component("FlipCard", FlipCard, css_classes=("fs-comm-flip-card",))
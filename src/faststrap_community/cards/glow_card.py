@@ -5,7 +5,7 @@ from typing import Any
 from fasthtml.common import Div
 from faststrap.core.base import merge_classes
 
-from ..defaults import get_community_defaults
+from ..defaults import resolve_community_defaults
 from ..registry import register_component
 
 
@@ -26,7 +26,7 @@ def GlowCard(*children: Any, glow_color: str = None, intensity: str = None, **kw
         ...     intensity="high"
         ... )
     """
-    defaults = get_community_defaults("GlowCard")
+    defaults = resolve_community_defaults("GlowCard")
     color = glow_color or defaults.get("glow_color", "var(--bs-primary)")
     level = intensity or defaults.get("intensity", "medium")
 
@@ -40,4 +40,4 @@ def GlowCard(*children: Any, glow_color: str = None, intensity: str = None, **kw
     return Div(*children, cls=container_cls, style=style, **kwargs)
 
 
-register_component("GlowCard", GlowCard)
+register_component("GlowCard", GlowCard, css_classes=("fs-comm-glow-card",))
@@ -3,7 +3,6 @@
 from fasthtml.common import H2, H3, Div, Li, Span, Ul
 from faststrap.core.base import merge_classes
 
-from ..defaults import get_community_defaults
 from ..registry import register_component
 
 
@@ -47,8 +46,6 @@ def PricingCard(
     """
     from faststrap import Button
 
-    get_community_defaults("PricingCard")
-
     user_cls = kwargs.pop("cls", "")
     container_cls = merge_classes(
         "fs-comm-pricing-card", "card", "h-100", "border-primary" if highlighted else "", user_cls
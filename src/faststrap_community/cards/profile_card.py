@@ -2,12 +2,20 @@
 
 from typing import Any
 
-from fasthtml.common import H5, Div, Img, P
+from fasthtml.common import H5, Div, P
 from faststrap.core.base import merge_classes
 
-from ..defaults import get_community_defaults
+from ..images import responsive_img
 from ..registry import register_component
 
+# Neutral silhouette shown when no avatar is given (inline, so no third-party request)
+DEFAULT_AVATAR = (
+    "data:image/svg+xml,%3Csvg xmlns='http://www.w3.org/2000/svg' viewBox='0 0 100 100'%3E"
+    "%3Crect width='100' height='100' fill='%23dee2e6'/%3E"
+    "%3Ccircle cx='50' cy='38' r='18' fill='%23adb5bd'/%3E"
+    "%3Cpath d='M16 92c4-20 18-30 34-30s30 10 34 30z' fill='%23adb5bd'/%3E%3C/svg%3E"
+)
+
 
 def ProfileCard(
     name: str, title: str = None, avatar: str = None, bio: str = None, *actions: Any, **kwargs
@@ -17,7 +25,8 @@ def ProfileCard(
     Args:
         name: User's name (required)
         title: User's title/role
-        avatar: Avatar image URL (uses placeholder if not provided)
+        avatar: Avatar image URL (a neutral silhouette if not provided); local
+            images are resized by the image pipeline when one is configured
         bio: Short bio text
         *actions: Action buttons or links
         **kwargs: Additional HTML attributes
@@ -33,16 +42,17 @@ def ProfileCard(
         ...     Button("Message", variant="outline-primary", size="sm")
         ... )
     """
-    get_community_defaults("ProfileCard")
 
     user_cls = kwargs.pop("cls", "")
     container_cls = merge_classes("fs-comm-profile-card", "card", "text-center", user_cls)
 
     # Avatar
-    avatar_url = avatar or "https://via.placeholder.com/150"
-    avatar_el = Img(
-        src=avatar_url,
+    avatar_el = responsive_img(
+        avatar or DEFAULT_AVATAR,
         alt=name,
+        sizes="100px",
+        width=100,
+        height=100,
         cls="rounded-circle mb-3",
         style="width: 100px; height: 100px; object-fit: cover;",
     )
@@ -2,10 +2,11 @@
 
 from typing import Any
 
-from fasthtml.common import H4, Div, Img, P
+from fasthtml.common import H4, Div, P
 from faststrap.core.base import merge_classes
-from faststrap.core.theme import resolve_defaults
 
+from ..defaults import resolve_community_defaults
+from ..images import responsive_img
 from ..registry import register_component
 
 
@@ -15,6 +16,7 @@ def RevealCard(
     description: str = "",
     button: Any = None,
     height: str = None,
+    sizes: str = "(min-width: 576px) 50vw, 100vw",
     **kwargs,
 ) -> Div:
     """A card that reveals content on hover.
@@ -25,10 +27,12 @@ def RevealCard(
         description: Description text for the overlay
         button: Optional action button/link
         height: Height of the card (default: 300px)
+        sizes: Rendered image width, used to pick a resized candidate when an
+            image pipeline is configured
         **kwargs: Additional attributes like cls, style
     """
-    cfg = resolve_defaults("RevealCard", height=height)
-    h = cfg.get("height") or "300px"
+    defaults = resolve_community_defaults("RevealCard")
+    h = height or defaults.get("height") or "300px"
 
     user_cls = kwargs.pop("cls", "")
     user_style = kwargs.pop("style", "")
@@ -43,9 +47,13 @@ def RevealCard(
         overlay_content.append(button)
 
     overlay = Div(*overlay_content, cls="fs-comm-reveal-overlay")
-    image = Img(src=img_src, cls="fs-comm-reveal-image", alt=title)
+    image = responsive_img(img_src, alt=title, sizes=sizes, cls="fs-comm-reveal-image")
 
     return Div(image, overlay, cls=container_cls, style=final_style, **kwargs)
 
 
-register_component("RevealCard", RevealCard)
+register_component(
+    "RevealCard",
+    RevealCard,
+    css_classes=("fs-comm-reveal-card", "fs-comm-reveal-image", "fs-comm-reveal-overlay"),
+)
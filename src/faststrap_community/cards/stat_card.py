@@ -3,7 +3,7 @@
 from fasthtml.common import H2, H6, Div, Span
 from faststrap.core.base import merge_classes
 
-from ..defaults import get_community_defaults
+from ..defaults import resolve_community_defaults
 from ..registry import register_component
 
 
@@ -37,7 +37,7 @@ def StatCard(
         ...     variant="success"
         ... )
     """
-    defaults = get_community_defaults("StatCard")
+    defaults = resolve_community_defaults("StatCard")
     v = variant or defaults.get("variant", "primary")
 
     user_cls = kwargs.pop("cls", "")
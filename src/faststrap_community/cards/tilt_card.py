@@ -4,7 +4,6 @@ from typing import Any
 
 from fasthtml.common import Div
 from faststrap.core.base import merge_classes
-from faststrap.core.theme import resolve_defaults
 
 from ..registry import register_component
 
@@ -16,12 +15,10 @@ def TiltCard(*content: Any, **kwargs) -> Div:
         *content: Content to place inside the card
         **kwargs: Additional attributes like cls, style
     """
-    resolve_defaults("TiltCard", **kwargs)
-
     user_cls = kwargs.pop("cls", "")
     container_cls = merge_classes("fs-comm-tilt-card card", user_cls)
 
     return Div(*content, cls=container_cls, **kwargs)
 
 
-register_component("TiltCard", TiltCard)
+register_component("TiltCard", TiltCard, css_classes=("fs-comm-tilt-card",))
@@ -3,7 +3,7 @@
 from fasthtml.common import H5, Div, P, Small, Span
 from faststrap.core.base import merge_classes
 
-from ..defaults import get_community_defaults
+from ..defaults import resolve_community_defaults
 from ..registry import register_component
 
 
@@ -34,7 +34,7 @@ def TimelineCard(
         ...     variant="success"
         ... )
     """
-    defaults = get_community_defaults("TimelineCard")
+    defaults = resolve_community_defaults("TimelineCard")
     v = variant or defaults.get("variant", "primary")
 
     user_cls = kwargs.pop("cls", "")
@@ -0,0 +1,311 @@
+"""Critical CSS inlining for community components.
+
+With ``setup_community(app, inline_critical=True)`` full-page HTML responses get
+a ``<style>`` block holding just the rules of the community components they
+contain, and the community stylesheet link becomes a non-blocking preload that
+is swapped in once it has loaded. The first paint then needs no stylesheet
+round trip.
+
+The per-component rules are parsed once at startup (see ``css_partitions``),
+and the CSS for each combination of components is built once and cached, so a
+request only pays for scanning its own HTML for class names.
+
+Streamed pages are not buffered. The ``<style>`` in the head covers the
+components of the chunk that closes it; each later chunk is scanned as it
+passes, and the rules of components not covered yet are sent in another
+``<style>`` before the first element using them. Text inside ``<script>``,
+``<style>``, ``<template>``, ``<textarea>`` and comments is not scanned, and
+the ``<style>`` goes before the enclosing table, list or select rather than
+inside it, where it would be moved out or dropped.
+"""
+
+import re
+from collections.abc import Iterable
+
+from fasthtml.common import Link, Noscript
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .css_partitions import build_css_subset, component_css, components_in_html, load_css_rules
+from .registry import find_component_by_class
+
+CRITICAL_STYLE_ATTR = "data-fs-comm-critical"
+
+# Bytes of a streamed page buffered while waiting for ``</head>``
+_HEAD_BUFFER_LIMIT = 64 * 1024
+
+_CLASS_ATTR_RE = re.compile(rb"""\sclass=(?:"([^"]*)"|'([^']*)')""")
+
+# A comment opener or a start/end tag (streamed chunks never end inside a tag)
+_TOKEN_RE = re.compile(rb"<!--|<(/?)([A-Za-z][\w:-]*)([^>]*)>")
+
+# Elements whose content isn't markup to style
+_RAW_TAGS = frozenset({b"script", b"style", b"template", b"textarea", b"title"})
+
+# Parents where a <style> child is foster-parented, invalid or dropped
+_NO_STYLE_PARENTS = frozenset(
+    {
+        b"table",
+        b"thead",
+        b"tbody",
+        b"tfoot",
+        b"tr",
+        b"colgroup",
+        b"ul",
+        b"ol",
+        b"menu",
+        b"dl",
+        b"select",
+        b"optgroup",
+        b"datalist",
+    }
+)
+
+_VOID_TAGS = frozenset(
+    {
+        b"area",
+        b"base",
+        b"br",
+        b"col",
+        b"embed",
+        b"hr",
+        b"img",
+        b"input",
+        b"link",
+        b"meta",
+        b"source",
+        b"track",
+        b"wbr",
+    }
+)
+
+
+def critical_css(components: Iterable[str]) -> str:
+    """Return the CSS to inline for a set of components (base rules included)."""
+    return build_css_subset(components)[1].decode("utf-8")
+
+
+def precompute_critical_css() -> None:
+    """Parse and partition the community stylesheets ahead of the first request."""
+    load_css_rules()
+
+
+def AsyncStylesheet(href: str) -> tuple:
+    """Non-render-blocking stylesheet: preload it and apply it once loaded.
+
+    A ``<noscript>`` fallback keeps the stylesheet for clients without JavaScript.
+    """
+    return (
+        Link(
+            rel="preload",
+            href=href,
+            onload="this.onload=null;this.rel='stylesheet'",
+            **{"as": "style"},
+        ),
+        Noscript(Link(rel="stylesheet", href=href)),
+    )
+
+
+def inject_critical_css(html: bytes) -> bytes:
+    """Insert a ``<style>`` with the critical CSS for ``html`` before ``</head>``.
+
+    Returns the HTML unchanged if it has no ``</head>`` or already has critical CSS.
+    """
+    return _inject_head(html)[0]
+
+
+def _inject_head(html: bytes) -> tuple[bytes, set[str] | None]:
+    """Inject the head ``<style>``; also return the components it covers (None if skipped)."""
+    head_end = html.find(b"</head>")
+    if head_end == -1 or CRITICAL_STYLE_ATTR.encode() in html[:head_end]:
+        return html, None
+
+    components = components_in_html(html[head_end:].decode("utf-8", errors="replace"))
+    style = f"<style {CRITICAL_STYLE_ATTR}>{critical_css(components)}</style>".encode()
+    return html[:head_end] + style + html[head_end:], components
+
+
+class _LateStyles:
+    """Track a streamed page's open elements and style components it introduces late.
+
+    Args:
+        covered: Components whose rules were already sent (updated as chunks pass)
+    """
+
+    def __init__(self, covered: set[str]):
+        self.covered = covered
+        self.stack: list[bytes] = []
+        # End marker of the raw text or comment the stream is in, if any
+        self.raw: re.Pattern[bytes] | None = None
+        # Components found where no <style> could go yet
+        self.owed: set[str] = set()
+
+    def _owners(self, attrs: bytes) -> set[str]:
+        found = set()
+        for match in _CLASS_ATTR_RE.finditer(attrs):
+            for name in (match.group(1) or match.group(2)).split():
+                owner = find_component_by_class(name.decode("ascii", errors="replace"))
+                if owner is not None and owner not in self.covered:
+                    found.add(owner)
+        return found
+
+    def feed(self, html: bytes, last: bool = False) -> bytes:
+        """Return ``html`` with a ``<style>`` before the first use of each new component.
+
+        ``html`` must not end inside a tag. The style goes at the last point
+        before the element where a ``<style>`` is valid; if that point was in
+        an earlier chunk, at the next valid point (the end of the page at the
+        latest).
+        """
+        inserts: dict[int, set[str]] = {}
+        safe = -1
+        pos = 0
+        while pos < len(html):
+            if self.raw is not None:
+                end = self.raw.search(html, pos)
+                if end is None:
+                    break
+                self.raw = None
+                pos = end.end()
+                continue
+            token = _TOKEN_RE.search(html, pos)
+            if token is None:
+                break
+            at = token.start()
+            if not self.stack or self.stack[-1] not in _NO_STYLE_PARENTS:
+                safe = at
+                if self.owed:
+                    inserts.setdefault(at, set()).update(self.owed)
+                    self.owed.clear()
+            pos = token.end()
+            if token.group(0) == b"<!--":
+                self.raw = re.compile(rb"-->")
+                continue
+
+            closing, name, attrs = token.group(1), token.group(2).lower(), token.group(3)
+            if closing:
+                if name in self.stack:
+                    del self.stack[len(self.stack) - 1 - self.stack[::-1].index(name) :]
+                continue
+            found = self._owners(attrs)
+            if found:
+                self.covered.update(found)
+                if safe >= 0:
+                    inserts.setdefault(safe, set()).update(found)
+                else:
+                    self.owed.update(found)
+            if name in _RAW_TAGS:
+                self.raw = re.compile(rb"</" + re.escape(name) + rb"\s*>", re.IGNORECASE)
+            elif name not in _VOID_TAGS and not attrs.endswith(b"/"):
+                self.stack.append(name)
+
+        if last and self.owed:
+            inserts.setdefault(len(html), set()).update(self.owed)
+            self.owed.clear()
+        if not inserts:
+            return html
+
+        done = self.covered - set().union(*inserts.values())
+        out = []
+        start = 0
+        for at in sorted(inserts):
+            css = component_css(inserts[at], done)
+            done.update(inserts[at])
+            out.append(html[start:at])
+            if css:
+                out.append(f"<style {CRITICAL_STYLE_ATTR}>{css}</style>".encode())
+            start = at
+        out.append(html[start:])
+        return b"".join(out)
+
+
+def _split_partial_tag(html: bytes) -> tuple[bytes, bytes]:
+    """Split a streamed chunk before a tag it doesn't finish."""
+    tag_start = html.rfind(b"<")
+    if tag_start != -1 and html.find(b">", tag_start) == -1:
+        return html[:tag_start], html[tag_start:]
+    return html, b""
+
+
+class CriticalCSSMiddleware:
+    """ASGI middleware inlining critical community CSS into full HTML pages.
+
+    HTMX requests are passed through untouched: they swap fragments into a page
+    whose stylesheet has already loaded. Streaming responses are held only
+    until ``</head>`` has arrived (at most 64 KiB); components in later chunks
+    get their rules inline before they appear.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or Headers(scope=scope).get("hx-request"):
+            await self.app(scope, receive, send)
+            return
+
+        start: Message | None = None
+        passthrough = False
+        # Streamed pages: late component styles, and a trailing partial tag held back
+        late: _LateStyles | None = None
+        pending = b""
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start, passthrough, late, pending
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message["headers"])
+                passthrough = (
+                    not headers.get("content-type", "").startswith("text/html")
+                    or "content-encoding" in headers
+                )
+                if passthrough:
+                    await send(message)
+                else:
+                    start = message
+                return
+
+            if late is not None and message["type"] == "http.response.body":
+                body = pending + message.get("body", b"")
+                more_body = message.get("more_body", False)
+                if more_body:
+                    body, pending = _split_partial_tag(body)
+                else:
+                    pending = b""
+                await send({**message, "body": late.feed(body, last=not more_body)})
+                return
+
+            if passthrough or start is None or message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            body = pending + message.get("body", b"")
+            more_body = message.get("more_body", False)
+            headers = MutableHeaders(raw=start["headers"])
+            if (
+                more_body
+                and "content-length" not in headers
+                and b"</head>" not in body
+                and len(body) < _HEAD_BUFFER_LIMIT
+            ):
+                # Streamed head split over several chunks: wait for its end
+                pending = body
+                return
+            pending = b""
+            if "content-length" in headers and more_body:
+                # Chunked with a fixed length: can't grow it, leave as is
+                new_body = body
+            else:
+                new_body, components = _inject_head(body)
+                if "content-length" in headers:
+                    headers["content-length"] = str(len(new_body))
+                elif more_body and components is not None:
+                    new_body, pending = _split_partial_tag(new_body)
+                    # Only to follow the open elements: its components are covered
+                    late = _LateStyles(components)
+                    new_body = late.feed(new_body)
+
+            await send(start)
+            start = None
+            await send({**message, "body": new_body})
+
+        await self.app(scope, receive, send_wrapper)
@@ -0,0 +1,327 @@
+"""Usage-driven CSS tree-shaking for community components.
+
+The community stylesheets are split into per-component partitions using the
+CSS class roots each component declares through ``register_component(...,
+css_classes=...)``. A rule belongs to every component whose classes appear in
+its selector; ``@keyframes`` belong to the components whose rules use them;
+everything else (custom properties, shared utilities) is always included.
+
+Subsets can be produced two ways:
+
+- At startup, for a known list of components:
+  ``setup_community(app, css_components=["DotsLoader", "StatCard"])``
+- Per route, from the content actually rendered: ``CommunityStyles(*content)``
+
+Subset URLs name their components and carry a content hash, so any worker
+can rebuild and serve them, and browsers can cache them forever.
+"""
+
+import hashlib
+import re
+import threading
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from fastcore.xml import FT
+from fasthtml.common import Link, NotStr
+from starlette.requests import Request
+from starlette.responses import Response
+
+from .assets import CSS_SOURCES, IMMUTABLE_CACHE_CONTROL, STATIC_DIR, minify_css
+from .registry import (
+    find_component_by_class,
+    get_component,
+    get_component_css_classes,
+    list_components,
+    record_component_usage,
+)
+from .streaming import Lazy
+
+SUBSET_PATH = "css/subset"
+
+# Subset URLs come from clients, so the number of built subsets is bounded
+_SUBSETS_MAXSIZE = 256
+
+_SELECTOR_CLASS_RE = re.compile(r"\.(-?[A-Za-z_][\w-]*)")
+_HTML_CLASS_RE = re.compile(r"""\sclass=(?:"([^"]*)"|'([^']*)')""")
+_KEYFRAMES_RE = re.compile(r"@(?:-webkit-)?keyframes\s+([\w-]+)")
+
+
+class CssRule(NamedTuple):
+    """A top-level stylesheet rule and the components it belongs to.
+
+    ``owners`` is empty for rules every page needs. Grouping rules such as
+    ``@media`` keep their nested rules in ``children`` and ``text`` holds only
+    the prelude.
+    """
+
+    text: str
+    owners: frozenset[str]
+    children: tuple["CssRule", ...] = ()
+
+
+_RULES: list[CssRule] | None = None
+_SUBSETS: dict[frozenset[str], tuple[str, bytes]] = {}
+_LOCK = threading.Lock()
+
+
+def _split_blocks(css: str) -> list[tuple[str, str]]:
+    """Split minified CSS into top-level (prelude, body) pairs."""
+    blocks = []
+    depth = 0
+    quote = None
+    start = body_start = 0
+    for i, ch in enumerate(css):
+        if quote:
+            if ch == quote and css[i - 1] != "\\":
+                quote = None
+        elif ch in "\"'":
+            quote = ch
+        elif ch == "{":
+            if depth == 0:
+                body_start = i
+            depth += 1
+        elif ch == "}":
+            depth -= 1
+            if depth == 0:
+                blocks.append((css[start:body_start].strip(), css[body_start + 1 : i]))
+                start = i + 1
+    return blocks
+
+
+def _rule_owners(selector: str) -> frozenset[str]:
+    owners = {find_component_by_class(c) for c in _SELECTOR_CLASS_RE.findall(selector)}
+    owners.discard(None)
+    return frozenset(owners)
+
+
+def parse_css_rules(css: str) -> list[CssRule]:
+    """Parse a stylesheet into rules annotated with their owning components."""
+    css = minify_css(css)
+    rules: list[CssRule] = []
+    keyframes: list[tuple[int, str]] = []
+
+    for prelude, body in _split_blocks(css):
+        if prelude.startswith(("@media", "@supports", "@container")):
+            children = tuple(
+                CssRule(f"{sel}{{{inner}}}", _rule_owners(sel))
+                for sel, inner in _split_blocks(body)
+            )
+            # Needed by everyone as soon as one nested rule is
+            owners = frozenset()
+            if all(c.owners for c in children):
+                owners = owners.union(*(c.owners for c in children))
+            rules.append(CssRule(prelude, owners, children))
+        elif match := _KEYFRAMES_RE.match(prelude):
+            keyframes.append((len(rules), match.group(1)))
+            rules.append(CssRule(f"{prelude}{{{body}}}", frozenset()))
+        elif prelude.startswith("@"):
+            rules.append(CssRule(f"{prelude}{{{body}}}", frozenset()))
+        else:
+            rules.append(CssRule(f"{prelude}{{{body}}}", _rule_owners(prelude)))
+
+    # Keyframes go wherever they are used; unused ones stay in the base set
+    for index, name in keyframes:
+        used = re.compile(rf"(?<![\w-]){re.escape(name)}(?![\w-])")
+        users: set[str] = set()
+        for rule in rules:
+            for r in rule.children or (rule,):
+                if r.owners and "@keyframes" not in r.text and used.search(r.text):
+                    users.update(r.owners)
+        if users:
+            rules[index] = rules[index]._replace(owners=frozenset(users))
+
+    return rules
+
+
+def load_css_rules(static_dir: Path = STATIC_DIR) -> list[CssRule]:
+    """Parse and partition the community stylesheets (once per process)."""
+    global _RULES
+    if _RULES is None:
+        css = "\n".join((static_dir / name).read_text(encoding="utf-8") for name in CSS_SOURCES)
+        _RULES = parse_css_rules(css)
+    return _RULES
+
+
+def _render_rules(rules: Iterable[CssRule], components: frozenset[str]) -> str:
+    out = []
+    for rule in rules:
+        if rule.owners and not rule.owners & components:
+            continue
+        if rule.children:
+            inner = "".join(c.text for c in rule.children if not c.owners or c.owners & components)
+            out.append(f"{rule.text}{{{inner}}}")
+        else:
+            out.append(rule.text)
+    return "".join(out)
+
+
+def component_css(components: Iterable[str], covered: Iterable[str] = ()) -> str:
+    """Return the rules of ``components`` not already shipped with ``covered`` ones.
+
+    Shared base rules are never included: this is for adding the CSS of
+    components found later in a page whose subset was already sent.
+
+    Args:
+        components: Registered component names
+        covered: Components whose rules (and the base rules) were already sent
+    """
+    names, done = frozenset(components), frozenset(covered)
+
+    def wanted(rule: CssRule) -> bool:
+        return bool(rule.owners & names) and not rule.owners & done
+
+    out = []
+    for rule in load_css_rules():
+        if rule.children:
+            inner = "".join(c.text for c in rule.children if wanted(c))
+            if inner:
+                out.append(f"{rule.text}{{{inner}}}")
+        elif wanted(rule):
+            out.append(rule.text)
+    return "".join(out)
+
+
+def partition_css() -> dict[str, str]:
+    """Return the stylesheet partition of every component, plus ``"base"`` for shared rules."""
+    rules = load_css_rules()
+    names = sorted({n for rule in rules for n in rule.owners})
+    partitions = {"base": _render_rules(rules, frozenset())}
+    for name in names:
+        only = [r for r in rules if name in r.owners]
+        partitions[name] = _render_rules(only, frozenset({name}))
+    return partitions
+
+
+def _normalize(components: Iterable[str]) -> frozenset[str]:
+    names = frozenset(components)
+    unknown = sorted(n for n in names if get_component(n) is None)
+    if unknown:
+        raise ValueError(
+            f"Unknown community components: {', '.join(unknown)}. "
+            f"Available: {', '.join(sorted(list_components()))}"
+        )
+    # Components without stylesheet rules don't change the subset
+    return frozenset(n for n in names if get_component_css_classes(n))
+
+
+def build_css_subset(components: Iterable[str]) -> tuple[str, bytes]:
+    """Build the stylesheet for a set of components.
+
+    Args:
+        components: Registered component names
+
+    Returns:
+        (file name relative to the static dir, CSS bytes)
+
+    Raises:
+        ValueError: If a component name is not registered
+    """
+    names = _normalize(components)
+    with _LOCK:
+        subset = _SUBSETS.get(names)
+        if subset is None:
+            css = _render_rules(load_css_rules(), names).encode("utf-8")
+            fingerprint = hashlib.sha256(css).hexdigest()[:10]
+            label = "-".join(sorted(names)) or "base"
+            if len(_SUBSETS) >= _SUBSETS_MAXSIZE:
+                _SUBSETS.clear()
+            subset = _SUBSETS[names] = (f"{SUBSET_PATH}/{label}.{fingerprint}.css", css)
+        return subset
+
+
+def clear_css_subsets() -> None:
+    """Drop parsed rules and built subsets (after editing stylesheets)."""
+    global _RULES
+    with _LOCK:
+        _RULES = None
+        _SUBSETS.clear()
+
+
+def _html_classes(html: str) -> set[str]:
+    """Collect the class names used in an HTML string."""
+    classes: set[str] = set()
+    for double, single in _HTML_CLASS_RE.findall(html):
+        classes.update((double or single).split())
+    return classes
+
+
+def _owners(classes: Iterable[str]) -> set[str]:
+    found = {find_component_by_class(c) for c in classes}
+    found.discard(None)
+    return found
+
+
+def components_in_html(html: str) -> set[str]:
+    """Find the community components whose classes appear in rendered HTML."""
+    return _owners(_html_classes(html))
+
+
+def components_in(*content: Any) -> set[str]:
+    """Find the community components whose classes appear in content.
+
+    FT trees are walked without rendering; pre-rendered HTML (``NotStr``,
+    ``render_many`` output) is scanned for class attributes. ``Lazy``
+    children are not consumed, so components only they produce are missed.
+    The components found are also recorded in the registry (see
+    ``list_used_components``).
+    """
+    classes: set[str] = set()
+    stack = list(content)
+    while stack:
+        node = stack.pop()
+        if isinstance(node, FT):
+            cls = node.attrs.get("class")
+            if isinstance(cls, str):
+                classes.update(cls.split())
+            stack.extend(node.children)
+        elif isinstance(node, (list, tuple)):
+            stack.extend(node)
+        elif isinstance(node, NotStr) or hasattr(node, "__html__"):
+            classes.update(_html_classes(str(node)))
+        elif hasattr(node, "__ft__") and not isinstance(node, Lazy):
+            stack.append(node.__ft__())
+
+    found = _owners(classes)
+    record_component_usage(*found)
+    return found
+
+
+def css_subset_url(components: Iterable[str], static_url: str = "/community-static") -> str:
+    """Return the URL of the stylesheet subset for a set of components."""
+    path, _ = build_css_subset(components)
+    return f"{static_url.rstrip('/')}/{path}"
+
+
+def CommunityStyles(*content: Any, static_url: str = "/community-static") -> FT:
+    """Stylesheet link covering only the community components used in ``content``.
+
+    Use it for per-route CSS together with ``setup_community(app,
+    css_components=())``, which links only the shared base rules globally.
+
+    Example:
+        >>> @rt("/")
+        ... def home():
+        ...     body = Container(StatCard(title="Users", value="1,204"), DotsLoader())
+        ...     return Title("Dashboard"), CommunityStyles(body), body
+    """
+    return Link(rel="stylesheet", href=css_subset_url(components_in(*content), static_url))
+
+
+async def css_subset_endpoint(request: Request) -> Response:
+    """Starlette endpoint serving stylesheet subsets by file name."""
+    label, _, rest = request.path_params["filename"].partition(".")
+    fingerprint = rest.removesuffix(".css")
+    names = [] if label == "base" else label.split("-")
+    try:
+        path, css = build_css_subset(names)
+    except ValueError:
+        return Response(status_code=404)
+    if not path.endswith(f".{fingerprint}.css"):
+        return Response(status_code=404)
+    return Response(
+        css,
+        media_type="text/css",
+        headers={"Cache-Control": IMMUTABLE_CACHE_CONTROL},
+    )
@@ -2,17 +2,28 @@
 
 This module provides a separate defaults system for community components,
 independent from Faststrap core defaults.
+
+Every component call reads its defaults, so lookups are kept cheap: the active
+defaults live in immutable per-component mappings that are rebuilt
+(copy-on-write) only when ``set_community_defaults`` or
+``reset_community_defaults`` runs. Each change bumps a version counter that
+caches can key on.
 """
 
+import threading
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any
 
+from faststrap.core.theme import resolve_defaults
+
 # Default values for all community components
 _DEFAULT_COMMUNITY_DEFAULTS: dict[str, dict[str, Any]] = {
     "FlipCard": {"height": "300px", "width": "100%", "duration": "0.6s"},
     "TiltCard": {"max_tilt": "15deg", "duration": "0.3s"},
     "RevealCard": {"overlay_opacity": "0.9"},
     "DotsLoader": {"variant": "primary"},
-    "RingLoader": {"variant": "primary", "size": "3rem"},
+    "RingLoader": {"variant": "primary", "size": "64px"},
     "TypewriterLoader": {"variant": "primary"},
     "PolygonLoader": {"variant": "primary", "sides": 6},
     "ScrollReveal": {"direction": "up", "delay": "0s", "duration": "0.6s"},
@@ -21,8 +32,25 @@ _DEFAULT_COMMUNITY_DEFAULTS: dict[str, dict[str, Any]] = {
     "MegaMenuNavbar": {"columns": 3},
 }
 
-# Active defaults (can be modified by user)
-_COMMUNITY_DEFAULTS: dict[str, dict[str, Any]] = _DEFAULT_COMMUNITY_DEFAULTS.copy()
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+# Values set by the user, layered over the built-in defaults
+_COMMUNITY_OVERRIDES: dict[str, Mapping[str, Any]] = {}
+
+
+def _initial_snapshot() -> dict[str, Mapping[str, Any]]:
+    """Build read-only copies of the built-in defaults."""
+    return {name: MappingProxyType(dict(v)) for name, v in _DEFAULT_COMMUNITY_DEFAULTS.items()}
+
+
+# Active state as a single (version, snapshot) pair, swapped atomically on change.
+# The snapshot and its per-component mappings are never mutated in place.
+_DEFAULTS_STATE: tuple[int, dict[str, Mapping[str, Any]]] = (0, _initial_snapshot())
+
+_DEFAULTS_LOCK = threading.Lock()
+
+# Merged core + community defaults: component -> (version, core values, merged)
+_RESOLVED_DEFAULTS: dict[str, tuple[int, dict[str, Any], Mapping[str, Any]]] = {}
 
 
 def set_community_defaults(component: str, **defaults: Any) -> None:
@@ -41,21 +69,41 @@ def set_community_defaults(component: str, **defaults: Any) -> None:
         >>> # Now all FlipCards will use these defaults
         >>> FlipCard(front="Front", back="Back")  # Uses 400px height
     """
-    if component not in _COMMUNITY_DEFAULTS:
-        _COMMUNITY_DEFAULTS[component] = {}
-    _COMMUNITY_DEFAULTS[component].update(defaults)
+    global _DEFAULTS_STATE
+    with _DEFAULTS_LOCK:
+        overrides = {**_COMMUNITY_OVERRIDES.get(component, _EMPTY), **defaults}
+        _COMMUNITY_OVERRIDES[component] = MappingProxyType(overrides)
+
+        version, snapshot = _DEFAULTS_STATE
+        merged = {**_DEFAULT_COMMUNITY_DEFAULTS.get(component, {}), **overrides}
+        _DEFAULTS_STATE = (version + 1, {**snapshot, component: MappingProxyType(merged)})
 
 
-def get_community_defaults(component: str) -> dict[str, Any]:
+def get_community_defaults(component: str) -> Mapping[str, Any]:
     """Get defaults for a community component.
 
+    The returned mapping is read-only and shared between callers; copy it with
+    ``dict(...)`` if you need to modify it.
+
+    Args:
+        component: Component name
+
+    Returns:
+        Read-only mapping of default values for the component
+    """
+    return _DEFAULTS_STATE[1].get(component, _EMPTY)
+
+
+def get_community_overrides(component: str) -> Mapping[str, Any]:
+    """Get only the values set via ``set_community_defaults`` for a component.
+
     Args:
         component: Component name
 
     Returns:
-        Dictionary of default values for the component
+        Read-only mapping of user-set values (empty if none were set)
     """
-    return _COMMUNITY_DEFAULTS.get(component, {}).copy()
+    return _COMMUNITY_OVERRIDES.get(component, _EMPTY)
 
 
 def reset_community_defaults() -> None:
@@ -66,8 +114,62 @@ def reset_community_defaults() -> None:
         >>> reset_community_defaults()
         >>> # FlipCard now uses original default (300px)
     """
-    global _COMMUNITY_DEFAULTS
-    _COMMUNITY_DEFAULTS = _DEFAULT_COMMUNITY_DEFAULTS.copy()
+    global _DEFAULTS_STATE
+    with _DEFAULTS_LOCK:
+        _COMMUNITY_OVERRIDES.clear()
+        _DEFAULTS_STATE = (_DEFAULTS_STATE[0] + 1, _initial_snapshot())
+
+
+def resolve_community_defaults(component: str) -> Mapping[str, Any]:
+    """Resolve the effective defaults for a community component.
+
+    Merges, from lowest to highest priority:
+
+    1. Built-in community defaults
+    2. Faststrap core defaults (set via ``faststrap.set_component_defaults``)
+    3. Community defaults set via ``set_community_defaults``
+
+    Core defaults are still looked up on every call (``resolve_defaults``
+    returns a fresh dict), but the merged read-only mapping is cached per
+    component and only rebuilt when the defaults version or the core defaults
+    change, so most calls skip the merge.
+
+    Args:
+        component: Component name
+
+    Returns:
+        Read-only mapping of effective default values
+
+    Example:
+        >>> def RingLoader(variant=None, size=None, **kwargs):
+        ...     defaults = resolve_community_defaults("RingLoader")
+        ...     v = variant or defaults.get("variant", "primary")
+    """
+    version, snapshot = _DEFAULTS_STATE
+    # Core's public resolver, so core defaults get locked against late changes as usual
+    core = resolve_defaults(component)
+
+    entry = _RESOLVED_DEFAULTS.get(component)
+    if entry is not None and entry[0] == version and entry[1] == core:
+        return entry[2]
+
+    builtin = _DEFAULT_COMMUNITY_DEFAULTS.get(component)
+    if not core:
+        resolved = snapshot.get(component, _EMPTY)
+    else:
+        merged = {**(builtin or {}), **core, **_COMMUNITY_OVERRIDES.get(component, _EMPTY)}
+        resolved = MappingProxyType(merged)
+
+    _RESOLVED_DEFAULTS[component] = (version, core, resolved)
+    return resolved
+
+
+def get_defaults_version() -> int:
+    """Return a counter that increases whenever community defaults change.
+
+    Caches key on this value to invalidate results rendered with old defaults.
+    """
+    return _DEFAULTS_STATE[0]
 
 
 def list_community_components() -> list[str]:
@@ -76,4 +178,4 @@ def list_community_components() -> list[str]:
     Returns:
         List of component names
     """
-    return list(_COMMUNITY_DEFAULTS.keys())
+    return list(_DEFAULTS_STATE[1].keys())
@@ -4,44 +4,76 @@ from typing import Any
 
 from fasthtml.common import Div
 from faststrap.core.base import merge_classes
-from faststrap.core.theme import resolve_defaults
 
+from ..defaults import resolve_community_defaults
+from ..images import responsive_background
 from ..registry import register_component
+from ..scripts import require_script
 
 
 def ParallaxSection(
-    *content: Any, img_src: str, height: str = None, overlay_opacity: float = None, **kwargs
+    *content: Any,
+    img_src: str,
+    height: str = None,
+    overlay_opacity: float = None,
+    speed: float = None,
+    **kwargs,
 ) -> Div:
     """A section with a parallax background effect.
 
+    The background is a separate layer moved with ``transform`` only, so
+    scrolling never repaints it. Browsers with CSS scroll-driven animations
+    run the effect entirely off the main thread; others use one shared,
+    rAF-throttled scroll listener (the ``parallax`` script). Users who prefer
+    reduced motion get a static background.
+
     Args:
         *content: Content to display over the background
         img_src: Source URL for the background image
         height: Height of the section (default: 500px)
         overlay_opacity: Opacity of the background darken overlay (0.0 to 1.0)
+        speed: How much the background lags behind the page while scrolling,
+            from 0 (scrolls with the content) to 1 (stays fixed) (default: 0.5)
         **kwargs: Additional attributes
     """
-    cfg = resolve_defaults("ParallaxSection", height=height, overlay_opacity=overlay_opacity)
-    h = cfg.get("height") or "500px"
-    o = cfg.get("overlay_opacity") if cfg.get("overlay_opacity") is not None else 0.5
+    defaults = resolve_community_defaults("ParallaxSection")
+    h = height or defaults.get("height") or "500px"
+    o = overlay_opacity if overlay_opacity is not None else defaults.get("overlay_opacity", 0.5)
+    s = speed if speed is not None else defaults.get("speed", 0.5)
+    s = min(1.0, max(0.0, float(s)))
 
     user_cls = kwargs.pop("cls", "")
     user_style = kwargs.pop("style", "")
 
     container_cls = merge_classes("fs-comm-parallax-section", user_cls)
 
-    # Base style with background image
-    base_style = f"background-image: url('{img_src}'); " f"height: {h};"
+    # Height and speed size the layer and its travel in effects.css
+    base_style = f"--fs-comm-parallax-height: {h}; --fs-comm-parallax-speed: {s:g}; height: {h};"
 
     final_style = f"{base_style} {user_style}".strip()
 
+    # Promoted background layer, taller than the section by its travel
+    layer = Div(
+        cls="fs-comm-parallax-layer",
+        style=responsive_background(img_src),
+        aria_hidden="true",
+    )
+
     # Internal darkened overlay
     overlay = Div(
         *content,
+        cls="fs-comm-parallax-content",
         style=f"background: rgba(0,0,0,{o}); width: 100%; height: 100%; display: flex; align-items: center; justify-content: center;",
     )
 
-    return Div(overlay, cls=container_cls, style=final_style, **kwargs)
+    # Fallback driver for browsers without scroll-driven animations (loaded once per page)
+    script = require_script("parallax")
+
+    return Div(layer, overlay, script, cls=container_cls, style=final_style, **kwargs)
 
 
-register_component("ParallaxSection", ParallaxSection)
+register_component(
+    "ParallaxSection",
+    ParallaxSection,
+    css_classes=("fs-comm-parallax-section", "fs-comm-parallax-layer", "fs-comm-parallax-content"),
+)
@@ -2,11 +2,12 @@
 
 from typing import Any
 
-from fasthtml.common import Div, Script
+from fasthtml.common import Div
 from faststrap.core.base import merge_classes
-from faststrap.core.theme import resolve_defaults
 
+from ..defaults import resolve_community_defaults
 from ..registry import register_component
+from ..scripts import require_script
 
 
 def ScrollReveal(
@@ -21,11 +22,11 @@ def ScrollReveal(
         duration: Duration of animation (default: 0.6s)
         **kwargs: Additional attributes
     """
-    cfg = resolve_defaults("ScrollReveal", direction=direction, delay=delay, duration=duration)
+    defaults = resolve_community_defaults("ScrollReveal")
 
-    dir_val = cfg.get("direction") or "up"
-    del_val = cfg.get("delay") or "0s"
-    dur_val = cfg.get("duration") or "0.6s"
+    dir_val = direction or defaults.get("direction") or "up"
+    del_val = delay or defaults.get("delay") or "0s"
+    dur_val = duration or defaults.get("duration") or "0.6s"
 
     user_cls = kwargs.pop("cls", "")
     user_style = kwargs.pop("style", "")
@@ -38,31 +39,10 @@ def ScrollReveal(
         f"{user_style}"
     ).strip()
 
-    # We need a small script to initialize the IntersectionObserver
-    # This script is idempotent and handles all .fs-comm-reveal elements.
-    reveal_script = Script(
-        """
-        if (!window.fsCommRevealInit) {
-            window.fsCommRevealInit = true;
-            const observer = new IntersectionObserver((entries) => {
-                entries.forEach(entry => {
-                    if (entry.isIntersecting) {
-                        entry.target.classList.add('revealed');
-                    }
-                });
-            }, { threshold: 0.1 });
-
-            const initReveals = () => {
-                document.querySelectorAll('.fs-comm-reveal').forEach(el => observer.observe(el));
-            };
-
-            document.addEventListener('DOMContentLoaded', initReveals);
-            if (window.htmx) document.body.addEventListener('htmx:afterSwap', initReveals);
-        }
-    """
-    )
+    # The IntersectionObserver lives in a shared, idempotent page-level script
+    reveal_script = require_script("scroll-reveal")
 
     return Div(content, reveal_script, cls=container_cls, style=final_style, **kwargs)
 
 
-register_component("ScrollReveal", ScrollReveal)
+register_component("ScrollReveal", ScrollReveal, css_classes=("fs-comm-reveal",))
@@ -3,7 +3,6 @@
 from fasthtml.common import Div, Input, Label
 from faststrap.core.base import merge_classes
 
-from ..defaults import get_community_defaults
 from ..registry import register_component
 
 
@@ -35,7 +34,6 @@ def AnimatedInput(
         ...     required=True
         ... )
     """
-    get_community_defaults("AnimatedInput")
 
     user_cls = kwargs.pop("cls", "")
     container_cls = merge_classes("fs-comm-animated-input", "form-floating", user_cls)
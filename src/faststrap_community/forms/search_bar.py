@@ -3,7 +3,6 @@
 from fasthtml.common import Button, Div, Input, Span
 from faststrap.core.base import merge_classes
 
-from ..defaults import get_community_defaults
 from ..registry import register_component
 
 
@@ -12,6 +11,9 @@ def SearchBar(
     name: str = "q",
     action: str = "/search",
     method: str = "GET",
+    search_url: str = None,
+    results_id: str = None,
+    delay: str = "250ms",
     **kwargs,
 ) -> Div:
     """Animated search bar with icon.
@@ -21,6 +23,10 @@ def SearchBar(
         name: Input name attribute
         action: Form action URL
         method: HTTP method (GET or POST)
+        search_url: Enable active search: fetch results from this URL with
+            HTMX while typing and swap them into a results container
+        results_id: Id of the results container (default: ``{name}-results``)
+        delay: Debounce delay between the last keystroke and the request
         **kwargs: Additional HTML attributes
 
     Example:
@@ -28,14 +34,27 @@ def SearchBar(
         ...     placeholder="Search products...",
         ...     action="/products/search"
         ... )
+        >>> SearchBar(placeholder="Search products...", search_url="/products/suggest")
     """
     from fasthtml.common import Form
 
-    get_community_defaults("SearchBar")
-
     user_cls = kwargs.pop("cls", "")
     container_cls = merge_classes("fs-comm-search-bar", user_cls)
 
+    results = None
+    if search_url:
+        results_id = results_id or f"{name}-results"
+        # Debounced requests; a newer keystroke aborts the request in flight
+        kwargs = {
+            "hx_get": search_url,
+            "hx_trigger": f"input changed delay:{delay}, search",
+            "hx_target": f"#{results_id}",
+            "hx_sync": "this:replace",
+            "autocomplete": "off",
+            **kwargs,
+        }
+        results = Div(id=results_id, cls="fs-comm-search-results", aria_live="polite")
+
     search_input = Input(
         type="search", name=name, placeholder=placeholder, cls="form-control", **kwargs
     )
@@ -44,6 +63,7 @@ def SearchBar(
 
     return Form(
         Div(search_input, search_button, cls="input-group"),
+        results,
         action=action,
         method=method,
         cls=container_cls,
@@ -1,19 +1,31 @@
 """TagInput component - Input for adding/removing tags."""
 
-from fasthtml.common import Button, Div, Input, Script, Span
+from fasthtml.common import Button, Div, Input, Span
 from faststrap.core.base import merge_classes
 
-from ..defaults import get_community_defaults
 from ..registry import register_component
-
-
-def TagInput(name: str, tags: list[str] = None, placeholder: str = "Add tag...", **kwargs) -> Div:
+from ..scripts import require_script
+
+
+def TagInput(
+    name: str,
+    tags: list[str] = None,
+    placeholder: str = "Add tag...",
+    suggest_url: str = None,
+    suggestions_id: str = None,
+    delay: str = "200ms",
+    **kwargs,
+) -> Div:
     """Input for adding and removing tags.
 
     Args:
         name: Input name attribute
         tags: Initial list of tags
         placeholder: Placeholder text
+        suggest_url: Enable autocomplete: fetch suggestions from this URL with
+            HTMX while typing (the text is sent as the ``name`` parameter)
+        suggestions_id: Id of the suggestions container (default: ``{name}-suggestions``)
+        delay: Debounce delay between the last keystroke and the request
         **kwargs: Additional HTML attributes
 
     Example:
@@ -22,8 +34,8 @@ def TagInput(name: str, tags: list[str] = None, placeholder: str = "Add tag...",
         ...     tags=["Python", "FastHTML", "Bootstrap"],
         ...     placeholder="Add a skill..."
         ... )
+        >>> TagInput(name="skills", suggest_url="/skills/suggest")
     """
-    get_community_defaults("TagInput")
     initial_tags = tags or []
 
     user_cls = kwargs.pop("cls", "")
@@ -42,68 +54,47 @@ def TagInput(name: str, tags: list[str] = None, placeholder: str = "Add tag...",
         for tag in initial_tags
     ]
 
-    # Input field
-    input_el = Input(type="text", name=name, placeholder=placeholder, cls="form-control", **kwargs)
-
-    # Hidden input to store tags as JSON
-    hidden_input = Input(type="hidden", name=f"{name}_tags", value=",".join(initial_tags))
-
-    # Simple JavaScript for tag management (minimal)
-    script = Script(
-        """
-        // Tag input functionality (minimal JS for interactivity)
-        document.querySelectorAll('.fs-comm-tag-input').forEach(container => {
-            const input = container.querySelector('input[type="text"]');
-            const hidden = container.querySelector('input[type="hidden"]');
-            const tagsDiv = container.querySelector('.tags-container');
-
-            input.addEventListener('keypress', (e) => {
-                if (e.key === 'Enter') {
-                    e.preventDefault();
-                    const tag = input.value.trim();
-                    if (tag) {
-                        addTag(tag);
-                        input.value = '';
-                    }
-                }
-            });
+    suggestions = None
+    if suggest_url:
+        suggestions_id = suggestions_id or f"{name}-suggestions"
+        # Debounced requests; a newer keystroke aborts the request in flight
+        kwargs = {
+            "hx_get": suggest_url,
+            "hx_trigger": f"input changed delay:{delay}",
+            "hx_target": f"#{suggestions_id}",
+            "hx_sync": "this:replace",
+            "autocomplete": "off",
+            **kwargs,
+        }
+        suggestions = Div(id=suggestions_id, cls="fs-comm-tag-suggestions", aria_live="polite")
 
-            function addTag(tag) {
-                const badge = document.createElement('span');
-                badge.className = 'badge bg-primary me-2 mb-2 d-inline-flex align-items-center';
-                badge.innerHTML = tag + '<button type="button" class="btn-close btn-close-white ms-2" style="font-size: 0.7rem;"></button>';
-                badge.querySelector('button').onclick = () => removeTag(badge, tag);
-                tagsDiv.appendChild(badge);
-                updateHidden();
-            }
-
-            function removeTag(badge, tag) {
-                badge.remove();
-                updateHidden();
-            }
-
-            function updateHidden() {
-                const tags = Array.from(tagsDiv.querySelectorAll('.badge')).map(b => b.textContent.replace('×', '').trim());
-                hidden.value = tags.join(',');
-            }
+    # Input field
+    input_el = Input(
+        type="text",
+        name=name,
+        placeholder=placeholder,
+        cls="form-control",
+        data_fs_tag_entry=True,
+        **kwargs,
+    )
 
-            // Setup remove buttons for initial tags
-            container.querySelectorAll('.btn-close').forEach(btn => {
-                btn.onclick = (e) => {
-                    e.target.closest('.badge').remove();
-                    updateHidden();
-                };
-            });
-        });
-    """
+    # Hidden input holding the comma-joined tags
+    hidden_input = Input(
+        type="hidden", name=f"{name}_tags", value=",".join(initial_tags), data_fs_tag_value=True
     )
 
+    # Shared page-level controller with delegated listeners (emitted once, or
+    # hoisted by setup_community); nothing here is per-instance JavaScript
+    script = require_script("tag-input")
+
     return Div(
         Div(*tag_elements, cls="tags-container mb-2"),
         input_el,
+        suggestions,
         hidden_input,
         script,
         cls=container_cls,
+        data_fs_tag_input=name,
     )
 
 
@@ -0,0 +1,214 @@
+"""Server-side cache for HTMX fragment routes.
+
+``cache_fragment`` wraps a FastHTML route handler so the HTML it renders is
+kept per distinct set of route parameters, for ``ttl`` seconds and up to
+``maxsize`` entries (least recently used are evicted first). It pairs with
+``LazyFragment``: a dashboard sends a cheap shell, and each panel is computed
+once per TTL however many viewers scroll to it::
+
+    @rt("/dashboard/revenue")
+    @cache_fragment(ttl=30)
+    def get(region: str = "all"):
+        return StatCard(title="Revenue", value=compute_revenue(region))
+
+Parameters are bound against the handler's signature, so ``?region=eu`` and
+the default-filled call share an entry. Calls with non-scalar arguments
+(requests, sessions, uploads) bypass the cache unless those parameters are
+listed in ``exclude``; responses that are not FT content (redirects, custom
+``Response`` objects, strings) are never cached, nor are results carrying
+per-response extras (``HttpHeader`` such as ``HtmxResponseHeaders`` or
+cookies, background tasks).
+
+Cached content is rendered once but still handed back to FastHTML as content:
+HTMX requests get the bare fragment, other requests the full page with the
+app's headers, and top-level ``Title``/``Meta``/``Link``/``Style`` items stay
+in ``<head>``.
+"""
+
+import inspect
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from functools import wraps
+from typing import Any
+
+from fastcore.xml import FT
+from fasthtml.common import HttpHeader, NotStr, to_xml
+from starlette.background import BackgroundTask
+
+from .render_cache import _freeze
+
+# Tags FastHTML moves into <head> when it wraps content in a full page
+_HEAD_TAGS = frozenset({"title", "meta", "link", "style", "base"})
+
+
+class _RenderedFragment:
+    """Pre-rendered HTML that FastHTML still lays out as page content."""
+
+    __slots__ = ("html",)
+
+    def __init__(self, html: str):
+        self.html = html
+
+    def __ft__(self) -> NotStr:
+        return NotStr(self.html)
+
+    def __html__(self) -> str:
+        return self.html
+
+    def __str__(self) -> str:
+        return self.html
+
+
+def _cacheable(result: Any) -> Any:
+    """Return the cached form of a handler result, or None if it can't be cached."""
+    if isinstance(result, (tuple, list)):
+        items = tuple(result)
+    elif isinstance(result, FT) or hasattr(result, "__ft__"):
+        items = (result,)
+    else:
+        return None
+    if any(isinstance(item, (HttpHeader, BackgroundTask)) for item in items):
+        return None
+    heads = tuple(item for item in items if getattr(item, "tag", "") in _HEAD_TAGS)
+    body = _RenderedFragment(
+        to_xml(tuple(item for item in items if getattr(item, "tag", "") not in _HEAD_TAGS))
+    )
+    return (*heads, body) if heads else body
+
+
+class FragmentCache:
+    """TTL + LRU store of rendered fragments.
+
+    Args:
+        ttl: Seconds an entry stays fresh
+        maxsize: Maximum number of entries
+    """
+
+    def __init__(self, ttl: float = 60.0, maxsize: int = 256):
+        if ttl <= 0 or maxsize < 1:
+            raise ValueError("ttl and maxsize must be positive")
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Any, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0}
+
+    def get(self, key: Any) -> Any | None:
+        """Return a fresh entry, or None (expired entries are dropped)."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(key)
+                self._stats["hits"] += 1
+                return entry[1]
+            if entry is not None:
+                del self._entries[key]
+            self._stats["misses"] += 1
+            return None
+
+    def set(self, key: Any, html: Any) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, html)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, **params: Any) -> int:
+        """Drop entries whose parameters include all of ``params`` (all entries if none).
+
+        Returns:
+            Number of entries dropped
+        """
+        wanted = {name: _freeze(value) for name, value in params.items()}
+        with self._lock:
+            stale = [key for key in self._entries if all(item in key for item in wanted.items())]
+            for key in stale:
+                del self._entries[key]
+            return len(stale)
+
+    def clear(self) -> None:
+        """Drop all entries and reset the hit/miss counters."""
+        with self._lock:
+            self._entries.clear()
+            self._stats["hits"] = 0
+            self._stats["misses"] = 0
+
+    def info(self) -> dict[str, int]:
+        """Return cache statistics: hits, misses, current size and maxsize."""
+        with self._lock:
+            return {**self._stats, "size": len(self._entries), "maxsize": self.maxsize}
+
+
+def cache_fragment(
+    ttl: float = 60.0, maxsize: int = 256, exclude: Iterable[str] = ()
+) -> Callable[[Callable], Callable]:
+    """Cache the HTML a fragment route renders, per distinct route parameters.
+
+    Apply it below ``@rt`` so FastHTML sees the handler's own signature. Sync
+    and async handlers are supported. The cache is available as
+    ``handler.cache`` (a ``FragmentCache``) for stats and invalidation.
+
+    Args:
+        ttl: Seconds a rendered fragment is served before it is recomputed
+        maxsize: Maximum number of cached fragments
+        exclude: Parameters left out of the cache key (e.g. ``"req"`` when the
+            handler only uses the request for logging)
+
+    Example:
+        >>> @rt("/panels/{name}")
+        ... @cache_fragment(ttl=30, maxsize=64)
+        ... def get(name: str, days: int = 7):
+        ...     return render_panel(name, days)
+    """
+    excluded = frozenset(exclude)
+
+    def decorator(handler: Callable) -> Callable:
+        sig = inspect.signature(handler)
+        cache = FragmentCache(ttl, maxsize)
+
+        def make_key(args: tuple, kwargs: dict[str, Any]) -> tuple | None:
+            try:
+                bound = sig.bind(*args, **kwargs)
+                bound.apply_defaults()
+                return tuple(
+                    (name, _freeze(value))
+                    for name, value in bound.arguments.items()
+                    if name not in excluded
+                )
+            except TypeError:
+                return None
+
+        def store(key: tuple | None, result: Any) -> Any:
+            cached = _cacheable(result) if key is not None else None
+            if cached is None:
+                return result
+            cache.set(key, cached)
+            return cached
+
+        if inspect.iscoroutinefunction(handler):
+
+            @wraps(handler)
+            async def wrapper(*args: Any, **kwargs: Any) -> Any:
+                key = make_key(args, kwargs)
+                html = cache.get(key) if key is not None else None
+                if html is not None:
+                    return html
+                return store(key, await handler(*args, **kwargs))
+
+        else:
+
+            @wraps(handler)
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                key = make_key(args, kwargs)
+                html = cache.get(key) if key is not None else None
+                if html is not None:
+                    return html
+                return store(key, handler(*args, **kwargs))
+
+        wrapper.cache = cache
+        return wrapper
+
+    return decorator
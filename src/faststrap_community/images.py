@@ -0,0 +1,365 @@
+"""Responsive image pipeline for image-heavy community components.
+
+With a pipeline configured (``setup_community(app, images=ImagePipeline(...))``),
+``ParallaxSection``, ``RevealCard`` and ``ProfileCard`` stop sending one
+full-size image: local images are described once (size, content hash, a tiny
+blurred placeholder) and rendered as ``<picture>`` with AVIF/WebP ``srcset``
+candidates or as an ``image-set()`` background, with explicit dimensions,
+``loading="lazy"`` and ``decoding="async"``.
+
+Resized derivatives are produced on first request and stored in a
+content-addressed disk cache: file names start with a hash of the source
+bytes, so they never go stale and are served with an immutable
+``Cache-Control``. Only widths the pipeline advertised for a known source are
+generated; other names get a 404. What was advertised is recorded next to the
+derivatives (``<digest>.json``), so any worker sharing ``cache_dir``, or the
+same app after a restart, can serve URLs another process rendered.
+
+Requires Pillow (``pip install "faststrap-community[images]"``). AVIF is used
+when the installed Pillow can write it. Images outside ``source_dir`` (remote
+URLs, missing files) are rendered as plain ``<img>`` tags.
+"""
+
+import base64
+import hashlib
+import json
+import os
+import re
+import threading
+from io import BytesIO
+from pathlib import Path
+from typing import Any, NamedTuple
+from urllib.parse import unquote, urlsplit
+
+from fasthtml.common import FT, Img, Picture, Source
+from starlette.concurrency import run_in_threadpool
+from starlette.requests import Request
+from starlette.responses import FileResponse, Response
+
+IMAGES_ROUTE = "/community-images"
+
+DEFAULT_WIDTHS = (160, 320, 640, 960, 1280, 1920)
+
+# Width of the inline blurred placeholder
+LQIP_WIDTH = 16
+
+# srcset candidate used as the <img src> fallback
+_FALLBACK_WIDTH = 960
+
+_MIME_TYPES = {"avif": "image/avif", "webp": "image/webp"}
+
+_NAME_RE = re.compile(r"^([0-9a-f]{16})-(\d+)\.(avif|webp)$")
+
+_IMMUTABLE = "public, max-age=31536000, immutable"
+
+
+def _require_pillow() -> Any:
+    try:
+        from PIL import Image
+    except ImportError as e:
+        raise ImportError(
+            'ImagePipeline needs Pillow: pip install "faststrap-community[images]"'
+        ) from e
+    Image.init()
+    return Image
+
+
+class ResponsiveImage(NamedTuple):
+    """What components need to render a described source image."""
+
+    width: int  # Intrinsic size of the (orientation-corrected) source
+    height: int
+    src: str  # WebP fallback for <img src>
+    sources: tuple[tuple[str, str], ...]  # (mime type, srcset), preferred format first
+    backgrounds: tuple[tuple[str, str], ...]  # (mime type, URL of the largest derivative)
+    lqip: str  # Blurred placeholder as a data: URI
+
+
+class ImagePipeline:
+    """Describe local images and serve resized derivatives from a disk cache.
+
+    Args:
+        source_dir: Directory holding the original images
+        source_url: URL prefix under which ``source_dir`` is served; image
+            URLs starting with it are handled by the pipeline
+        cache_dir: Directory for derivatives (created on first use)
+        url: URL prefix of the derivative route
+        widths: Candidate widths in pixels (sources are never upscaled)
+        formats: Output formats, preferred first; unsupported ones are skipped
+        quality: Encoder quality (1-100)
+
+    Example:
+        >>> images = ImagePipeline("static", source_url="/static", cache_dir=".image-cache")
+        >>> setup_community(app, images=images)
+        >>> ProfileCard(name="Jane", avatar="/static/team/jane.jpg")
+    """
+
+    def __init__(
+        self,
+        source_dir: str | Path,
+        source_url: str = "/static",
+        cache_dir: str | Path = ".image-cache",
+        url: str = IMAGES_ROUTE,
+        widths: tuple[int, ...] = DEFAULT_WIDTHS,
+        formats: tuple[str, ...] = ("avif", "webp"),
+        quality: int = 70,
+    ):
+        self._image = _require_pillow()
+        self.source_dir = Path(source_dir).resolve()
+        self.source_url = "/" + source_url.strip("/")
+        self.cache_dir = Path(cache_dir)
+        self.url = url.rstrip("/")
+        self.widths = tuple(sorted(set(widths)))
+        # WebP is always written: it is the <img> fallback
+        self.formats = tuple(
+            f for f in formats if f in _MIME_TYPES and f.upper() in self._image.SAVE
+        ) or ("webp",)
+        if "webp" not in self.formats:
+            self.formats += ("webp",)
+        self.quality = quality
+        self._described: dict[Path, tuple[tuple[int, int], ResponsiveImage]] = {}
+        # digest -> (source path, advertised widths)
+        self._sources: dict[str, tuple[Path, frozenset[int]]] = {}
+        self._lock = threading.Lock()
+
+    def _resolve(self, src: str) -> Path | None:
+        """Map an image URL to a file under ``source_dir``, or None."""
+        parts = urlsplit(src)
+        if parts.scheme or parts.netloc:
+            return None
+        path = unquote(parts.path)
+        prefix = self.source_url.rstrip("/") + "/"
+        if not path.startswith(prefix):
+            return None
+        candidate = (self.source_dir / path[len(prefix) :]).resolve()
+        if not candidate.is_relative_to(self.source_dir) or not candidate.is_file():
+            return None
+        return candidate
+
+    def _open(self, source: Any) -> Any:
+        from PIL import ImageOps
+
+        with self._image.open(source) as im:
+            im = ImageOps.exif_transpose(im)
+            return im.convert("RGBA" if "A" in im.getbands() or im.mode == "P" else "RGB")
+
+    def describe(self, src: str) -> ResponsiveImage | None:
+        """Describe a local image, or return None if ``src`` isn't handled.
+
+        The result is cached per file and modification time; the source is read
+        once, and its placeholder is also kept in the disk cache.
+        """
+        path = self._resolve(src)
+        if path is None:
+            return None
+        stat = path.stat()
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        cached = self._described.get(path)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+
+        data = path.read_bytes()
+        digest = hashlib.sha256(data).hexdigest()[:16]
+        image = self._open(path)
+        width, height = image.size
+
+        lqip_path = self.cache_dir / f"{digest}-lqip.webp"
+        if lqip_path.is_file():
+            lqip = lqip_path.read_bytes()
+        else:
+            from PIL import ImageFilter
+
+            small = image.copy()
+            small.thumbnail((LQIP_WIDTH, LQIP_WIDTH * height // max(width, 1) or 1))
+            small = small.filter(ImageFilter.GaussianBlur(1))
+            lqip = self._encode(small, "webp", 40, lqip_path)
+
+        widths = [w for w in self.widths if w < width]
+        if width <= self.widths[-1] or not widths:
+            widths.append(width)
+
+        def derivative(w: int, fmt: str) -> str:
+            return f"{self.url}/{digest}-{w}.{fmt}"
+
+        fallback = max((w for w in widths if w <= _FALLBACK_WIDTH), default=widths[0])
+        info = ResponsiveImage(
+            width=width,
+            height=height,
+            src=derivative(fallback, "webp"),
+            sources=tuple(
+                (_MIME_TYPES[fmt], ", ".join(f"{derivative(w, fmt)} {w}w" for w in widths))
+                for fmt in self.formats
+            ),
+            backgrounds=tuple(
+                (_MIME_TYPES[fmt], derivative(widths[-1], fmt)) for fmt in self.formats
+            ),
+            lqip="data:image/webp;base64," + base64.b64encode(lqip).decode("ascii"),
+        )
+        # Let every worker sharing the cache derive what this one advertised
+        sidecar = {"source": path.relative_to(self.source_dir).as_posix(), "widths": widths}
+        self._write(self.cache_dir / f"{digest}.json", json.dumps(sidecar).encode())
+        with self._lock:
+            self._sources[digest] = (path, frozenset(widths))
+            self._described[path] = (stamp, info)
+        return info
+
+    def _write(self, target: Path, data: bytes) -> None:
+        """Write ``data`` atomically to ``target``."""
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_name(f".{target.name}.{os.getpid()}.{threading.get_ident()}")
+        tmp.write_bytes(data)
+        os.replace(tmp, target)
+
+    def _encode(self, image: Any, fmt: str, quality: int, target: Path) -> bytes:
+        """Encode ``image`` and write it atomically to ``target``."""
+        buffer = BytesIO()
+        image.save(buffer, format=fmt.upper(), quality=quality)
+        data = buffer.getvalue()
+        self._write(target, data)
+        return data
+
+    def _source(self, digest: str) -> tuple[Path, frozenset[int]] | None:
+        """Return the source and advertised widths of ``digest``, from memory or its sidecar."""
+        source = self._sources.get(digest)
+        if source is not None:
+            return source
+        try:
+            sidecar = json.loads((self.cache_dir / f"{digest}.json").read_bytes())
+            path = (self.source_dir / sidecar["source"]).resolve()
+            widths = frozenset(int(w) for w in sidecar["widths"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        if not path.is_relative_to(self.source_dir) or not path.is_file():
+            return None
+        with self._lock:
+            self._sources[digest] = (path, widths)
+        return path, widths
+
+    def derive(self, name: str) -> Path | None:
+        """Return the cached derivative called ``name``, producing it if needed.
+
+        Returns None for names the pipeline never advertised.
+        """
+        match = _NAME_RE.match(name)
+        if match is None:
+            return None
+        target = self.cache_dir / name
+        if target.is_file():
+            return target
+
+        digest, width, fmt = match.group(1), int(match.group(2)), match.group(3)
+        source = self._source(digest)
+        if source is None or width not in source[1] or fmt not in self.formats:
+            return None
+
+        data = source[0].read_bytes()
+        if hashlib.sha256(data).hexdigest()[:16] != digest:
+            # The source changed since it was described: the name is stale
+            return None
+        image = self._open(BytesIO(data))
+        if width < image.width:
+            height = max(1, round(image.height * width / image.width))
+            image = image.resize((width, height), self._image.Resampling.LANCZOS)
+        self._encode(image, fmt, self.quality, target)
+        return target
+
+    async def endpoint(self, request: Request) -> Response:
+        """Starlette endpoint serving derivatives (resized in a worker thread)."""
+        name = request.path_params["name"]
+        path = await run_in_threadpool(self.derive, name)
+        if path is None:
+            return Response(status_code=404)
+        media_type = _MIME_TYPES[name.rsplit(".", 1)[1]]
+        return FileResponse(path, media_type=media_type, headers={"Cache-Control": _IMMUTABLE})
+
+
+# Pipeline used by components (set by setup_community(images=...))
+_PIPELINE: ImagePipeline | None = None
+
+# Image arguments that change the markup once a pipeline is active, so they
+# can't be batch-substituted as plain text (see batch.register_batch_slots)
+_IMAGE_ARGS = {"ProfileCard": "avatar"}
+
+
+def set_image_pipeline(pipeline: ImagePipeline | None) -> None:
+    """Make components render images through ``pipeline`` (None turns it off)."""
+    global _PIPELINE
+    from .batch import _BATCH_SLOTS, register_batch_slots
+
+    _PIPELINE = pipeline
+    for component, arg in _IMAGE_ARGS.items():
+        slots = tuple(s for s in _BATCH_SLOTS.get(component, ()) if s != arg)
+        register_batch_slots(component, *slots, *(() if pipeline else (arg,)))
+
+
+def get_image_pipeline() -> ImagePipeline | None:
+    return _PIPELINE
+
+
+def describe_image(src: str | None) -> ResponsiveImage | None:
+    """Describe ``src`` with the active pipeline, or None if it isn't handled."""
+    if _PIPELINE is None or not src:
+        return None
+    return _PIPELINE.describe(src)
+
+
+def responsive_img(
+    src: str,
+    alt: str = "",
+    sizes: str = "100vw",
+    width: int | None = None,
+    height: int | None = None,
+    **kwargs: Any,
+) -> FT:
+    """Render an image with srcset candidates, explicit dimensions and lazy loading.
+
+    Handled images become ``<picture class="fs-comm-picture">`` with one
+    ``<source>`` per format around the ``<img>``, which carries the blurred
+    placeholder as its background until the image loads. Other images are a
+    plain lazy ``<img>``.
+
+    Args:
+        src: Image URL
+        alt: Alternative text
+        sizes: Rendered width for the browser to pick a candidate (e.g. ``"100px"``)
+        width: Width attribute (default: the image's intrinsic width)
+        height: Height attribute (default: the image's intrinsic height)
+        **kwargs: Additional ``<img>`` attributes (``loading`` and ``decoding``
+            can be overridden, e.g. ``loading="eager"`` above the fold)
+    """
+    attrs = {"loading": "lazy", "decoding": "async", **kwargs}
+    info = describe_image(src)
+    if info is None:
+        return Img(src=src, alt=alt, width=width, height=height, **attrs)
+
+    if width is None and height is None:
+        width, height = info.width, info.height
+    style = f"background: url('{info.lqip}') center / cover no-repeat; {attrs.pop('style', '')}"
+    sources = [Source(type=mime, srcset=srcset, sizes=sizes) for mime, srcset in info.sources]
+    img = Img(
+        src=info.src,
+        alt=alt,
+        width=width,
+        height=height,
+        style=style.strip(),
+        **attrs,
+    )
+    return Picture(*sources, img, cls="fs-comm-picture")
+
+
+def responsive_background(src: str) -> str:
+    """Return ``background-image`` declarations for ``src``.
+
+    Handled images get an ``image-set()`` of the largest derivative per
+    format over the blurred placeholder, after a single-URL declaration for
+    browsers without ``image-set()`` type selection.
+    """
+    info = describe_image(src)
+    if info is None:
+        return f"background-image: url('{src}');"
+    fallback = dict(info.backgrounds)["image/webp"]
+    options = ", ".join(f"url('{url}') type('{mime}')" for mime, url in info.backgrounds)
+    return (
+        f"background-image: url('{fallback}'), url('{info.lqip}'); "
+        f"background-image: image-set({options}), url('{info.lqip}');"
+    )
@@ -0,0 +1,296 @@
+"""Asyncio broadcast hub for live dashboard updates over Server-Sent Events.
+
+A server publishes an update once::
+
+    broadcast_hub.publish("revenue", StatCard(title="Revenue", value="$12,400", id="revenue"))
+
+and every page listening on the ``revenue`` topic (``LiveUpdates("revenue")``)
+receives it as an HTMX out-of-band swap that replaces ``#revenue`` in place.
+
+- **One render per update.** ``publish`` serializes the fragment into an SSE
+  message once; subscribers share the bytes.
+- **Coalescing.** By default a topic's pending message is replaced by newer
+  ones (last value wins), so a slow client gets the latest value rather than
+  a backlog. Appending updates (new TimelineCard entries) pass
+  ``coalesce=False`` and are queued.
+- **Bounded queues.** Each connection holds at most ``maxsize`` messages.
+  When it is full, the ``policy`` decides: ``"drop_oldest"`` (default),
+  ``"drop_newest"`` or ``"disconnect"`` the slow client.
+
+The hub lives in the process and on the event loop that serves the SSE
+connections; publish from other threads with ``publish_threadsafe``.
+"""
+
+import asyncio
+import copy
+from collections import deque
+from collections.abc import AsyncIterator, Iterable
+from typing import Any
+from urllib.parse import urlencode
+
+from fastcore.xml import FT
+from fasthtml.common import Div, sse_message
+from starlette.requests import Request
+from starlette.responses import Response, StreamingResponse
+
+LIVE_ROUTE = "/community-live"
+LIVE_EVENT = "update"
+
+# Seconds of silence after which a comment is sent to keep proxies from closing the stream
+LIVE_KEEPALIVE = 15.0
+
+DROP_POLICIES = ("drop_oldest", "drop_newest", "disconnect")
+
+_KEEPALIVE_EVENT = b": keepalive\n\n"
+
+
+class Subscription:
+    """A client's bounded queue of pending messages.
+
+    Coalesced messages are kept as ``[topic, message]`` entries that newer
+    messages for the same topic overwrite in place.
+    """
+
+    def __init__(self, topics: frozenset[str], maxsize: int, policy: str):
+        self.topics = topics
+        self.maxsize = maxsize
+        self.policy = policy
+        self.dropped = 0
+        self.closed = False
+        self._queue: deque[list] = deque()
+        self._latest: dict[str, list] = {}
+        self._ready = asyncio.Event()
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    def offer(self, topic: str, message: bytes, coalesce: bool = True) -> None:
+        """Queue a message, applying coalescing and the drop policy."""
+        if self.closed:
+            return
+        if coalesce and topic in self._latest:
+            self._latest[topic][1] = message
+            return
+
+        if len(self._queue) >= self.maxsize:
+            self.dropped += 1
+            if self.policy == "drop_newest":
+                return
+            if self.policy == "disconnect":
+                self.close()
+                return
+            oldest = self._queue.popleft()
+            if self._latest.get(oldest[0]) is oldest:
+                del self._latest[oldest[0]]
+
+        entry = [topic, message]
+        self._queue.append(entry)
+        if coalesce:
+            self._latest[topic] = entry
+        self._ready.set()
+
+    def drain(self) -> bytes:
+        """Take every pending message, joined into one write."""
+        messages = b"".join(message for _, message in self._queue)
+        self._queue.clear()
+        self._latest.clear()
+        self._ready.clear()
+        return messages
+
+    def close(self) -> None:
+        """End the subscription; pending messages are discarded."""
+        self.closed = True
+        self._queue.clear()
+        self._latest.clear()
+        self._ready.set()
+
+    async def events(self, keepalive: float = LIVE_KEEPALIVE) -> AsyncIterator[bytes]:
+        """Yield pending messages as they arrive until the subscription is closed."""
+        while not self.closed:
+            try:
+                await asyncio.wait_for(self._ready.wait(), keepalive)
+            except asyncio.TimeoutError:
+                yield _KEEPALIVE_EVENT
+                continue
+            if self.closed:
+                return
+            yield self.drain()
+
+
+def _oob(content: tuple, swap: str) -> FT | tuple:
+    """Mark content as out-of-band swaps.
+
+    With ``swap="true"`` each top-level element replaces the element with the
+    same id. Other swap strategies (``"afterbegin:#feed"``) wrap the content,
+    since HTMX inserts the children of such an out-of-band element.
+    """
+    if swap != "true":
+        return Div(*content, hx_swap_oob=swap)
+    marked = []
+    for el in content:
+        if not isinstance(el, FT) or not el.attrs.get("id"):
+            raise ValueError('Live updates with swap="true" need top-level elements with an id')
+        # Copy so the caller's element (often also used in the page) is untouched
+        el = copy.copy(el)
+        el.attrs = {**el.attrs, "hx-swap-oob": el.attrs.get("hx-swap-oob", "true")}
+        marked.append(el)
+    return tuple(marked)
+
+
+class BroadcastHub:
+    """Publish/subscribe hub fanning rendered updates out to SSE connections.
+
+    Args:
+        maxsize: Default per-connection queue bound
+        policy: Default drop policy for full queues (see ``DROP_POLICIES``)
+    """
+
+    def __init__(self, maxsize: int = 64, policy: str = "drop_oldest"):
+        if policy not in DROP_POLICIES:
+            raise ValueError(f"Unknown drop policy {policy!r}; use one of {DROP_POLICIES}")
+        self.maxsize = maxsize
+        self.policy = policy
+        self._subscribers: dict[str, set[Subscription]] = {}
+        self._last: dict[str, bytes] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def subscribe(
+        self,
+        topics: Iterable[str],
+        maxsize: int | None = None,
+        policy: str | None = None,
+        replay: bool = True,
+    ) -> Subscription:
+        """Subscribe to topics. Must be called on the event loop.
+
+        Args:
+            topics: Topic names
+            maxsize: Queue bound (default: the hub's)
+            policy: Drop policy (default: the hub's)
+            replay: Queue the last coalesced message of each topic right away,
+                so a new page shows current values without waiting for a change
+        """
+        policy = policy or self.policy
+        if policy not in DROP_POLICIES:
+            raise ValueError(f"Unknown drop policy {policy!r}; use one of {DROP_POLICIES}")
+        self._loop = asyncio.get_running_loop()
+        subscription = Subscription(frozenset(topics), maxsize or self.maxsize, policy)
+        for topic in subscription.topics:
+            self._subscribers.setdefault(topic, set()).add(subscription)
+            if replay and topic in self._last:
+                subscription.offer(topic, self._last[topic])
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        subscription.close()
+        for topic in subscription.topics:
+            subscribers = self._subscribers.get(topic)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[topic]
+
+    def subscriber_count(self, topic: str) -> int:
+        return len(self._subscribers.get(topic, ()))
+
+    def render(self, *content: Any, swap: str = "true") -> bytes:
+        """Render content into the SSE message sent to subscribers."""
+        return sse_message(_oob(content, swap), LIVE_EVENT).encode()
+
+    def publish(self, topic: str, *content: Any, swap: str = "true", coalesce: bool = True) -> int:
+        """Render an update once and queue it for every subscriber of a topic.
+
+        Must be called on the hub's event loop (see ``publish_threadsafe``).
+
+        Args:
+            topic: Topic name
+            *content: Elements to swap in. With the default ``swap="true"``
+                each needs an id matching the element it replaces.
+            swap: Out-of-band swap strategy, e.g. ``"afterbegin:#timeline"``
+                to prepend TimelineCards to a list
+            coalesce: Replace this topic's pending message instead of queueing
+                another one (default). Use False for appending updates.
+
+        Returns:
+            Number of subscribers the update was queued for
+        """
+        return self.publish_message(topic, self.render(*content, swap=swap), coalesce)
+
+    def publish_message(self, topic: str, message: bytes, coalesce: bool = True) -> int:
+        """Queue an already rendered message (see ``render``)."""
+        if coalesce:
+            self._last[topic] = message
+        subscribers = tuple(self._subscribers.get(topic, ()))
+        for subscription in subscribers:
+            subscription.offer(topic, message, coalesce)
+            if subscription.closed:
+                # Disconnected by its drop policy
+                self.unsubscribe(subscription)
+        return len(subscribers)
+
+    def publish_threadsafe(
+        self, topic: str, *content: Any, swap: str = "true", coalesce: bool = True
+    ) -> None:
+        """Publish from another thread: render here, fan out on the event loop."""
+        message = self.render(*content, swap=swap)
+        loop = self._loop
+        if loop is not None and not loop.is_closed():
+            try:
+                loop.call_soon_threadsafe(self.publish_message, topic, message, coalesce)
+                return
+            except RuntimeError:
+                # Closed meanwhile; its subscribers are gone with it
+                pass
+        # Nobody is subscribed on a running loop: just remember the value for replay
+        if coalesce:
+            self._last[topic] = message
+
+    async def stream(
+        self, topics: Iterable[str], keepalive: float = LIVE_KEEPALIVE, **kwargs: Any
+    ) -> AsyncIterator[bytes]:
+        """Subscribe and yield SSE messages until the client goes away."""
+        subscription = self.subscribe(topics, **kwargs)
+        try:
+            async for chunk in subscription.events(keepalive):
+                yield chunk
+        finally:
+            self.unsubscribe(subscription)
+
+
+broadcast_hub = BroadcastHub()
+
+
+def LiveUpdates(*topics: str, url: str = LIVE_ROUTE, **kwargs: Any) -> FT:
+    """Hidden element applying live updates for the given topics to the page.
+
+    Requires the htmx SSE extension (``htmx-ext-sse``) and
+    ``setup_community(app)``, which mounts the stream route.
+
+    Example:
+        >>> Div(
+        ...     StatCard(title="Users", value="1,204", id="users"),
+        ...     LiveUpdates("users"),
+        ... )
+    """
+    if not topics:
+        raise ValueError("LiveUpdates needs at least one topic")
+    return Div(
+        hx_ext="sse",
+        sse_connect=f"{url}?{urlencode([('topic', t) for t in topics])}",
+        sse_swap=LIVE_EVENT,
+        hx_swap="none",
+        style="display: none;",
+        **kwargs,
+    )
+
+
+async def live_endpoint(request: Request) -> Response:
+    """Starlette endpoint streaming the ``topic`` query parameters from ``broadcast_hub``."""
+    topics = request.query_params.getlist("topic")
+    if not topics:
+        return Response("Missing topic", status_code=400)
+    return StreamingResponse(
+        broadcast_hub.stream(topics),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
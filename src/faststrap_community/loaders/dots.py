@@ -2,8 +2,8 @@
 
 from fasthtml.common import Div
 from faststrap.core.base import merge_classes
-from faststrap.core.theme import resolve_defaults
 
+from ..defaults import resolve_community_defaults
 from ..registry import register_component
 
 
@@ -14,8 +14,8 @@ def DotsLoader(variant: str = None, **kwargs) -> Div:
         variant: Bootstrap variant color (default: primary)
         **kwargs: Additional attributes
     """
-    cfg = resolve_defaults("DotsLoader", variant=variant)
-    v = cfg.get("variant") or "primary"
+    defaults = resolve_community_defaults("DotsLoader")
+    v = variant or defaults.get("variant") or "primary"
 
     user_cls = kwargs.pop("cls", "")
     container_cls = merge_classes("fs-comm-dots-loader", user_cls)
@@ -31,4 +31,4 @@ def DotsLoader(variant: str = None, **kwargs) -> Div:
     return Div(*dots, cls=container_cls, **kwargs)
 
 
-register_component("DotsLoader", DotsLoader)
+register_component("DotsLoader", DotsLoader, css_classes=("fs-comm-dots-loader",))
@@ -17,4 +17,4 @@ def PolygonLoader(**kwargs) -> Div:
     return Div(cls=cls, **kwargs)
 
 
-register_component("PolygonLoader", PolygonLoader)
+register_component("PolygonLoader", PolygonLoader, css_classes=("fs-comm-polygon-loader",))
@@ -0,0 +1,55 @@
+"""LazyFragment component - Placeholder that loads its content when scrolled into view."""
+
+from typing import Any
+
+from fasthtml.common import Div
+from faststrap.core.base import merge_classes
+
+from ..registry import register_component
+from .skeleton import SkeletonLoader
+
+
+def LazyFragment(
+    url: str,
+    skeleton: Any = None,
+    trigger: str = "intersect once",
+    swap: str = "outerHTML",
+    **kwargs,
+) -> Div:
+    """Placeholder that fetches its real content with HTMX once it becomes visible.
+
+    The page ships only the placeholder; the fragment at ``url`` is requested
+    when the placeholder enters the viewport, so panels nobody scrolls to are
+    never computed. Pair the route with ``cache_fragment`` to reuse rendered
+    fragments across requests.
+
+    Args:
+        url: URL returning the fragment
+        skeleton: Placeholder shown until the fragment arrives (default:
+            ``SkeletonLoader()``); any loader component works
+        trigger: HTMX trigger, e.g. ``"intersect once"`` (default),
+            ``"revealed"`` or ``"load"``
+        swap: HTMX swap strategy; the default replaces the placeholder
+        **kwargs: Additional HTML attributes
+
+    Example:
+        >>> LazyFragment("/dashboard/revenue", skeleton=SkeletonLoader(lines=5))
+    """
+    if skeleton is None:
+        skeleton = SkeletonLoader()
+
+    user_cls = kwargs.pop("cls", "")
+    container_cls = merge_classes("fs-comm-lazy-fragment", user_cls)
+
+    return Div(
+        skeleton,
+        hx_get=url,
+        hx_trigger=trigger,
+        hx_swap=swap,
+        aria_busy="true",
+        cls=container_cls,
+        **kwargs,
+    )
+
+
+register_component("LazyFragment", LazyFragment)
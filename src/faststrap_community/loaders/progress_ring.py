@@ -1,10 +1,20 @@
 """ProgressRing component - Circular progress indicator."""
 
+from urllib.parse import quote
+
 from fasthtml.common import Circle, Div, Svg
 from faststrap.core.base import merge_classes
 
-from ..defaults import get_community_defaults
+from ..defaults import resolve_community_defaults
+from ..progress import (
+    PROGRESS_ROUTE,
+    RING_CIRCUMFERENCE,
+    RING_RADIUS,
+    progress_store,
+    ring_progress,
+)
 from ..registry import register_component
+from ..scripts import require_script
 
 
 def ProgressRing(
@@ -28,17 +38,11 @@ def ProgressRing(
     Example:
         >>> ProgressRing(value=75, variant="success")
     """
-    defaults = get_community_defaults("ProgressRing")
+    defaults = resolve_community_defaults("ProgressRing")
     s = size or defaults.get("size", "4rem")
     v = variant or defaults.get("variant", "primary")
 
-    # Calculate percentage
-    percentage = min(100, max(0, (value / max_value) * 100))
-
-    # SVG circle math
-    radius = 45
-    circumference = 2 * 3.14159 * radius
-    stroke_offset = circumference - (percentage / 100) * circumference
+    percentage, stroke_offset = ring_progress(value, max_value)
 
     user_cls = kwargs.pop("cls", "")
     container_cls = merge_classes("fs-comm-progress-ring", user_cls)
@@ -49,7 +53,7 @@ def ProgressRing(
         Circle(
             cx="50",
             cy="50",
-            r=str(radius),
+            r=str(RING_RADIUS),
             fill="none",
             stroke="var(--bs-border-color)",
             stroke_width="8",
@@ -58,15 +62,16 @@ def ProgressRing(
         Circle(
             cx="50",
             cy="50",
-            r=str(radius),
+            r=str(RING_RADIUS),
             fill="none",
             stroke=f"var(--bs-{v})",
             stroke_width="8",
-            stroke_dasharray=str(circumference),
+            stroke_dasharray=str(RING_CIRCUMFERENCE),
             stroke_dashoffset=str(stroke_offset),
             stroke_linecap="round",
             transform="rotate(-90 50 50)",
             style="transition: stroke-dashoffset 0.3s ease;",
+            cls="fs-comm-progress-ring-bar",
         ),
         viewBox="0 0 100 100",
         style=f"width: {s}; height: {s};",
@@ -77,7 +82,7 @@ def ProgressRing(
     if show_text:
         text_el = Div(
             f"{int(percentage)}%",
-            cls="position-absolute top-50 start-50 translate-middle fw-bold",
+            cls="fs-comm-progress-ring-label position-absolute top-50 start-50 translate-middle fw-bold",
             style="font-size: 0.875rem;",
         )
 
@@ -90,4 +95,34 @@ def ProgressRing(
     )
 
 
+def track(job_id: str, progress_url: str = PROGRESS_ROUTE, **kwargs) -> Div:
+    """ProgressRing that follows a background job's progress live.
+
+    Renders the job's current state and subscribes to its Server-Sent Events
+    stream; each event updates only the ring's offset and label. Jobs report
+    progress with ``set_progress(job_id, value)`` and ``finish_progress(job_id)``.
+    Requires ``setup_community(app)``, which mounts the stream route.
+
+    Args:
+        job_id: Job identifier (the job is created at 0 if it doesn't exist yet)
+        progress_url: URL prefix of the progress stream route
+        **kwargs: ProgressRing arguments other than ``value`` and ``max_value``
+
+    Example:
+        >>> ProgressRing.track("export-42", variant="success")
+    """
+    state = progress_store.start(job_id)
+    ring = ProgressRing(
+        value=state.value,
+        max_value=state.max_value,
+        data_fs_progress_src=f"{progress_url.rstrip('/')}/{quote(job_id, safe='')}",
+        **kwargs,
+    )
+    # The EventSource handling lives in a shared, idempotent page-level script
+    script = require_script("progress-ring")
+    return ring(script) if script is not None else ring
+
+
+ProgressRing.track = track
+
 register_component("ProgressRing", ProgressRing)
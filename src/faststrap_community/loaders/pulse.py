@@ -3,7 +3,7 @@
 from fasthtml.common import Div
 from faststrap.core.base import merge_classes
 
-from ..defaults import get_community_defaults
+from ..defaults import resolve_community_defaults
 from ..registry import register_component
 
 
@@ -18,7 +18,7 @@ def PulseLoader(variant: str = None, size: str = None, **kwargs) -> Div:
     Example:
         >>> PulseLoader(variant="success", size="lg")
     """
-    defaults = get_community_defaults("PulseLoader")
+    defaults = resolve_community_defaults("PulseLoader")
     v = variant or defaults.get("variant", "primary")
     s = size or defaults.get("size", "md")
 
@@ -31,4 +31,4 @@ def PulseLoader(variant: str = None, size: str = None, **kwargs) -> Div:
     return Div(circle, cls=container_cls, **kwargs)
 
 
-register_component("PulseLoader", PulseLoader)
+register_component("PulseLoader", PulseLoader, css_classes=("fs-comm-pulse-loader", "pulse-circle"))
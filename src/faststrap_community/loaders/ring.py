@@ -2,8 +2,8 @@
 
 from fasthtml.common import Div
 from faststrap.core.base import merge_classes
-from faststrap.core.theme import resolve_defaults
 
+from ..defaults import resolve_community_defaults
 from ..registry import register_component
 
 
@@ -15,9 +15,9 @@ def RingLoader(variant: str = None, size: str = None, **kwargs) -> Div:
         size: Size of the ring (default: 64px)
         **kwargs: Additional attributes
     """
-    cfg = resolve_defaults("RingLoader", variant=variant, size=size)
-    v = cfg.get("variant") or "primary"
-    s = cfg.get("size") or "64px"
+    defaults = resolve_community_defaults("RingLoader")
+    v = variant or defaults.get("variant") or "primary"
+    s = size or defaults.get("size") or "64px"
 
     user_cls = kwargs.pop("cls", "")
     user_style = kwargs.pop("style", "")
@@ -38,4 +38,4 @@ def RingLoader(variant: str = None, size: str = None, **kwargs) -> Div:
     return Div(*segments, cls=container_cls, style=final_style, **kwargs)
 
 
-register_component("RingLoader", RingLoader)
+register_component("RingLoader", RingLoader, css_classes=("fs-comm-ring-loader",))
@@ -1,10 +1,52 @@
 """SkeletonLoader component - Skeleton loading placeholder."""
 
-from fasthtml.common import Div
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any
+
+from fasthtml.common import FT, Div, NotStr, Span, to_xml
 from faststrap.core.base import merge_classes
 
-from ..defaults import get_community_defaults
+from .. import defaults as _defaults
+from ..defaults import resolve_community_defaults
 from ..registry import register_component
+from ..render_cache import _make_key, _resolve
+from ..scripts import script_scope
+
+_SKELETON_CACHE_SIZE = 256
+
+_SKELETONS: OrderedDict[tuple, NotStr] = OrderedDict()
+_SKELETONS_LOCK = threading.Lock()
+
+# Defaults version the cached skeletons were derived with
+_SKELETONS_VERSION = -1
+
+# Elements that render nothing visible or only load behavior
+_DROPPED_TAGS = frozenset({"script", "style", "link", "template", "noscript"})
+
+# Replaced by a shimmer block with the same classes and reserved size
+_MEDIA_TAGS = frozenset({"img", "video", "iframe", "canvas", "picture"})
+
+# Attributes that identify, link or activate an element; the copy must not
+_DROPPED_ATTRS = frozenset(
+    {
+        "id",
+        "for",
+        "name",
+        "href",
+        "src",
+        "srcset",
+        "sizes",
+        "alt",
+        "action",
+        "tabindex",
+        "autofocus",
+        "loading",
+        "decoding",
+    }
+)
+_DROPPED_PREFIXES = ("hx-", "sse-", "data-", "on")
 
 
 def SkeletonLoader(lines: int = None, avatar: bool = False, width: str = None, **kwargs) -> Div:
@@ -19,7 +61,7 @@ def SkeletonLoader(lines: int = None, avatar: bool = False, width: str = None, *
     Example:
         >>> SkeletonLoader(lines=4, avatar=True)
     """
-    defaults = get_community_defaults("SkeletonLoader")
+    defaults = resolve_community_defaults("SkeletonLoader")
     num_lines = lines or defaults.get("lines", 3)
     w = width or defaults.get("width", "100%")
 
@@ -41,4 +83,126 @@ def SkeletonLoader(lines: int = None, avatar: bool = False, width: str = None, *
     return Div(*elements, cls=container_cls, style=f"width: {w};", **kwargs)
 
 
-register_component("SkeletonLoader", SkeletonLoader)
+def _skeleton_attrs(attrs: dict[str, Any]) -> dict[str, Any]:
+    return {
+        k: v
+        for k, v in attrs.items()
+        if k not in _DROPPED_ATTRS and not k.startswith(_DROPPED_PREFIXES)
+    }
+
+
+def _media_block(el: FT) -> FT:
+    attrs = _skeleton_attrs(el.attrs)
+    if el.tag == "picture":
+        # The inner <img> carries the size; its style only holds the blurred placeholder
+        img = next((c for c in el.children if isinstance(c, FT) and c.tag == "img"), None)
+        if img is not None:
+            inner = _skeleton_attrs(img.attrs)
+            attrs["class"] = merge_classes(attrs.get("class", ""), inner.get("class", ""))
+            for dim in ("width", "height"):
+                if inner.get(dim) is not None:
+                    attrs[dim] = inner[dim]
+    style = attrs.pop("style", "")
+    # Reserve the size the element would take (width/height attributes are pixels)
+    for dim in ("width", "height"):
+        value = attrs.pop(dim, None)
+        if value is not None:
+            value = f"{value}px" if str(value).isdigit() else value
+            style = f"{dim}: {value}; {style}"
+    attrs["class"] = merge_classes("fs-comm-skeleton-block", attrs.get("class", ""))
+    return Span(style=style.strip() or None, **attrs)
+
+
+def _skeletonize(node: Any, in_svg: bool = False) -> Any:
+    """Copy of ``node`` with text masked, media blanked and behavior removed."""
+    if isinstance(node, FT):
+        tag = node.tag
+        if tag in _DROPPED_TAGS:
+            return None
+        if tag in _MEDIA_TAGS:
+            return _media_block(node)
+        in_svg = in_svg or tag == "svg"
+        children = [_skeletonize(child, in_svg) for child in node.children]
+        return FT(tag, tuple(c for c in children if c is not None), _skeleton_attrs(node.attrs))
+    if isinstance(node, (list, tuple)):
+        return tuple(_skeletonize(child, in_svg) for child in node)
+    if node is None or isinstance(node, NotStr):
+        # Pre-rendered HTML can't be inspected; leave its box empty
+        return None
+    text = str(node)
+    if in_svg or not text.strip():
+        # SVG text is hidden with CSS: HTML wrappers aren't valid there
+        return text
+    # The real text, made transparent: it wraps and sizes exactly like the content
+    return Span(text, cls="fs-comm-skeleton-text")
+
+
+def skeleton_for(component: Callable | str, **sample_args: Any) -> NotStr:
+    """Derive a loading placeholder with the same layout as a component.
+
+    The component is rendered once with ``sample_args`` and turned into a
+    skeleton of the same element tree: classes and inline sizes are kept, text
+    is kept but drawn as transparent shimmer bars (so it wraps and reserves
+    exactly the same space), images become shimmer blocks of the same size,
+    and ids, links, HTMX and script behavior are removed. Content swapped in
+    later lands in the box the skeleton already occupied, so the page doesn't
+    shift.
+
+    Skeletons are cached per component and arguments (and the active
+    defaults), so only the first call for a shape does any work.
+
+    Args:
+        component: Component function or registered component name
+        **sample_args: Arguments shaped like the real content (similar text
+            lengths, same optional parts)
+
+    Returns:
+        Pre-rendered HTML, usable anywhere in an FT tree
+
+    Example:
+        >>> LazyFragment(
+        ...     "/dashboard/revenue",
+        ...     skeleton=skeleton_for(StatCard, title="Revenue", value="$00,000", trend="+0%"),
+        ... )
+    """
+    global _SKELETONS_VERSION
+
+    fn = _resolve(component)
+    key = _make_key(fn, (), sample_args)
+    version = _defaults.get_defaults_version()
+    if key is not None:
+        with _SKELETONS_LOCK:
+            if version != _SKELETONS_VERSION:
+                _SKELETONS.clear()
+                _SKELETONS_VERSION = version
+            html = _SKELETONS.get(key)
+            if html is not None:
+                _SKELETONS.move_to_end(key)
+                return html
+
+    # Own scope: the sample's script tags are dropped, so they must not count
+    # as emitted for the real components rendered later on the page
+    with script_scope():
+        skeleton = _skeletonize(fn(**sample_args))
+    if isinstance(skeleton, FT):
+        skeleton.attrs["class"] = merge_classes("fs-comm-skeleton", skeleton.attrs.get("class", ""))
+        skeleton.attrs.update({"aria-hidden": "true", "inert": True})
+    else:
+        skeleton = Div(skeleton, cls="fs-comm-skeleton", aria_hidden="true", inert=True)
+    # Unindented: whitespace added by pretty-printing would widen inline boxes
+    html = NotStr(to_xml(skeleton, indent=False))
+
+    if key is not None:
+        with _SKELETONS_LOCK:
+            if version == _SKELETONS_VERSION:
+                _SKELETONS[key] = html
+                while len(_SKELETONS) > _SKELETON_CACHE_SIZE:
+                    _SKELETONS.popitem(last=False)
+    return html
+
+
+register_component(
+    "SkeletonLoader",
+    SkeletonLoader,
+    css_classes=("fs-comm-skeleton-loader", "fs-comm-skeleton", "skeleton-avatar", "skeleton-line"),
+)
@@ -30,5 +30,5 @@ def ShadowLoader(text: str = "Loading...", **kwargs) -> Div:
     return Div(cls=cls, data_text=text, **kwargs)
 
 
-register_component("TypewriterLoader", TypewriterLoader)
-register_component("ShadowLoader", ShadowLoader)
+register_component("TypewriterLoader", TypewriterLoader, css_classes=("fs-comm-typewriter-loader",))
+register_component("ShadowLoader", ShadowLoader, css_classes=("fs-comm-shadow-loader",))
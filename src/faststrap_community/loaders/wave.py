@@ -3,7 +3,7 @@
 from fasthtml.common import Div
 from faststrap.core.base import merge_classes
 
-from ..defaults import get_community_defaults
+from ..defaults import resolve_community_defaults
 from ..registry import register_component
 
 
@@ -17,7 +17,7 @@ def WaveLoader(variant: str = None, **kwargs) -> Div:
     Example:
         >>> WaveLoader(variant="info")
     """
-    defaults = get_community_defaults("WaveLoader")
+    defaults = resolve_community_defaults("WaveLoader")
     v = variant or defaults.get("variant", "primary")
 
     user_cls = kwargs.pop("cls", "")
@@ -32,4 +32,4 @@ def WaveLoader(variant: str = None, **kwargs) -> Div:
     return Div(*bars, cls=container_cls, **kwargs)
 
 
-register_component("WaveLoader", WaveLoader)
+register_component("WaveLoader", WaveLoader, css_classes=("fs-comm-wave-loader", "wave-bar"))
@@ -0,0 +1,302 @@
+"""Opt-in render metrics for community components.
+
+``enable_metrics()`` (or ``setup_community(app, metrics=True)``) replaces every
+component registered through ``register_component`` with a wrapper that
+records, per component, the number of calls, the render time and the size of
+the rendered HTML. ``disable_metrics()`` puts the original functions back, so
+with metrics off components are called directly: there is no wrapper and no
+"is it enabled?" check per call.
+
+Only the outermost instrumented call on a thread is sized, so a component
+built by another one isn't counted again inside its parent. Results holding
+``Lazy`` children are not sized at all: serializing them would run the
+deferred work early. The size of the HTML actually sent is measured once per
+response by ``ResponseSizeMiddleware``.
+
+Samples go to per-thread counters that are only merged when read, so render
+threads never contend on a lock. ``metrics_endpoint`` serves the totals in the
+Prometheus text format.
+
+Components are swapped in the registry, in their defining module and on the
+package. A name imported with ``from faststrap_community import StatCard``
+before metrics are enabled keeps the original function, so enable metrics at
+startup before importing components by name.
+"""
+
+import sys
+import threading
+import time
+from collections.abc import Callable
+from functools import wraps
+from typing import Any
+
+from fastcore.xml import FT
+from fasthtml.common import to_xml
+from starlette.datastructures import Headers
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from . import registry
+from .streaming import Lazy
+
+METRICS_ROUTE = "/community-metrics"
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+QUANTILES = (0.5, 0.9, 0.99)
+
+# Recent render times kept per component and thread for the quantiles
+_WINDOW = 1024
+
+_ORIGINALS: dict[str, Any] = {}
+_LOCK = threading.Lock()
+_THREAD_STATS: list[dict[str, "_Stats"]] = []
+# kind ("page" or "fragment") -> [responses, body bytes]
+_RESPONSES: dict[str, list[int]] = {}
+_local = threading.local()
+
+
+class _Stats:
+    """Counters for one component in one thread."""
+
+    __slots__ = ("calls", "seconds", "bytes", "window", "pos")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.seconds = 0.0
+        self.bytes = 0
+        self.window: list[float] = []
+        self.pos = 0
+
+    def add(self, seconds: float, size: int) -> None:
+        self.calls += 1
+        self.seconds += seconds
+        self.bytes += size
+        if len(self.window) < _WINDOW:
+            self.window.append(seconds)
+        else:
+            self.window[self.pos] = seconds
+            self.pos = (self.pos + 1) % _WINDOW
+
+
+def _thread_stats() -> dict[str, _Stats]:
+    try:
+        return _local.stats
+    except AttributeError:
+        stats: dict[str, _Stats] = {}
+        _local.stats = stats
+        with _LOCK:
+            _THREAD_STATS.append(stats)
+        return stats
+
+
+def _has_lazy(result: Any) -> bool:
+    """Whether an FT tree holds ``Lazy`` children (which serializing would consume)."""
+    stack = [result]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, Lazy):
+            return True
+        if isinstance(node, FT):
+            stack.extend(node.children)
+        elif isinstance(node, (list, tuple)):
+            stack.extend(node)
+    return False
+
+
+def _instrument(name: str, component: Callable) -> Callable:
+    @wraps(component)
+    def instrumented(*args: Any, **kwargs: Any) -> Any:
+        depth = getattr(_local, "depth", 0)
+        _local.depth = depth + 1
+        start = time.perf_counter()
+        try:
+            result = component(*args, **kwargs)
+        finally:
+            _local.depth = depth
+        elapsed = time.perf_counter() - start
+        # Nested calls are part of their parent's HTML
+        size = len(to_xml(result)) if depth == 0 and not _has_lazy(result) else 0
+        stats = _thread_stats()
+        entry = stats.get(name)
+        if entry is None:
+            entry = stats[name] = _Stats()
+        entry.add(elapsed, size)
+        return result
+
+    return instrumented
+
+
+def _publish(name: str, old: Any, new: Any) -> None:
+    """Replace ``old`` with ``new`` wherever the package exposes it by name."""
+    for module_name in (getattr(old, "__module__", None), registry.__package__):
+        module = sys.modules.get(module_name or "")
+        if module is not None and module.__dict__.get(name) is old:
+            setattr(module, name, new)
+
+
+def _swap_in(name: str, component: Any) -> Any:
+    """Registry hook: instrument a component as it is registered."""
+    instrumented = _instrument(name, component)
+    _ORIGINALS[name] = component
+    _publish(name, component, instrumented)
+    return instrumented
+
+
+def metrics_enabled() -> bool:
+    """Whether components are currently instrumented."""
+    return registry._COMPONENT_WRAPPER is _swap_in
+
+
+def enable_metrics() -> None:
+    """Instrument all registered components, and those registered later."""
+    with _LOCK:
+        if metrics_enabled():
+            return
+        registry._COMPONENT_WRAPPER = _swap_in
+        for name, component in list(registry._COMMUNITY_COMPONENTS.items()):
+            registry._COMMUNITY_COMPONENTS[name] = _swap_in(name, component)
+
+
+def disable_metrics() -> None:
+    """Restore the original, uninstrumented components. Collected samples are kept."""
+    with _LOCK:
+        registry._COMPONENT_WRAPPER = None
+        for name, original in _ORIGINALS.items():
+            current = registry._COMMUNITY_COMPONENTS.get(name)
+            if current is not None and getattr(current, "__wrapped__", None) is original:
+                registry._COMMUNITY_COMPONENTS[name] = original
+                _publish(name, current, original)
+        _ORIGINALS.clear()
+
+
+def reset_metrics() -> None:
+    """Discard all collected samples."""
+    with _LOCK:
+        for stats in _THREAD_STATS:
+            stats.clear()
+        _RESPONSES.clear()
+
+
+class ResponseSizeMiddleware:
+    """ASGI middleware counting HTML responses and the body bytes sent for them.
+
+    Responses are split into full pages and HTMX fragments (``HX-Request``).
+    Added by ``setup_community(app, metrics=True)``.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        kind = "fragment" if Headers(scope=scope).get("hx-request") else "page"
+        html = False
+        size = 0
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal html, size
+            if message["type"] == "http.response.start":
+                content_type = Headers(raw=message["headers"]).get("content-type", "")
+                html = content_type.startswith("text/html")
+            elif html and message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+                if not message.get("more_body", False):
+                    with _LOCK:
+                        total = _RESPONSES.setdefault(kind, [0, 0])
+                        total[0] += 1
+                        total[1] += size
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+
+def _quantile(ordered: list[float], q: float) -> float:
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def get_metrics() -> dict[str, dict[str, Any]]:
+    """Return the merged metrics of every component that was called.
+
+    Returns:
+        Mapping of component name to ``calls``, ``seconds`` (cumulative),
+        ``bytes`` (cumulative HTML size of outermost calls) and ``quantiles``
+        (render seconds over the most recent calls, keyed by quantile)
+    """
+    merged: dict[str, dict[str, Any]] = {}
+    with _LOCK:
+        thread_stats = list(_THREAD_STATS)
+    for stats in thread_stats:
+        for name, entry in list(stats.items()):
+            total = merged.setdefault(name, {"calls": 0, "seconds": 0.0, "bytes": 0, "window": []})
+            total["calls"] += entry.calls
+            total["seconds"] += entry.seconds
+            total["bytes"] += entry.bytes
+            total["window"].extend(entry.window)
+
+    for total in merged.values():
+        window = sorted(total.pop("window"))
+        total["quantiles"] = {q: _quantile(window, q) for q in QUANTILES} if window else {}
+    return dict(sorted(merged.items()))
+
+
+def get_response_metrics() -> dict[str, dict[str, int]]:
+    """Return the HTML responses counted by ``ResponseSizeMiddleware``.
+
+    Returns:
+        Mapping of ``"page"`` / ``"fragment"`` to ``responses`` and ``bytes``
+        (cumulative body size as sent)
+    """
+    with _LOCK:
+        return {
+            kind: {"responses": responses, "bytes": size}
+            for kind, (responses, size) in sorted(_RESPONSES.items())
+        }
+
+
+def render_prometheus() -> str:
+    """Render the component metrics in the Prometheus text exposition format."""
+    metrics = get_metrics()
+    lines = [
+        "# HELP faststrap_community_render_seconds Community component render time.",
+        "# TYPE faststrap_community_render_seconds summary",
+    ]
+    for name, m in metrics.items():
+        for q, value in m["quantiles"].items():
+            lines.append(
+                f'faststrap_community_render_seconds{{component="{name}",quantile="{q}"}} {value!r}'
+            )
+        lines.append(
+            f'faststrap_community_render_seconds_sum{{component="{name}"}} {m["seconds"]!r}'
+        )
+        lines.append(f'faststrap_community_render_seconds_count{{component="{name}"}} {m["calls"]}')
+
+    lines += [
+        "# HELP faststrap_community_render_bytes_total Community component HTML output size.",
+        "# TYPE faststrap_community_render_bytes_total counter",
+    ]
+    for name, m in metrics.items():
+        lines.append(f'faststrap_community_render_bytes_total{{component="{name}"}} {m["bytes"]}')
+
+    responses = get_response_metrics()
+    lines += [
+        "# HELP faststrap_community_html_responses_total HTML responses sent.",
+        "# TYPE faststrap_community_html_responses_total counter",
+    ]
+    for kind, r in responses.items():
+        lines.append(f'faststrap_community_html_responses_total{{kind="{kind}"}} {r["responses"]}')
+    lines += [
+        "# HELP faststrap_community_html_response_bytes_total HTML response body size as sent.",
+        "# TYPE faststrap_community_html_response_bytes_total counter",
+    ]
+    for kind, r in responses.items():
+        lines.append(f'faststrap_community_html_response_bytes_total{{kind="{kind}"}} {r["bytes"]}')
+    return "\n".join(lines) + "\n"
+
+
+async def metrics_endpoint(request: Request) -> Response:
+    """Starlette endpoint serving ``render_prometheus()``."""
+    return Response(render_prometheus(), media_type=PROMETHEUS_CONTENT_TYPE)
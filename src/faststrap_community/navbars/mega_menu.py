@@ -52,5 +52,5 @@ def MegaMenuItem(label: str, content: Any, **kwargs) -> Li:
     return Li(toggle, menu, cls="nav-item dropdown fs-comm-mega-menu", **kwargs)
 
 
-register_component("MegaMenuNavbar", MegaMenuNavbar)
+register_component("MegaMenuNavbar", MegaMenuNavbar, css_classes=("fs-comm-mega-menu",))
 register_component("MegaMenuItem", MegaMenuItem)
@@ -52,4 +52,6 @@ def MorphingToggler(target_id: str, **kwargs) -> Button:
     )
 
 
-register_component("MorphingToggler", MorphingToggler)
+register_component(
+    "MorphingToggler", MorphingToggler, css_classes=("fs-comm-morph-toggler", "fs-comm-morph-span")
+)
@@ -1,8 +1,8 @@
 """SlideMenuNavbar component for Faststrap Community."""
 
 from fasthtml.common import H4, A, Button, Div, Li, Ul
-from faststrap.core.theme import resolve_defaults
 
+from ..defaults import resolve_community_defaults
 from ..registry import register_component
 
 
@@ -15,8 +15,8 @@ def SlideMenuNavbar(items: list, brand: str = None, menu_id: str = None, **kwarg
         menu_id: Unique ID for the menu (default: slide-menu)
         **kwargs: Additional attributes
     """
-    cfg = resolve_defaults("SlideMenuNavbar", menu_id=menu_id)
-    mid = cfg.get("menu_id") or "slide-menu"
+    defaults = resolve_community_defaults("SlideMenuNavbar")
+    mid = menu_id or defaults.get("menu_id") or "slide-menu"
 
     # Overlay to close menu on click outside
     overlay = Div(cls="fs-comm-slide-overlay", id=f"{mid}-overlay")
@@ -53,5 +53,7 @@ def SlideToggler(target_id: str, **kwargs) -> Button:
     return Button("Open Menu", cls="btn btn-outline-primary", onclick=js_toggle, **kwargs)
 
 
-register_component("SlideMenuNavbar", SlideMenuNavbar)
+register_component(
+    "SlideMenuNavbar", SlideMenuNavbar, css_classes=("fs-comm-slide-menu", "fs-comm-slide-overlay")
+)
 register_component("SlideToggler", SlideToggler)
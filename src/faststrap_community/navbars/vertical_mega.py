@@ -2,20 +2,54 @@
 
 from typing import Any
 
-from fasthtml.common import A, Div, Li, NotStr, Small, Ul
+from fasthtml.common import FT, A, Div, Li, NotStr, Small, Ul, to_xml
 from faststrap import Icon
 from faststrap.core.base import merge_classes
+from starlette.requests import Request
+from starlette.responses import HTMLResponse, Response
 
 from ..registry import register_component
 
+# URL prefix of the route serving lazily loaded subtrees (see setup_community)
+MENU_ROUTE = "/community-menu"
 
-def _render_menu_item(item: dict[str, Any]) -> Li:
-    """Recursive helper to render menu items."""
+# Menus that load deep branches on demand: menu_id -> (items, max_depth, subtree url)
+_MENUS: dict[str, tuple[list[dict[str, Any]], int, str]] = {}
+
+
+def register_menu(
+    menu_id: str,
+    items: list[dict[str, Any]],
+    max_depth: int,
+    menu_url: str = MENU_ROUTE,
+) -> None:
+    """Register a menu whose branches below ``max_depth`` are served on demand.
+
+    Call it at application startup (module level), not while handling a
+    request: every worker process then serves the menu's subtree route,
+    including right after a restart.
+
+    Args:
+        menu_id: Identifier used in the subtree URL
+        items: Menu items (same structure as ``VerticalMegaMenu``)
+        max_depth: Number of levels rendered up front and per loaded branch
+        menu_url: URL prefix of the subtree route (default: /community-menu)
+
+    Example:
+        >>> register_menu("catalog", load_category_tree(), max_depth=2)
+        >>> VerticalMegaMenu(menu_id="catalog")
+    """
+    if max_depth < 1:
+        raise ValueError("max_depth must be at least 1")
+    _MENUS[menu_id] = (items, max_depth, f"{menu_url.rstrip('/')}/{menu_id}")
+
+
+def _render_link(item: dict[str, Any]) -> A:
+    """Render the link of a single menu item."""
     label = item.get("label", "")
     icon_name = item.get("icon", "")
     subtitle = item.get("subtitle", "")
     href = item.get("href", "#")
-    children = item.get("children", [])
     active = item.get("active", False)
 
     # Icon
@@ -32,21 +66,77 @@ def _render_menu_item(item: dict[str, Any]) -> Li:
 
     # Link
     link_cls = "active" if active else ""
-    link = A(icon, *text_content, href=href, cls=link_cls)
-
-    # Children (Submenu)
-    submenu = ""
-    if children:
-        submenu = Ul(*[_render_menu_item(child) for child in children])
-
-    return Li(link, submenu)
-
-
-def VerticalMegaMenu(items: list[dict[str, Any]], width: str = "250px", **kwargs) -> Ul:
+    return A(icon, *text_content, href=href, cls=link_cls)
+
+
+def _lazy_submenu(url: str, path: tuple[int, ...]) -> Ul:
+    """Placeholder submenu that fetches its branch the first time it is opened."""
+    trigger = "mouseenter once from:closest li, focusin once from:closest li"
+    return Ul(
+        Li(Small("Loading…"), cls="fs-comm-menu-loading"),
+        hx_get=f"{url}?path={'.'.join(map(str, path))}",
+        hx_trigger=trigger,
+        hx_swap="outerHTML",
+        aria_busy="true",
+    )
+
+
+def _render_menu_items(
+    items: list[dict[str, Any]],
+    max_depth: int | None = None,
+    url: str | None = None,
+    base_path: tuple[int, ...] = (),
+) -> list[Li]:
+    """Render menu items iteratively, without recursing into each child.
+
+    Items nested deeper than ``max_depth`` levels are replaced by a placeholder
+    submenu fetching ``url`` when ``url`` is given, and omitted otherwise.
+    """
+    rendered: list[Any] = [None] * len(items)
+    # Pre-order list of (output list, index, item, rendered children, path)
+    order: list[tuple[list[Any], int, dict[str, Any], list[Any] | None, tuple[int, ...]]] = []
+    stack = [(items, rendered, 1, base_path)]
+
+    while stack:
+        siblings, out, depth, path = stack.pop()
+        for i, item in enumerate(siblings):
+            item_path = (*path, i)
+            children = item.get("children") or []
+            kids = None
+            if children and (max_depth is None or depth < max_depth):
+                kids = [None] * len(children)
+                stack.append((children, kids, depth + 1, item_path))
+            order.append((out, i, item, kids, item_path))
+
+    # Children always come after their parent in pre-order, so building in
+    # reverse finishes every submenu before the item that contains it.
+    for out, i, item, kids, path in reversed(order):
+        submenu = ""
+        if kids is not None:
+            submenu = Ul(*kids)
+        elif item.get("children") and url:
+            submenu = _lazy_submenu(url, path)
+        out[i] = Li(_render_link(item), submenu)
+
+    return rendered
+
+
+def VerticalMegaMenu(
+    items: list[dict[str, Any]] | None = None,
+    width: str = "250px",
+    max_depth: int | None = None,
+    menu_id: str | None = None,
+    **kwargs,
+) -> Ul:
     """
     A vertical mega menu with multi-level dropdowns.
     Modernized CSS-only implementation.
 
+    Large catalogs can limit the rendered depth with ``max_depth``. Branches
+    of a menu registered with ``register_menu()`` are then loaded with HTMX
+    when their parent is first hovered or focused, from the route mounted by
+    ``setup_community()``.
+
     Args:
         items: List of dictionary items. Structure:
                {
@@ -56,15 +146,86 @@ def VerticalMegaMenu(items: list[dict[str, Any]], width: str = "250px", **kwargs
                    "href": "#",
                    "children": [...]
                }
+               Defaults to the items of the registered ``menu_id``.
         width: Width of the menu (default: 250px)
+        max_depth: Number of levels to render up front (default: all levels,
+            or the registered menu's depth). Requires ``menu_id``, which serves
+            the deeper levels
+        menu_id: Menu registered with ``register_menu()``; branches below
+            ``max_depth`` are loaded on demand from its subtree route
         **kwargs: Additional attributes
+
+    Raises:
+        ValueError: If ``menu_id`` is not registered, or ``max_depth`` is given
+            without a ``menu_id``
+
+    Example:
+        >>> register_menu("catalog", catalog, max_depth=2)  # at startup
+        >>> VerticalMegaMenu(menu_id="catalog")
     """
+    url = None
+    if menu_id is not None:
+        menu = _MENUS.get(menu_id)
+        if menu is None:
+            raise ValueError(f"Menu {menu_id!r} is not registered; call register_menu() at startup")
+        if items is None:
+            items = menu[0]
+        if max_depth is None:
+            max_depth = menu[1]
+        url = menu[2]
+    elif max_depth is not None:
+        # Without a subtree route the branches below max_depth could never be shown
+        raise ValueError("max_depth needs a menu_id registered with register_menu()")
+    if items is None:
+        raise ValueError("VerticalMegaMenu() needs items or a registered menu_id")
+    if max_depth is not None and max_depth < 1:
+        raise ValueError("max_depth must be at least 1")
+
     cls = merge_classes("fs-comm-vertical-mega", kwargs.pop("cls", ""))
     style = f"width: {width}; {kwargs.pop('style', '')}"
 
-    menu_items = [_render_menu_item(item) for item in items]
+    menu_items = _render_menu_items(items, max_depth, url)
 
     return Ul(*menu_items, cls=cls, style=style, **kwargs)
 
 
-register_component("VerticalMegaMenu", VerticalMegaMenu)
+def render_menu_subtree(menu_id: str, path: str) -> FT | None:
+    """Render the submenu at ``path`` (dot-separated child indexes) of a registered menu.
+
+    The branch is rendered ``max_depth`` levels deep, with placeholders below.
+
+    Returns:
+        The submenu, or None if the menu or path does not exist
+    """
+    menu = _MENUS.get(menu_id)
+    if menu is None:
+        return None
+    items, max_depth, url = menu
+
+    try:
+        indexes = tuple(int(i) for i in path.split("."))
+        node: dict[str, Any] = {"children": items}
+        for i in indexes:
+            if i < 0:
+                return None
+            node = node["children"][i]
+    except (ValueError, IndexError, KeyError, TypeError):
+        return None
+
+    children = node.get("children") or []
+    if not children:
+        return None
+    return Ul(*_render_menu_items(children, max_depth, url, indexes))
+
+
+async def menu_subtree_endpoint(request: Request) -> Response:
+    """Starlette endpoint serving lazily loaded VerticalMegaMenu branches."""
+    submenu = render_menu_subtree(
+        request.path_params["menu_id"], request.query_params.get("path", "")
+    )
+    if submenu is None:
+        return Response(status_code=404)
+    return HTMLResponse(to_xml(submenu))
+
+
+register_component("VerticalMegaMenu", VerticalMegaMenu, css_classes=("fs-comm-vertical-mega",))
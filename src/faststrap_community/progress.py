@@ -0,0 +1,287 @@
+"""In-process job progress store and server push for ProgressRing.
+
+Background jobs report progress with ``set_progress(job_id, value)``;
+``ProgressRing.track(job_id)`` renders a ring that subscribes to
+``/community-progress/{job_id}`` over Server-Sent Events. Each event carries
+only the new ``stroke-dashoffset`` and label (``"141.37 50%"``), which the
+``progress-ring`` script applies to the existing SVG.
+
+Work scales with visible changes, not with watchers or update frequency:
+
+- An update that doesn't change the rendered offset or label is not
+  published at all, and the event payload is built once per published
+  version and shared by every subscriber.
+- Subscribers sleep on a future until the job's version changes; nothing
+  polls.
+- Each connection sends at most one event per ``PROGRESS_MIN_INTERVAL``;
+  updates in between are coalesced into the latest state.
+
+Jobs don't accumulate: a finished job is forgotten ``PROGRESS_FINISHED_TTL``
+seconds after ``finish()`` (late subscribers still see it complete), and an
+unfinished one once nothing has updated or watched it for ``PROGRESS_IDLE_TTL``
+seconds, which covers rings rendered for jobs that never report.
+"""
+
+import asyncio
+import threading
+import time
+from collections.abc import AsyncIterator
+from typing import NamedTuple
+
+from starlette.requests import Request
+from starlette.responses import Response, StreamingResponse
+
+PROGRESS_ROUTE = "/community-progress"
+
+# Seconds between two events sent to the same client
+PROGRESS_MIN_INTERVAL = 0.25
+
+# Seconds of silence after which a comment is sent to keep proxies from closing the stream
+PROGRESS_KEEPALIVE = 15.0
+
+# Seconds a finished job stays readable
+PROGRESS_FINISHED_TTL = 60.0
+
+# Seconds after which an unfinished job nobody updates or watches is forgotten
+PROGRESS_IDLE_TTL = 600.0
+
+# Seconds between two scans for expired jobs
+_SWEEP_INTERVAL = 1.0
+
+# ProgressRing SVG geometry (r=45 in a 100x100 viewBox)
+RING_RADIUS = 45
+RING_CIRCUMFERENCE = 2 * 3.14159 * RING_RADIUS
+
+_DONE_EVENT = b"event: done\ndata: \n\n"
+_KEEPALIVE_EVENT = b": keepalive\n\n"
+
+
+def ring_progress(value: float, max_value: float = 100) -> tuple[float, float]:
+    """Return ``(percentage, stroke_dashoffset)`` for a ProgressRing value."""
+    percentage = min(100, max(0, (value / max_value) * 100))
+    return percentage, RING_CIRCUMFERENCE - (percentage / 100) * RING_CIRCUMFERENCE
+
+
+class ProgressState(NamedTuple):
+    """Published state of a job."""
+
+    value: float
+    max_value: float
+    percentage: float
+    done: bool
+    version: int
+    event: bytes  # SSE message shared by every subscriber
+
+
+def _state(value: float, max_value: float, done: bool, version: int) -> ProgressState:
+    percentage, offset = ring_progress(value, max_value)
+    event = f"event: progress\ndata: {offset:.2f} {int(percentage)}%\n\n".encode()
+    return ProgressState(value, max_value, percentage, done, version, event)
+
+
+class ProgressStore:
+    """Thread-safe store of job progress with async change notification.
+
+    Jobs may update it from any thread; subscribers wait on the event loop
+    that serves their connection. Expired jobs are dropped while the store is
+    written to (see the module docstring).
+
+    Args:
+        finished_ttl: Seconds a finished job is kept
+        idle_ttl: Seconds an unfinished job without updates or subscribers is kept
+    """
+
+    def __init__(
+        self, finished_ttl: float = PROGRESS_FINISHED_TTL, idle_ttl: float = PROGRESS_IDLE_TTL
+    ) -> None:
+        self.finished_ttl = finished_ttl
+        self.idle_ttl = idle_ttl
+        self._jobs: dict[str, ProgressState] = {}
+        self._waiters: dict[str, set[tuple[asyncio.AbstractEventLoop, asyncio.Future]]] = {}
+        # job_id -> monotonic time of the last update or unsubscribe
+        self._touched: dict[str, float] = {}
+        self._subscribers: dict[str, int] = {}
+        self._next_sweep = 0.0
+        self._lock = threading.Lock()
+
+    def get(self, job_id: str) -> ProgressState | None:
+        """Return the current state of a job, or None if it is unknown."""
+        return self._jobs.get(job_id)
+
+    def start(self, job_id: str, max_value: float = 100) -> ProgressState:
+        """Create a job at zero progress unless it already exists."""
+        with self._lock:
+            self._sweep()
+            state = self._jobs.get(job_id)
+            if state is None:
+                state = self._jobs[job_id] = _state(0, max_value, False, 0)
+                self._touched[job_id] = time.monotonic()
+            return state
+
+    def update(
+        self, job_id: str, value: float, max_value: float | None = None, done: bool = False
+    ) -> ProgressState:
+        """Set a job's progress, notifying subscribers if the ring would change.
+
+        Args:
+            job_id: Job identifier
+            value: Current progress value
+            max_value: Maximum value (default: keep the job's current maximum, or 100)
+            done: Mark the job as finished; subscribers close their streams
+        """
+        with self._lock:
+            self._sweep()
+            self._touched[job_id] = time.monotonic()
+            current = self._jobs.get(job_id)
+            if max_value is None:
+                max_value = current.max_value if current else 100
+            version = current.version + 1 if current else 0
+            state = _state(value, max_value, done, version)
+            if current is not None and (current.event, current.done) == (state.event, done):
+                # Same offset and label: nothing to push
+                state = current._replace(value=value, max_value=max_value)
+                self._jobs[job_id] = state
+                return state
+            self._jobs[job_id] = state
+            self._notify(job_id)
+            return state
+
+    def finish(self, job_id: str) -> ProgressState:
+        """Mark a job as finished at its maximum value."""
+        state = self.get(job_id)
+        max_value = state.max_value if state else 100
+        return self.update(job_id, max_value, max_value, done=True)
+
+    def remove(self, job_id: str) -> None:
+        """Forget a job; its subscribers are closed."""
+        with self._lock:
+            self._drop(job_id)
+
+    def subscribe(self, job_id: str) -> None:
+        """Count a subscriber: the job isn't forgotten as idle while it has one."""
+        with self._lock:
+            self._subscribers[job_id] = self._subscribers.get(job_id, 0) + 1
+
+    def unsubscribe(self, job_id: str) -> None:
+        """Release a ``subscribe()``; the idle timeout restarts when the last one leaves."""
+        with self._lock:
+            count = self._subscribers.pop(job_id, 0) - 1
+            if count > 0:
+                self._subscribers[job_id] = count
+            if job_id in self._jobs:
+                self._touched[job_id] = time.monotonic()
+
+    def _drop(self, job_id: str) -> None:
+        self._touched.pop(job_id, None)
+        if self._jobs.pop(job_id, None) is not None:
+            self._notify(job_id)
+
+    def _sweep(self) -> None:
+        """Drop expired jobs (called with the lock held, at most every ``_SWEEP_INTERVAL``)."""
+        now = time.monotonic()
+        if now < self._next_sweep:
+            return
+        self._next_sweep = now + _SWEEP_INTERVAL
+        expired = []
+        for job_id, state in self._jobs.items():
+            age = now - self._touched.get(job_id, now)
+            if state.done:
+                if age >= self.finished_ttl:
+                    expired.append(job_id)
+            elif job_id not in self._subscribers and age >= self.idle_ttl:
+                expired.append(job_id)
+        for job_id in expired:
+            self._drop(job_id)
+
+    def _notify(self, job_id: str) -> None:
+        for loop, future in self._waiters.pop(job_id, ()):
+            try:
+                loop.call_soon_threadsafe(_wake, future)
+            except RuntimeError:
+                # The subscriber's loop is closed; nothing is waiting there anymore
+                pass
+
+    async def wait(self, job_id: str, version: int, timeout: float) -> ProgressState | None:
+        """Wait until a job's version differs from ``version`` (or ``timeout`` passes).
+
+        Returns:
+            The job's current state (unchanged after a timeout), or None if
+            the job doesn't exist
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            state = self._jobs.get(job_id)
+            if state is None or state.version != version:
+                return state
+            waiter = (loop, loop.create_future())
+            self._waiters.setdefault(job_id, set()).add(waiter)
+        try:
+            await asyncio.wait_for(waiter[1], timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            # Timed out or cancelled (client gone): stop waiting
+            with self._lock:
+                self._waiters.get(job_id, set()).discard(waiter)
+        return self._jobs.get(job_id)
+
+
+def _wake(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+progress_store = ProgressStore()
+
+
+def set_progress(job_id: str, value: float, max_value: float | None = None) -> ProgressState:
+    """Report progress of a job in the default store (see ``ProgressStore.update``)."""
+    return progress_store.update(job_id, value, max_value)
+
+
+def finish_progress(job_id: str) -> ProgressState:
+    """Mark a job in the default store as finished."""
+    return progress_store.finish(job_id)
+
+
+async def progress_events(
+    job_id: str,
+    store: ProgressStore | None = None,
+    min_interval: float = PROGRESS_MIN_INTERVAL,
+    keepalive: float = PROGRESS_KEEPALIVE,
+) -> AsyncIterator[bytes]:
+    """Yield SSE messages for a job until it finishes or is removed."""
+    store = store or progress_store
+    version = -1
+    store.subscribe(job_id)
+    try:
+        while True:
+            state = await store.wait(job_id, version, keepalive)
+            if state is None:
+                yield _DONE_EVENT
+                return
+            if state.version == version:
+                yield _KEEPALIVE_EVENT
+                continue
+
+            version = state.version
+            yield state.event
+            if state.done:
+                yield _DONE_EVENT
+                return
+            # Changes made meanwhile are picked up as one event on the next wait
+            await asyncio.sleep(min_interval)
+    finally:
+        store.unsubscribe(job_id)
+
+
+async def progress_endpoint(request: Request) -> Response:
+    """Starlette endpoint streaming a job's progress as Server-Sent Events."""
+    job_id = request.path_params["job_id"]
+    if progress_store.get(job_id) is None:
+        return Response(status_code=404)
+    return StreamingResponse(
+        progress_events(job_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
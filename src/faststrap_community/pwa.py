@@ -2,6 +2,8 @@
 
 from typing import Any
 
+from .assets import CSS_SOURCES, get_css_bundle
+
 
 def get_community_cache_urls(static_url: str = "/community-static") -> list[str]:
     """Get list of community assets to cache for PWA.
@@ -15,18 +17,13 @@ def get_community_cache_urls(static_url: str = "/community-static") -> list[str]
     Example:
         >>> urls = get_community_cache_urls()
         >>> print(urls)
-        ['/community-static/css/community-base.css', ...]
+        ['/community-static/css/community.3f9a2c81d0.css']
     """
     base = static_url.rstrip("/")
-    return [
-        f"{base}/css/community-base.css",
-        f"{base}/css/cards.css",
-        f"{base}/css/loaders.css",
-        f"{base}/css/navbars.css",
-        f"{base}/css/effects.css",
-        f"{base}/css/forms.css",
-        f"{base}/css/buttons.css",
-    ]
+    bundle = get_css_bundle()
+    if bundle:
+        return [f"{base}/{bundle}"]
+    return [f"{base}/{name}" for name in CSS_SOURCES]
 
 
 def setup_community_pwa(app: Any, static_url: str = "/community-static") -> Any:
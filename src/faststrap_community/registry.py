@@ -1,20 +1,157 @@
 """Registry for Faststrap Community components."""
 
+from collections.abc import Callable
+from importlib import import_module
 from typing import Any
 
 _COMMUNITY_COMPONENTS: dict[str, Any] = {}
 
+# Modules defining the built-in components. The package imports them on first
+# use, so lookups import the defining module when a component isn't registered yet.
+_COMPONENT_MODULES: dict[str, str] = {
+    # Cards
+    "FlipCard": ".cards.flip_card",
+    "GlowCard": ".cards.glow_card",
+    "PricingCard": ".cards.pricing_card",
+    "ProfileCard": ".cards.profile_card",
+    "RevealCard": ".cards.reveal_card",
+    "StatCard": ".cards.stat_card",
+    "TiltCard": ".cards.tilt_card",
+    "TimelineCard": ".cards.timeline_card",
+    # Loaders
+    "DotsLoader": ".loaders.dots",
+    "LazyFragment": ".loaders.lazy_fragment",
+    "PolygonLoader": ".loaders.geometric",
+    "ProgressRing": ".loaders.progress_ring",
+    "PulseLoader": ".loaders.pulse",
+    "RingLoader": ".loaders.ring",
+    "SkeletonLoader": ".loaders.skeleton",
+    "ShadowLoader": ".loaders.text",
+    "TypewriterLoader": ".loaders.text",
+    "WaveLoader": ".loaders.wave",
+    # Forms
+    "AnimatedInput": ".forms.animated_input",
+    "SearchBar": ".forms.search_bar",
+    "TagInput": ".forms.tag_input",
+    # Buttons
+    "FloatingActionButton": ".buttons.floating_action_button",
+    "GradientButton": ".buttons.gradient_button",
+    "IconButton": ".buttons.icon_button",
+    # Navigation
+    "MegaMenuItem": ".navbars.mega_menu",
+    "MegaMenuNavbar": ".navbars.mega_menu",
+    "MorphingToggler": ".navbars.morphing",
+    "SlideMenuNavbar": ".navbars.slide_menu",
+    "SlideToggler": ".navbars.slide_menu",
+    "VerticalMegaMenu": ".navbars.vertical_mega",
+    # Effects
+    "ParallaxSection": ".effects.parallax",
+    "ScrollReveal": ".effects.scroll_reveal",
+}
 
-def register_component(name: str, component: Any):
-    """Register a component with the community registry."""
+_ALL_LOADED = False
+
+# Set while render metrics are enabled: wraps components as they are registered
+# (see metrics.enable_metrics)
+_COMPONENT_WRAPPER: Callable[[str, Any], Any] | None = None
+
+# Component name -> CSS class roots it styles (e.g. "fs-comm-dots-loader")
+_COMPONENT_CSS_CLASSES: dict[str, tuple[str, ...]] = {}
+
+# Class token -> owning component (or None), filled lazily and bounded since
+# tokens come from page content
+_CLASS_OWNERS: dict[str, str | None] = {}
+_CLASS_OWNERS_MAXSIZE = 4096
+
+# Components seen in rendered content (see css_partitions.components_in)
+_USED_COMPONENTS: set[str] = set()
+
+
+def register_component(name: str, component: Any, css_classes: tuple[str, ...] = ()):
+    """Register a component with the community registry.
+
+    Args:
+        name: Component name
+        component: Component function
+        css_classes: Root CSS classes of the component's stylesheet rules. A
+            class belongs to the component if it equals a root or extends it
+            with a ``-suffix`` (``fs-comm-flip-card`` covers
+            ``fs-comm-flip-card-inner``); the longest matching root wins.
+    """
+    if _COMPONENT_WRAPPER is not None:
+        component = _COMPONENT_WRAPPER(name, component)
     _COMMUNITY_COMPONENTS[name] = component
+    if css_classes:
+        _COMPONENT_CSS_CLASSES[name] = tuple(css_classes)
+        _CLASS_OWNERS.clear()
+
+
+def load_component_module(name: str) -> Any:
+    """Import the module defining a built-in component and return the component."""
+    module = _COMPONENT_MODULES.get(name)
+    if module is not None and name not in _COMMUNITY_COMPONENTS:
+        import_module(module, __package__)
+    return _COMMUNITY_COMPONENTS.get(name)
+
+
+def _load_all_components() -> None:
+    """Import every built-in component module (needed to see all CSS classes)."""
+    global _ALL_LOADED
+    if not _ALL_LOADED:
+        for module in dict.fromkeys(_COMPONENT_MODULES.values()):
+            import_module(module, __package__)
+        _ALL_LOADED = True
 
 
 def list_components() -> list[str]:
     """Return a list of registered community components."""
-    return list(_COMMUNITY_COMPONENTS.keys())
+    return list(dict.fromkeys([*_COMPONENT_MODULES, *_COMMUNITY_COMPONENTS]))
 
 
 def get_component(name: str) -> Any:
     """Retrieve a component from the registry."""
-    return _COMMUNITY_COMPONENTS.get(name)
+    component = _COMMUNITY_COMPONENTS.get(name)
+    if component is None:
+        component = load_component_module(name)
+    return component
+
+
+def get_component_css_classes(name: str) -> tuple[str, ...]:
+    """Return the root CSS classes registered for a component."""
+    load_component_module(name)
+    return _COMPONENT_CSS_CLASSES.get(name, ())
+
+
+def find_component_by_class(css_class: str) -> str | None:
+    """Return the component whose stylesheet owns a CSS class, if any."""
+    try:
+        return _CLASS_OWNERS[css_class]
+    except KeyError:
+        pass
+
+    _load_all_components()
+    owner, best = None, 0
+    for name, roots in _COMPONENT_CSS_CLASSES.items():
+        for root in roots:
+            if len(root) > best and (css_class == root or css_class.startswith(f"{root}-")):
+                owner, best = name, len(root)
+
+    if len(_CLASS_OWNERS) >= _CLASS_OWNERS_MAXSIZE:
+        _CLASS_OWNERS.clear()
+    _CLASS_OWNERS[css_class] = owner
+    return owner
+
+
+def record_component_usage(*names: str) -> None:
+    """Record that components were used by a page."""
+    _USED_COMPONENTS.update(names)
+
+
+def list_used_components() -> list[str]:
+    """Return the components recorded as used, e.g. to precompute a CSS subset."""
+    return sorted(_USED_COMPONENTS)
+
+
+def reset_component_usage() -> None:
+    """Forget recorded component usage."""
+    _USED_COMPONENTS.clear()
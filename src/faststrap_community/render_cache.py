@@ -0,0 +1,173 @@
+"""Opt-in render cache for static-shaped community components.
+
+Loaders, skeletons and similar components depend only on a handful of scalar
+arguments and are called with the same values over and over. ``render_cached``
+renders each distinct call once and serves the HTML from a bounded LRU after
+that. Entries are keyed on the component, its normalized arguments and the
+active defaults, so ``set_community_defaults()`` and
+``reset_community_defaults()`` invalidate them automatically.
+"""
+
+import inspect
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from functools import wraps
+from typing import Any
+
+from fasthtml.common import NotStr, to_xml
+
+from . import defaults as _defaults
+from .registry import get_component
+
+_MAXSIZE = 1024
+
+_CACHE: OrderedDict[tuple, NotStr] = OrderedDict()
+_CACHE_LOCK = threading.Lock()
+_CACHE_STATS = {"hits": 0, "misses": 0}
+
+# Defaults version the cached entries were rendered with
+_CACHE_VERSION = -1
+
+_SIGNATURES: dict[Callable, inspect.Signature] = {}
+
+_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+
+def _freeze(value: Any) -> Any:
+    """Return a hashable form of ``value``, or raise TypeError if it can't be cached.
+
+    Only scalars and tuples/lists of scalars are accepted. FT children and other
+    objects are mutable or identity-based, so calls using them bypass the cache.
+    """
+    if isinstance(value, _SCALAR_TYPES):
+        return value
+    if isinstance(value, (tuple, list)):
+        return tuple(_freeze(v) for v in value)
+    raise TypeError(f"{type(value).__name__} arguments are not cacheable")
+
+
+def _make_key(component: Callable, args: tuple, kwargs: dict[str, Any]) -> tuple | None:
+    """Build the cache key for a call, or None if the call can't be cached."""
+    sig = _SIGNATURES.get(component)
+    if sig is None:
+        sig = _SIGNATURES[component] = inspect.signature(component)
+
+    try:
+        bound = sig.bind(*args, **kwargs)
+        bound.apply_defaults()
+        items = []
+        for name, value in bound.arguments.items():
+            if sig.parameters[name].kind is inspect.Parameter.VAR_KEYWORD:
+                value = tuple(sorted(value.items()))
+            items.append((name, _freeze(value)))
+        resolved = tuple(sorted(_defaults.resolve_community_defaults(component.__name__).items()))
+        hash(resolved)
+    except TypeError:
+        return None
+
+    return (component, tuple(items), resolved)
+
+
+def _resolve(component: Callable | str) -> Callable:
+    if isinstance(component, str):
+        fn = get_component(component)
+        if fn is None:
+            raise KeyError(f"Unknown community component: {component!r}")
+        return fn
+    return component
+
+
+def render_cached(component: Callable | str, *args: Any, **kwargs: Any) -> NotStr:
+    """Render a component call once and reuse the HTML for identical calls.
+
+    Args:
+        component: Component function or registered component name
+        *args: Positional arguments for the component
+        **kwargs: Keyword arguments for the component
+
+    Returns:
+        Pre-rendered HTML that can be placed anywhere in an FT tree
+
+    Example:
+        >>> from faststrap_community import DotsLoader, render_cached
+        >>> render_cached(DotsLoader, variant="success")  # renders
+        >>> render_cached(DotsLoader, variant="success")  # served from cache
+    """
+    global _CACHE_VERSION
+
+    fn = _resolve(component)
+    key = _make_key(fn, args, kwargs)
+    if key is None:
+        return NotStr(to_xml(fn(*args, **kwargs)))
+
+    version = _defaults.get_defaults_version()
+    with _CACHE_LOCK:
+        if version != _CACHE_VERSION:
+            _CACHE.clear()
+            _CACHE_VERSION = version
+        html = _CACHE.get(key)
+        if html is not None:
+            _CACHE.move_to_end(key)
+            _CACHE_STATS["hits"] += 1
+            return html
+        _CACHE_STATS["misses"] += 1
+
+    html = NotStr(to_xml(fn(*args, **kwargs)))
+
+    with _CACHE_LOCK:
+        if version == _CACHE_VERSION:
+            _CACHE[key] = html
+            while len(_CACHE) > _MAXSIZE:
+                _CACHE.popitem(last=False)
+
+    return html
+
+
+def cached(component: Callable | str) -> Callable[..., NotStr]:
+    """Wrap a component so every call goes through :func:`render_cached`.
+
+    Example:
+        >>> from faststrap_community import RingLoader, cached
+        >>> Spinner = cached(RingLoader)
+        >>> Div(*[Spinner(size="2rem") for _ in range(100)])  # rendered once
+    """
+    fn = _resolve(component)
+
+    @wraps(fn)
+    def wrapper(*args: Any, **kwargs: Any) -> NotStr:
+        return render_cached(fn, *args, **kwargs)
+
+    return wrapper
+
+
+def set_render_cache_size(maxsize: int) -> None:
+    """Set the maximum number of cached renders (least recently used are evicted).
+
+    Args:
+        maxsize: Maximum number of entries (must be positive)
+
+    Raises:
+        ValueError: If maxsize is not positive
+    """
+    global _MAXSIZE
+    if maxsize < 1:
+        raise ValueError("maxsize must be a positive integer")
+    with _CACHE_LOCK:
+        _MAXSIZE = maxsize
+        while len(_CACHE) > _MAXSIZE:
+            _CACHE.popitem(last=False)
+
+
+def clear_render_cache() -> None:
+    """Drop all cached renders and reset the hit/miss counters."""
+    with _CACHE_LOCK:
+        _CACHE.clear()
+        _CACHE_STATS["hits"] = 0
+        _CACHE_STATS["misses"] = 0
+
+
+def render_cache_info() -> dict[str, int]:
+    """Return cache statistics: hits, misses, current size and maxsize."""
+    with _CACHE_LOCK:
+        return {**_CACHE_STATS, "size": len(_CACHE), "maxsize": _MAXSIZE}
@@ -0,0 +1,180 @@
+"""Page-level script registry for community components.
+
+Components that need client-side behavior declare it by name instead of
+embedding an inline ``<script>`` in every instance. ``setup_community()``
+hoists each registered script into ``app.hdrs`` once, so a page pays for a
+behavior a single time no matter how many instances it renders.
+
+Hoisting is tracked per request: ``ScriptHoistMiddleware`` (added by
+``setup_community()``) marks the behaviors as loaded while that app handles a
+request, so other apps in the same process, and rendering outside requests,
+still emit their script tags.
+"""
+
+import hashlib
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from pathlib import Path
+
+from fasthtml.common import FT, Script
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+_STATIC_PATH = Path(__file__).parent / "static"
+
+# Built-in behaviors: name -> path relative to the community static directory
+_COMMUNITY_SCRIPTS: dict[str, str] = {
+    "tag-input": "js/tag-input.js",
+    "scroll-reveal": "js/scroll-reveal.js",
+    "progress-ring": "js/progress-ring.js",
+    "parallax": "js/parallax.js",
+}
+
+# Behaviors loaded page-wide through the headers of the app handling the request
+_HOISTED_SCRIPTS: ContextVar[frozenset[str]] = ContextVar(
+    "fs_comm_hoisted_scripts", default=frozenset()
+)
+
+# Content hashes, computed once per script file
+_SCRIPT_VERSIONS: dict[str, str] = {}
+
+# Behaviors emitted so far in the active script scope (None = no scope)
+_EMITTED_SCRIPTS: ContextVar[set[str] | None] = ContextVar("fs_comm_emitted_scripts", default=None)
+
+
+def register_script(name: str, path: str) -> None:
+    """Register a client-side behavior served from the community static directory.
+
+    Args:
+        name: Behavior name components refer to (e.g., "tag-input")
+        path: Path relative to the static directory (e.g., "js/tag-input.js")
+    """
+    _COMMUNITY_SCRIPTS[name] = path
+    _SCRIPT_VERSIONS.pop(name, None)
+
+
+def list_scripts() -> list[str]:
+    """Return the names of all registered behaviors."""
+    return list(_COMMUNITY_SCRIPTS.keys())
+
+
+def get_script_version(name: str) -> str:
+    """Return a short content hash for a behavior, used for cache busting.
+
+    Args:
+        name: Registered behavior name
+
+    Raises:
+        KeyError: If the behavior is not registered
+    """
+    version = _SCRIPT_VERSIONS.get(name)
+    if version is None:
+        data = (_STATIC_PATH / _COMMUNITY_SCRIPTS[name]).read_bytes()
+        version = hashlib.sha256(data).hexdigest()[:10]
+        _SCRIPT_VERSIONS[name] = version
+    return version
+
+
+def get_script_url(name: str, static_url: str = "/community-static") -> str:
+    """Return the versioned URL of a behavior's script file.
+
+    Example:
+        >>> get_script_url("tag-input")
+        '/community-static/js/tag-input.js?v=3f2a9c1b0d'
+    """
+    base = static_url.rstrip("/")
+    return f"{base}/{_COMMUNITY_SCRIPTS[name]}?v={get_script_version(name)}"
+
+
+def get_community_scripts(static_url: str = "/community-static") -> list[Script]:
+    """Get deferred Script elements for every registered behavior."""
+    return [Script(src=get_script_url(name, static_url), defer=True) for name in _COMMUNITY_SCRIPTS]
+
+
+def hoist_scripts(names: list[str] | None = None) -> Token:
+    """Mark behaviors as loaded page-wide in the current context.
+
+    Components rendered in this context (a request, a task, a thread) stop
+    emitting those scripts. ``ScriptHoistMiddleware`` calls it for every
+    request of an app set up with ``setup_community()``.
+
+    Args:
+        names: Behaviors to mark (default: all registered behaviors)
+
+    Returns:
+        Token restoring the previous state via ``_HOISTED_SCRIPTS.reset()``
+    """
+    hoisted = _HOISTED_SCRIPTS.get().union(names if names is not None else _COMMUNITY_SCRIPTS)
+    return _HOISTED_SCRIPTS.set(hoisted)
+
+
+def reset_hoisted_scripts() -> None:
+    """Forget hoisted behaviors so components emit their own script tags again."""
+    _HOISTED_SCRIPTS.set(frozenset())
+
+
+class ScriptHoistMiddleware:
+    """ASGI middleware marking behaviors as hoisted while the app handles a request.
+
+    Added by ``setup_community()``, which puts the script tags in ``app.hdrs``.
+
+    Args:
+        app: ASGI application
+        names: Behaviors loaded by the app headers (default: all registered)
+    """
+
+    def __init__(self, app: ASGIApp, names: list[str] | None = None):
+        self.app = app
+        self.names = names
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        token = hoist_scripts(self.names)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _HOISTED_SCRIPTS.reset(token)
+
+
+def require_script(name: str, static_url: str = "/community-static") -> FT | None:
+    """Declare that a component needs a behavior.
+
+    Returns ``None`` when the behavior is already loaded through the app
+    headers, or was already emitted in the active :func:`script_scope`.
+    Otherwise returns a deferred external Script element; the script files are
+    idempotent, so repeating the tag outside a scope is harmless.
+
+    Args:
+        name: Registered behavior name
+        static_url: URL prefix for community static files
+    """
+    if name in _HOISTED_SCRIPTS.get():
+        return None
+
+    emitted = _EMITTED_SCRIPTS.get()
+    if emitted is not None:
+        if name in emitted:
+            return None
+        emitted.add(name)
+
+    return Script(src=get_script_url(name, static_url), defer=True)
+
+
+@contextmanager
+def script_scope() -> Iterator[set[str]]:
+    """Emit each behavior at most once while rendering a response.
+
+    Only needed when ``setup_community()`` is not used.
+
+    Example:
+        >>> with script_scope():
+        ...     page = Div(*[ScrollReveal(P(i)) for i in range(200)])
+        >>> # Only the first ScrollReveal carries the script tag
+    """
+    token = _EMITTED_SCRIPTS.set(set())
+    try:
+        yield _EMITTED_SCRIPTS.get()
+    finally:
+        _EMITTED_SCRIPTS.reset(token)
@@ -0,0 +1,192 @@
+"""In-memory prefix search for SearchBar active search.
+
+``SearchIndex`` keeps the normalized search keys of a corpus in one sorted
+list, so the entries matching a prefix are a contiguous range found with two
+binary searches. Without weights the first ``k`` entries of the range are the
+answer; with weights a segment tree over the sorted positions yields the
+``k`` heaviest entries in ``O(k log n)`` however many entries share the
+prefix. Results of recent queries are kept in an LRU.
+
+Positions, ids and weights live in ``array`` buffers rather than Python
+objects, so a multi-million entry corpus costs little more than its keys.
+"""
+
+import heapq
+import re
+import threading
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from typing import Any
+
+_SPACE_RE = re.compile(r"\s+")
+
+# Sorts after any character that can follow a prefix
+_PREFIX_END = "\U0010ffff"
+
+
+def normalize_query(text: str) -> str:
+    """Case-fold and collapse whitespace, as applied to keys and queries."""
+    return _SPACE_RE.sub(" ", text).strip().casefold()
+
+
+class SearchIndex:
+    """Prefix index answering top-k queries over a fixed corpus.
+
+    Args:
+        corpus: Entries to index (strings, or any objects with ``key``)
+        key: Returns the text to search for an entry (default: ``str``)
+        weight: Returns a ranking score for an entry; higher comes first.
+            Without it, matches are returned in alphabetical order.
+        word_prefix: Also match the start of every word, not only the start of
+            the text ("phone" finds "Smart Phone"). Adds one key per word.
+        cache_size: Number of recent query results to keep
+
+    Example:
+        >>> index = SearchIndex(products, key=lambda p: p["name"], weight=lambda p: p["sales"])
+        >>> index.search("wireless ch", k=8)
+    """
+
+    def __init__(
+        self,
+        corpus: Iterable[Any],
+        key: Callable[[Any], str] = str,
+        weight: Callable[[Any], float] | None = None,
+        word_prefix: bool = False,
+        cache_size: int = 1024,
+    ):
+        self.entries = list(corpus)
+        pairs = []
+        for entry_id, entry in enumerate(self.entries):
+            text = normalize_query(key(entry))
+            pairs.append((text, entry_id))
+            if word_prefix:
+                start = text.find(" ")
+                while start != -1:
+                    pairs.append((text[start + 1 :], entry_id))
+                    start = text.find(" ", start + 1)
+        pairs.sort()
+
+        self._keys = [text for text, _ in pairs]
+        self._ids = array("L", (entry_id for _, entry_id in pairs))
+        # Ranked search: ``_order[r]`` is the position of the r-th heaviest key
+        # and the segment tree holds the best (lowest) rank of each range
+        self._order: array | None = None
+        self._tree: array | None = None
+        if weight is not None:
+            scores = [float(weight(entry)) for entry in self.entries]
+            ids = self._ids
+            # Ties go to the earlier (alphabetically smaller) position
+            order = sorted(range(len(ids)), key=lambda p: (-scores[ids[p]], p))
+            self._order = array("L", order)
+            self._tree = self._build_tree(order)
+
+        self._cache: OrderedDict[tuple[str, int], list[Any]] = OrderedDict()
+        self._cache_size = cache_size
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    @staticmethod
+    def _build_tree(order: list[int]) -> array:
+        """Range-minimum segment tree over ranks; leaves are at ``n + position``."""
+        n = len(order)
+        tree = array("L", [0]) * (2 * n)
+        for rank, position in enumerate(order):
+            tree[n + position] = rank
+        for node in range(n - 1, 0, -1):
+            tree[node] = min(tree[2 * node], tree[2 * node + 1])
+        return tree
+
+    def _best_rank(self, lo: int, hi: int) -> int:
+        """Rank of the heaviest key in positions ``[lo, hi)``."""
+        tree = self._tree
+        n = len(self._order)
+        best = n
+        lo += n
+        hi += n
+        while lo < hi:
+            if lo & 1:
+                if tree[lo] < best:
+                    best = tree[lo]
+                lo += 1
+            if hi & 1:
+                hi -= 1
+                if tree[hi] < best:
+                    best = tree[hi]
+            lo >>= 1
+            hi >>= 1
+        return best
+
+    def _prefix_range(self, prefix: str) -> tuple[int, int]:
+        lo = bisect_left(self._keys, prefix)
+        return lo, bisect_left(self._keys, prefix + _PREFIX_END, lo)
+
+    def _top_k(self, lo: int, hi: int, k: int) -> list[int]:
+        if lo == hi:
+            return []
+        found: dict[int, None] = {}
+        if self._tree is None:
+            # Index rather than slice: the range can cover most of the index, and
+            # entries matched through several words need more than k positions
+            ids = self._ids
+            for position in range(lo, hi):
+                found[ids[position]] = None
+                if len(found) == k:
+                    break
+            return list(found)
+
+        # Pop ranges by their best rank, splitting each around its best key
+        heap = [(self._best_rank(lo, hi), lo, hi)]
+        while heap and len(found) < k:
+            rank, start, end = heapq.heappop(heap)
+            position = self._order[rank]
+            # An entry matched through several words is reported once
+            found.setdefault(self._ids[position], None)
+            for a, b in ((start, position), (position + 1, end)):
+                if a < b:
+                    heapq.heappush(heap, (self._best_rank(a, b), a, b))
+        return list(found)
+
+    def search(self, query: str, k: int = 10) -> list[Any]:
+        """Return up to ``k`` entries whose key starts with ``query``.
+
+        Matching ignores case and extra whitespace. An empty query matches nothing.
+        """
+        prefix = normalize_query(query)
+        if not prefix or k <= 0:
+            return []
+
+        cache_key = (prefix, k)
+        with self._lock:
+            results = self._cache.get(cache_key)
+            if results is not None:
+                self._cache.move_to_end(cache_key)
+                return results
+
+        lo, hi = self._prefix_range(prefix)
+        results = [self.entries[entry_id] for entry_id in self._top_k(lo, hi, k)]
+
+        with self._lock:
+            self._cache[cache_key] = results
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        return results
+
+    def count(self, query: str) -> int:
+        """Number of keys matching ``query`` (words count separately with ``word_prefix``)."""
+        prefix = normalize_query(query)
+        if not prefix:
+            return 0
+        lo, hi = self._prefix_range(prefix)
+        return hi - lo
+
+    def cache_info(self) -> dict[str, int]:
+        """Return the number of cached queries and the cache bound."""
+        return {"size": len(self._cache), "maxsize": self._cache_size}
+
+    def clear_cache(self) -> None:
+        with self._lock:
+            self._cache.clear()
@@ -0,0 +1,195 @@
+"""Application setup for Faststrap Community."""
+
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+from fasthtml.common import Link
+
+from .assets import get_community_assets, get_css_bundle
+from .css_partitions import css_subset_url
+from .scripts import ScriptHoistMiddleware, get_community_scripts
+from .static_server import CommunityStaticApp
+
+
+def setup_community(
+    app: Any,
+    static_url: str = "/community-static",
+    pwa_mode: bool = False,
+    css_components: Iterable[str] | None = None,
+    inline_critical: bool = False,
+    metrics: bool = False,
+    images: Any = None,
+) -> Any:
+    """
+    Mount community static files and routes, and inject CSS and script headers.
+
+    IMPORTANT: Must be called AFTER add_bootstrap(app).
+
+    Args:
+        app: FastHTML application instance
+        static_url: URL prefix for community static files (default: /community-static)
+        pwa_mode: Enable PWA optimizations (default: False)
+        css_components: Only ship the CSS of these components (plus shared base
+            rules) instead of the full bundle. Pass an empty list to link only
+            the base rules and add per-route ``CommunityStyles(...)`` links.
+        inline_critical: Inline the CSS of the community components on each
+            page into a ``<style>`` tag and load the stylesheet without
+            blocking rendering (default: False)
+        metrics: Record per-component render metrics and serve them in the
+            Prometheus text format at ``/community-metrics`` (default: False)
+        images: An ``ImagePipeline``; image components then render local
+            images as resized, lazily loaded candidates served from its route
+            (default: None, images are linked as given)
+
+    Raises:
+        RuntimeError: If app is invalid or Bootstrap not detected
+        ValueError: If css_components names an unknown component
+    """
+    # 1. Validate app instance
+    if not hasattr(app, "hdrs"):
+        raise RuntimeError(
+            "setup_community() requires a valid FastHTML app instance. "
+            "Did you pass the correct app object?"
+        )
+
+    # 2. ENFORCE: Check for Bootstrap
+    bootstrap_found = any(
+        hasattr(h, "attrs") and "bootstrap" in h.attrs.get("href", "")
+        for h in app.hdrs
+        if hasattr(h, "attrs")
+    )
+
+    if not bootstrap_found:
+        raise RuntimeError(
+            "setup_community() must be called AFTER add_bootstrap().\n"
+            "Bootstrap styles not detected in app headers.\n\n"
+            "Correct order:\n"
+            "  1. add_bootstrap(app)\n"
+            "  2. setup_community(app)"
+        )
+
+    # 3. Mount static files
+    from starlette.routing import Mount, Route
+
+    static_path = Path(__file__).parent / "static"
+
+    if not static_path.exists():
+        raise FileNotFoundError(f"Community static files not found at {static_path}")
+
+    existing_paths = [r.path for r in app.routes if isinstance(r, Mount)]
+    if static_url not in existing_paths:
+        # Resolve the bundle once up front (warns if it is stale)
+        get_css_bundle()
+        app.routes.insert(
+            0, Mount(static_url, CommunityStaticApp(static_path), name="community_static")
+        )
+
+    # Lazily loaded VerticalMegaMenu branches
+    from .navbars.vertical_mega import MENU_ROUTE, menu_subtree_endpoint
+
+    menu_path = f"{MENU_ROUTE}/{{menu_id}}"
+    existing_routes = [r.path for r in app.routes if isinstance(r, Route)]
+    if menu_path not in existing_routes:
+        app.routes.insert(
+            0, Route(menu_path, menu_subtree_endpoint, methods=["GET"], name="community_menu")
+        )
+
+    # Live ProgressRing.track() updates
+    from .progress import PROGRESS_ROUTE, progress_endpoint
+
+    progress_path = f"{PROGRESS_ROUTE}/{{job_id}}"
+    if progress_path not in existing_routes:
+        app.routes.insert(
+            0,
+            Route(progress_path, progress_endpoint, methods=["GET"], name="community_progress"),
+        )
+
+    # Live StatCard / TimelineCard updates from the broadcast hub
+    from .live import LIVE_ROUTE, live_endpoint
+
+    if LIVE_ROUTE not in existing_routes:
+        app.routes.insert(
+            0, Route(LIVE_ROUTE, live_endpoint, methods=["GET"], name="community_live")
+        )
+
+    # Stylesheet subsets for css_components / CommunityStyles
+    from .css_partitions import SUBSET_PATH, css_subset_endpoint
+
+    subset_path = f"{static_url.rstrip('/')}/{SUBSET_PATH}/{{filename}}"
+    if subset_path not in existing_routes:
+        app.routes.insert(
+            0, Route(subset_path, css_subset_endpoint, methods=["GET"], name="community_css")
+        )
+
+    # Render metrics
+    if metrics:
+        from .metrics import METRICS_ROUTE, ResponseSizeMiddleware, enable_metrics, metrics_endpoint
+
+        enable_metrics()
+        if METRICS_ROUTE not in existing_routes:
+            app.routes.insert(
+                0,
+                Route(METRICS_ROUTE, metrics_endpoint, methods=["GET"], name="community_metrics"),
+            )
+
+    # Responsive image derivatives
+    if images is not None:
+        from .images import set_image_pipeline
+
+        set_image_pipeline(images)
+        images_path = f"{images.url}/{{name}}"
+        if images_path not in existing_routes:
+            app.routes.insert(
+                0,
+                Route(images_path, images.endpoint, methods=["GET"], name="community_images"),
+            )
+
+    # 4. Inject CSS headers
+    from .critical_css import AsyncStylesheet, CriticalCSSMiddleware, precompute_critical_css
+
+    if css_components is None:
+        assets = get_community_assets(static_url)
+    else:
+        assets = [Link(rel="stylesheet", href=css_subset_url(css_components, static_url))]
+    current_hrefs = {
+        h.attrs.get("href") for h in app.hdrs if hasattr(h, "attrs") and "href" in h.attrs
+    }
+
+    for asset in assets:
+        href = asset.attrs.get("href")
+        if href in current_hrefs:
+            continue
+        if inline_critical:
+            app.hdrs.extend(AsyncStylesheet(href))
+        else:
+            app.hdrs.append(asset)
+
+    if inline_critical:
+        precompute_critical_css()
+        if not any(m.cls is CriticalCSSMiddleware for m in app.user_middleware):
+            app.add_middleware(CriticalCSSMiddleware)
+
+    # 5. Hoist component behaviors into a single deferred script per page
+    current_srcs = {
+        h.attrs.get("src") for h in app.hdrs if hasattr(h, "attrs") and "src" in h.attrs
+    }
+
+    for script in get_community_scripts(static_url):
+        if script.attrs.get("src") not in current_srcs:
+            app.hdrs.append(script)
+
+    # Components rendered while this app handles a request rely on those headers
+    if not any(m.cls is ScriptHoistMiddleware for m in app.user_middleware):
+        app.add_middleware(ScriptHoistMiddleware)
+
+    # Outermost, so response sizes include inlined critical CSS
+    if metrics and not any(m.cls is ResponseSizeMiddleware for m in app.user_middleware):
+        app.add_middleware(ResponseSizeMiddleware)
+
+    # 6. PWA Mode
+    if pwa_mode and hasattr(app, "_faststrap_pwa_cache_urls"):
+        cache_urls = [asset.attrs["href"] for asset in assets]
+        app._faststrap_pwa_cache_urls.extend(cache_urls)
+
+    return app
@@ -0,0 +1,78 @@
+/*
+   Faststrap Community - ParallaxSection fallback
+   Loaded once per page. Browsers with CSS scroll-driven animations need no
+   JavaScript (see effects.css). Elsewhere one passive scroll listener, throttled
+   to an animation frame, moves the background layer of each visible section
+   with translate3d: all positions are read first, then all transforms written.
+*/
+(function () {
+    if (window.fsCommParallaxInit) return;
+    window.fsCommParallaxInit = true;
+
+    if (window.CSS && CSS.supports('animation-timeline: view()')) return;
+    if (!('IntersectionObserver' in window)) return;
+    if (window.matchMedia('(prefers-reduced-motion: reduce)').matches) return;
+
+    const SELECTOR = '.fs-comm-parallax-section';
+    // Visible section -> [background layer, speed], read once when it comes into view
+    const visible = new Map();
+    let frame = 0;
+
+    const update = () => {
+        frame = 0;
+        const viewport = window.innerHeight;
+        const moves = [];
+        for (const [section, [layer, speed]] of visible) {
+            const rect = section.getBoundingClientRect();
+            // 0 when the section enters at the bottom, 1 when it leaves at the top
+            const progress = (viewport - rect.top) / (viewport + rect.height);
+            moves.push([layer, (progress - 0.5) * speed * (viewport + rect.height)]);
+        }
+        for (const [layer, y] of moves) {
+            if (layer) layer.style.transform = `translate3d(0, ${y.toFixed(1)}px, 0)`;
+        }
+    };
+
+    const schedule = () => {
+        if (!frame && visible.size) frame = requestAnimationFrame(update);
+    };
+
+    // Only sections near the viewport are updated on scroll
+    const observer = new IntersectionObserver((entries) => {
+        for (const entry of entries) {
+            const section = entry.target;
+            if (!entry.isIntersecting) {
+                visible.delete(section);
+                continue;
+            }
+            const speed = parseFloat(getComputedStyle(section).getPropertyValue('--fs-comm-parallax-speed'));
+            visible.set(section, [section.querySelector('.fs-comm-parallax-layer'), speed || 0]);
+        }
+        schedule();
+    });
+
+    const within = (root, fn) => {
+        if (root.matches(SELECTOR)) fn(root);
+        if (root.firstElementChild) root.querySelectorAll(SELECTOR).forEach(fn);
+    };
+    const observe = (el) => observer.observe(el);
+    const release = (el) => {
+        observer.unobserve(el);
+        visible.delete(el);
+    };
+
+    new MutationObserver((records) => {
+        for (const record of records) {
+            for (const node of record.removedNodes) {
+                if (node.nodeType === Node.ELEMENT_NODE && !node.isConnected) within(node, release);
+            }
+            for (const node of record.addedNodes) {
+                if (node.nodeType === Node.ELEMENT_NODE) within(node, observe);
+            }
+        }
+    }).observe(document.documentElement, { childList: true, subtree: true });
+
+    within(document.documentElement, observe);
+    window.addEventListener('scroll', schedule, { passive: true });
+    window.addEventListener('resize', schedule, { passive: true });
+})();
@@ -0,0 +1,51 @@
+/*
+   Faststrap Community - ProgressRing live tracking
+   Loaded once per page. Each ring rendered by ProgressRing.track() opens one
+   EventSource; events carry "<stroke-dashoffset> <label>" and only those two
+   values are updated in place.
+*/
+(function () {
+    if (window.fsCommProgressInit) return;
+    window.fsCommProgressInit = true;
+
+    const connect = (ring) => {
+        if (ring.fsCommProgress) return;
+        const source = new EventSource(ring.dataset.fsProgressSrc);
+        ring.fsCommProgress = source;
+
+        const bar = ring.querySelector('.fs-comm-progress-ring-bar');
+        const label = ring.querySelector('.fs-comm-progress-ring-label');
+
+        source.addEventListener('progress', (event) => {
+            // Ring swapped out of the page: stop listening
+            if (!ring.isConnected) {
+                source.close();
+                return;
+            }
+            const [offset, text] = event.data.split(' ');
+            bar.setAttribute('stroke-dashoffset', offset);
+            if (label) label.textContent = text;
+        });
+        source.addEventListener('done', () => source.close());
+    };
+
+    const SELECTOR = '[data-fs-progress-src]';
+    const within = (root, fn) => {
+        if (root.matches(SELECTOR)) fn(root);
+        if (root.firstElementChild) root.querySelectorAll(SELECTOR).forEach(fn);
+    };
+    const initRings = () => within(document.documentElement, connect);
+
+    if (document.readyState === 'loading') {
+        document.addEventListener('DOMContentLoaded', initRings);
+    } else {
+        initRings();
+    }
+    // Only the swapped content can hold new rings; an outerHTML swap detaches
+    // the old target, so its replacement is found from the document instead
+    document.addEventListener('htmx:afterSwap', (event) => {
+        const target = event.detail.target;
+        if (target && target.isConnected) within(target, connect);
+        else initRings();
+    });
+})();
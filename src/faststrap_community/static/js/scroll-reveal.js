@@ -0,0 +1,67 @@
+/*
+   Faststrap Community - ScrollReveal behavior
+   Loaded once per page; a single IntersectionObserver serves every .fs-comm-reveal.
+   Elements are observed when they enter the DOM (a MutationObserver looks only
+   at inserted subtrees, so an HTMX swap costs as much as its new content) and
+   unobserved as soon as they are revealed. Reveals arriving together are
+   applied in one animation frame.
+*/
+(function () {
+    if (window.fsCommRevealInit) return;
+    window.fsCommRevealInit = true;
+
+    const SELECTOR = '.fs-comm-reveal:not(.revealed)';
+
+    if (!('IntersectionObserver' in window)) {
+        const revealAll = () => document.querySelectorAll(SELECTOR).forEach((el) => el.classList.add('revealed'));
+        if (document.readyState === 'loading') {
+            document.addEventListener('DOMContentLoaded', revealAll);
+        } else {
+            revealAll();
+        }
+        document.addEventListener('htmx:afterSwap', revealAll);
+        return;
+    }
+
+    let queue = [];
+    let frame = 0;
+
+    const flush = () => {
+        frame = 0;
+        const batch = queue;
+        queue = [];
+        for (const el of batch) el.classList.add('revealed');
+    };
+
+    const observer = new IntersectionObserver((entries) => {
+        for (const entry of entries) {
+            if (!entry.isIntersecting) continue;
+            observer.unobserve(entry.target);
+            queue.push(entry.target);
+        }
+        if (queue.length && !frame) frame = requestAnimationFrame(flush);
+    }, { threshold: 0.1 });
+
+    // Apply fn to root and its unrevealed descendants, skipping the query for leaves
+    const within = (root, fn) => {
+        if (root.matches(SELECTOR)) fn(root);
+        if (root.firstElementChild) root.querySelectorAll(SELECTOR).forEach(fn);
+    };
+    const observe = (el) => observer.observe(el);
+    // Removed before being revealed (e.g. pruned by infinite scroll): release it
+    const release = (el) => observer.unobserve(el);
+
+    new MutationObserver((records) => {
+        for (const record of records) {
+            for (const node of record.removedNodes) {
+                if (node.nodeType === Node.ELEMENT_NODE && !node.isConnected) within(node, release);
+            }
+            for (const node of record.addedNodes) {
+                if (node.nodeType === Node.ELEMENT_NODE) within(node, observe);
+            }
+        }
+    }).observe(document.documentElement, { childList: true, subtree: true });
+
+    // Elements already in the page when the script runs
+    within(document.documentElement, observe);
+})();
@@ -0,0 +1,88 @@
+/*
+   Faststrap Community - TagInput behavior
+   Loaded once per page. A handful of listeners on document serve every
+   .fs-comm-tag-input, including ones swapped in later by HTMX; an input's
+   state is read from its data- attributes the first time it is used.
+*/
+(function () {
+    if (window.fsCommTagInputInit) return;
+    window.fsCommTagInputInit = true;
+
+    const ROOT = '[data-fs-tag-input]';
+
+    // Lazily built per-instance state: the current tags, from the badges' data-tag
+    const state = (root) => {
+        if (!root.fsCommTags) {
+            const badges = root.querySelectorAll('.tags-container [data-tag]');
+            root.fsCommTags = new Set(Array.from(badges, (b) => b.dataset.tag));
+        }
+        return root.fsCommTags;
+    };
+
+    const sync = (root) => {
+        const hidden = root.querySelector('[data-fs-tag-value]');
+        if (hidden) hidden.value = Array.from(state(root)).join(',');
+    };
+
+    const clearSuggestions = (root) => {
+        const suggestions = root.querySelector('.fs-comm-tag-suggestions');
+        if (suggestions) suggestions.replaceChildren();
+    };
+
+    const addTag = (root, tag) => {
+        tag = tag.trim();
+        const tags = state(root);
+        if (!tag || tags.has(tag)) return;
+        tags.add(tag);
+
+        const badge = document.createElement('span');
+        badge.className = 'badge bg-primary me-2 mb-2 d-inline-flex align-items-center';
+        badge.dataset.tag = tag;
+        badge.textContent = tag;
+        const close = document.createElement('button');
+        close.type = 'button';
+        close.className = 'btn-close btn-close-white ms-2';
+        close.style.fontSize = '0.7rem';
+        close.setAttribute('aria-label', 'Remove');
+        badge.appendChild(close);
+        root.querySelector('.tags-container').appendChild(badge);
+        sync(root);
+    };
+
+    const removeTag = (root, badge) => {
+        state(root).delete(badge.dataset.tag);
+        badge.remove();
+        sync(root);
+    };
+
+    const resetEntry = (root) => {
+        const entry = root.querySelector('[data-fs-tag-entry]');
+        if (entry) {
+            entry.value = '';
+            entry.focus();
+        }
+        clearSuggestions(root);
+    };
+
+    document.addEventListener('keydown', (e) => {
+        if (e.key !== 'Enter' || e.isComposing) return;
+        const entry = e.target.closest && e.target.closest('[data-fs-tag-entry]');
+        const root = entry && entry.closest(ROOT);
+        if (!root) return;
+        e.preventDefault();
+        addTag(root, entry.value);
+        resetEntry(root);
+    });
+
+    document.addEventListener('click', (e) => {
+        const target = e.target.closest && e.target.closest(`${ROOT} .tags-container .btn-close, ${ROOT} .fs-comm-tag-suggestion`);
+        if (!target) return;
+        const root = target.closest(ROOT);
+        if (target.classList.contains('fs-comm-tag-suggestion')) {
+            addTag(root, target.dataset.tag);
+            resetEntry(root);
+        } else {
+            removeTag(root, target.closest('[data-tag]'));
+        }
+    });
+})();
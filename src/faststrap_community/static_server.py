@@ -0,0 +1,196 @@
+"""In-memory, precompressed static file server for community assets.
+
+``CommunityStaticApp`` reads every file under ``static/`` once at startup and
+keeps, per file, the raw bytes, a gzip variant (and a brotli variant when the
+``brotli`` package is installed), a strong ETag per variant and the response
+headers. Requests are answered from memory: ``Accept-Encoding`` picks the
+variant, ``If-None-Match`` gets a 304, and fingerprinted names (or ``?v=``
+versioned URLs) are marked immutable. No disk access happens per request.
+"""
+
+import gzip
+import hashlib
+import mimetypes
+from pathlib import Path
+from typing import NamedTuple
+
+from starlette.datastructures import Headers
+from starlette.types import Receive, Scope, Send
+
+from .assets import IMMUTABLE_CACHE_CONTROL, STATIC_DIR, is_fingerprinted
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+REVALIDATE_CACHE_CONTROL = "no-cache"
+
+# Variants smaller than this aren't worth the Vary/decoding overhead
+_MIN_COMPRESS_SIZE = 256
+
+_COMPRESSIBLE_TYPES = (
+    "text/",
+    "application/javascript",
+    "application/json",
+    "application/manifest+json",
+    "image/svg+xml",
+)
+
+
+class _Variant(NamedTuple):
+    body: bytes
+    etag: str
+    headers: list[tuple[bytes, bytes]]
+
+
+class _Asset(NamedTuple):
+    variants: dict[str, _Variant]  # encoding ("identity", "gzip", "br") -> variant
+    etags: frozenset[str]
+    immutable: bool
+
+
+def _accepted_encodings(accept_encoding: str) -> dict[str, float]:
+    """Parse an Accept-Encoding header into {encoding: q}."""
+    accepted: dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        accepted[name] = q
+    return accepted
+
+
+def _etag_matches(if_none_match: str, etags: frozenset[str]) -> bool:
+    """Weak comparison of an If-None-Match header against an asset's ETags."""
+    if if_none_match.strip() == "*":
+        return True
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        if tag in etags:
+            return True
+    return False
+
+
+def _load_asset(path: Path, name: str) -> _Asset:
+    data = path.read_bytes()
+    content_type = mimetypes.guess_type(name)[0] or "application/octet-stream"
+    if content_type.startswith("text/") or content_type == "application/javascript":
+        content_type += "; charset=utf-8"
+
+    digest = hashlib.sha256(data).hexdigest()[:16]
+    immutable = is_fingerprinted(name)
+
+    bodies = {"identity": data}
+    if len(data) >= _MIN_COMPRESS_SIZE and content_type.startswith(_COMPRESSIBLE_TYPES):
+        compressed = gzip.compress(data, compresslevel=9, mtime=0)
+        if len(compressed) < len(data):
+            bodies["gzip"] = compressed
+        if brotli is not None:
+            compressed = brotli.compress(data)
+            if len(compressed) < len(data):
+                bodies["br"] = compressed
+
+    variants = {}
+    for encoding, body in bodies.items():
+        etag = f'"{digest}"' if encoding == "identity" else f'"{digest}-{encoding}"'
+        headers = [
+            (b"content-type", content_type.encode()),
+            (b"content-length", str(len(body)).encode()),
+            (b"etag", etag.encode()),
+        ]
+        if encoding != "identity":
+            headers.append((b"content-encoding", encoding.encode()))
+        if len(bodies) > 1:
+            headers.append((b"vary", b"Accept-Encoding"))
+        variants[encoding] = _Variant(body, etag, headers)
+
+    return _Asset(variants, frozenset(v.etag for v in variants.values()), immutable)
+
+
+class CommunityStaticApp:
+    """ASGI app serving a static directory from memory.
+
+    Args:
+        directory: Directory to load (default: the package's static dir)
+
+    Example:
+        >>> Mount("/community-static", CommunityStaticApp(), name="community_static")
+    """
+
+    def __init__(self, directory: str | Path = STATIC_DIR):
+        self.directory = Path(directory)
+        self.assets: dict[str, _Asset] = {}
+        self.reload()
+
+    def reload(self) -> None:
+        """Load (or reload) every file under the directory into memory."""
+        assets = {}
+        for path in sorted(self.directory.rglob("*")):
+            relative = path.relative_to(self.directory)
+            if path.is_file() and not any(p.startswith(".") for p in relative.parts):
+                name = relative.as_posix()
+                assets[name] = _load_asset(path, name)
+        self.assets = assets
+
+    def _select(self, asset: _Asset, accept_encoding: str) -> _Variant:
+        if len(asset.variants) > 1 and accept_encoding:
+            accepted = _accepted_encodings(accept_encoding)
+            wildcard = accepted.get("*", 0.0)
+            for encoding in ("br", "gzip"):
+                if encoding in asset.variants and accepted.get(encoding, wildcard) > 0:
+                    return asset.variants[encoding]
+        return asset.variants["identity"]
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        assert scope["type"] == "http"
+
+        if scope["method"] not in ("GET", "HEAD"):
+            await _send(send, 405, [(b"allow", b"GET, HEAD"), (b"content-length", b"0")])
+            return
+
+        path = scope["path"]
+        root_path = scope.get("root_path", "")
+        if root_path and path.startswith(root_path):
+            path = path[len(root_path) :]
+        asset = self.assets.get(path.lstrip("/"))
+        if asset is None:
+            headers = [(b"content-type", b"text/plain; charset=utf-8"), (b"content-length", b"9")]
+            await _send(send, 404, headers, b"Not Found")
+            return
+
+        headers = Headers(scope=scope)
+        variant = self._select(asset, headers.get("accept-encoding", ""))
+
+        query = scope.get("query_string", b"")
+        immutable = asset.immutable or query.startswith(b"v=") or b"&v=" in query
+        cache_control = IMMUTABLE_CACHE_CONTROL if immutable else REVALIDATE_CACHE_CONTROL
+        response_headers = [*variant.headers, (b"cache-control", cache_control.encode())]
+
+        if_none_match = headers.get("if-none-match")
+        if if_none_match and _etag_matches(if_none_match, asset.etags):
+            not_modified = [
+                (k, v)
+                for k, v in response_headers
+                if k not in (b"content-length", b"content-type", b"content-encoding")
+            ]
+            await _send(send, 304, not_modified)
+            return
+
+        body = b"" if scope["method"] == "HEAD" else variant.body
+        await _send(send, 200, response_headers, body)
+
+
+async def _send(send: Send, status: int, headers: list, body: bytes = b"") -> None:
+    await send({"type": "http.response.start", "status": status, "headers": headers})
+    await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,263 @@
+"""Streaming HTML rendering for large community component trees.
+
+``to_xml`` builds the whole page string in one pass after the whole FT tree
+exists. ``iter_html`` walks the tree with an explicit stack and yields HTML in
+chunks instead, so a ``StreamingResponse`` can send the first bytes while the
+rest is still being produced. Wrap expensive or very long child sequences in
+:class:`Lazy` so they are generated only when the serializer reaches them;
+peak memory then scales with tree depth and chunk size rather than page size.
+
+The output is byte-for-byte identical to ``to_xml``.
+"""
+
+import json
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from html import escape
+from typing import Any
+
+from fastcore.foundation import L
+from fastcore.xml import FT
+from fasthtml.common import Body, Head, Html, NotStr, Title
+from starlette.responses import StreamingResponse
+
+from .batch import iter_many
+
+DEFAULT_CHUNK_SIZE = 16 * 1024
+
+# Serialization rules of fastcore's ``to_xml``, kept here rather than imported
+# from its private helpers; tests check the output against ``to_xml``.
+_BLOCK_TAGS = frozenset(
+    {
+        "!doctype", "article", "aside", "blockquote", "body", "div", "footer", "h1", "h2",
+        "h3", "h4", "h5", "h6", "head", "header", "html", "input", "li", "link", "meta",
+        "nav", "ol", "p", "script", "section", "style", "table", "tbody", "td", "tfoot",
+        "th", "thead", "title", "tr", "ul",
+    }
+)  # fmt: skip
+
+# Tags whose content is never indented
+_WS_SIGNIFICANT = frozenset({"pre", "textarea", "code", "script"})
+
+
+def _escape(s: Any) -> Any:
+    if s is None:
+        return ""
+    if hasattr(s, "__html__"):
+        return s.__html__()
+    return escape(s, quote=False) if isinstance(s, str) else s
+
+
+def _to_attr(k: str, v: Any) -> str:
+    if isinstance(v, bool):
+        return str(k) if v else ""
+    if isinstance(v, str) and ("&" in v or "<" in v or ">" in v):
+        v = escape(v, quote=False)
+    elif isinstance(v, Mapping):
+        v = json.dumps(v)
+    elif hasattr(v, "__html__"):
+        v = v.__html__()
+    else:
+        v = str(v)
+    qt = '"'
+    if qt in v:
+        qt = "'"
+        if "'" in v:
+            v = v.replace("'", "&#39;")
+    return f"{k}={qt}{v}{qt}"
+
+
+class Lazy:
+    """Children produced on demand while a tree is serialized.
+
+    Args:
+        items: Iterable of children (FT, text, NotStr), or a zero-argument
+            callable returning one. A callable defers the work (e.g. a database
+            query) until the streaming serializer reaches this point, after the
+            markup before it has been sent.
+
+    Example:
+        >>> Div(H2("Activity"), Lazy(lambda: (TimelineCard(**e) for e in load_events())))
+    """
+
+    __slots__ = ("_items",)
+
+    def __init__(self, items: Iterable[Any] | Callable[[], Iterable[Any]]):
+        self._items = items
+
+    def __iter__(self) -> Iterator[Any]:
+        items = self._items() if callable(self._items) else self._items
+        return iter(items)
+
+    def __ft__(self) -> tuple:
+        # Non-streaming rendering (to_xml) materializes the children
+        return tuple(self)
+
+
+def stream_many(component: Callable | str, rows: Iterable[Any], **common: Any) -> Lazy:
+    """Lazily render one component per row using :func:`iter_many`.
+
+    Example:
+        >>> Div(stream_many(TimelineCard, events, variant="info"), cls="feed")
+    """
+    return Lazy(lambda: (NotStr(html) for html in iter_many(component, rows, **common)))
+
+
+def _open(elm: FT, lvl: int, indent: bool) -> tuple[str, str, bool, list | None]:
+    """Render the parts of an element around its children, mirroring fastcore's ``_to_xml``.
+
+    Returns (opening, closing, child_indent, children); children is None when
+    the element was rendered completely into ``opening``.
+    """
+    tag, cs, attrs = elm.tag, elm.children, elm.attrs
+    is_void = elm.void_
+    is_block = tag in _BLOCK_TAGS
+    if indent and (tag in _WS_SIGNIFICANT or attrs.get("contenteditable") == "true"):
+        indent = False
+    sp, nl = (" " * lvl, "\n") if indent and is_block else ("", "")
+
+    stag = tag
+    if attrs:
+        sattrs = " ".join(
+            _to_attr(k, v)
+            for k, v in attrs.items()
+            if v is not False and v is not None and (k == "_" or k[-1] != "_")
+        )
+        if sattrs:
+            stag += f" {sattrs}"
+
+    cltag = "" if is_void else f"</{tag}>"
+    stag_ = f"<{stag}>" if stag else ""
+
+    if not cs:
+        return (f"{sp}{stag_}{nl}" if is_void else f"{sp}{stag_}{cltag}{nl}"), "", indent, None
+    if (
+        len(cs) == 1
+        and not isinstance(cs[0], (list, tuple, L, FT))
+        and not hasattr(cs[0], "__ft__")
+    ):
+        return f"{sp}{stag_}{_escape(cs[0])}{cltag}{nl}", "", indent, None
+
+    closing = "" if is_void else f"{sp}{cltag}{nl}"
+    return f"{sp}{stag_}{nl}", closing, indent, cs
+
+
+def _iter_xml(elm: Any, lvl: int = 0, indent: bool = True) -> Iterator[str | None]:
+    """Yield the HTML pieces of a tree; ``None`` marks a point worth flushing at."""
+    # Stack of (children iterator, child level, child indent, closing markup)
+    stack: list[tuple[Iterator[Any], int, bool, str]] = [(iter((elm,)), lvl, indent, "")]
+
+    while stack:
+        children, lvl, indent, _ = stack[-1]
+        for child in children:
+            if child is None:
+                continue
+            if isinstance(child, Lazy):
+                yield None
+                stack.append((iter(child), lvl, indent, ""))
+                break
+            if hasattr(child, "__ft__"):
+                child = child.__ft__()
+            if isinstance(child, (tuple, L)):
+                stack.append((iter(child), lvl, indent, ""))
+                break
+            if isinstance(child, bytes):
+                yield child.decode("utf-8")
+                continue
+            if not isinstance(child, FT):
+                yield f"{_escape(child)}"
+                continue
+
+            opening, closing, child_indent, cs = _open(child, lvl, indent)
+            yield opening
+            if cs is not None:
+                stack.append((iter(cs), lvl + 2 if child_indent else 0, child_indent, closing))
+                break
+        else:
+            _, _, _, closing = stack.pop()
+            if closing:
+                yield closing
+
+
+def iter_html(*content: Any, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[str]:
+    """Serialize FT content incrementally, yielding chunks of about ``chunk_size`` characters.
+
+    Pending output is also flushed right before each :class:`Lazy` child is
+    expanded, so the markup before slow sections reaches the client first.
+
+    Args:
+        *content: FT elements, strings or Lazy children (joined like ``to_xml``)
+        chunk_size: Target chunk size in characters
+
+    Yields:
+        HTML chunks whose concatenation equals ``to_xml(*content)``
+    """
+    buffer: list[str] = []
+    size = 0
+
+    for i, elm in enumerate(content):
+        if i:
+            buffer.append("\n")
+            size += 1
+        if isinstance(elm, (list, tuple, L, FT, Lazy)) or hasattr(elm, "__ft__"):
+            pieces = _iter_xml(elm)
+        elif isinstance(elm, bytes):
+            pieces = iter((elm.decode("utf-8"),))
+        else:
+            pieces = iter((str(elm or ""),))
+
+        for piece in pieces:
+            if piece is None:
+                if buffer:
+                    yield "".join(buffer)
+                    buffer, size = [], 0
+                continue
+            buffer.append(piece)
+            size += len(piece)
+            if size >= chunk_size:
+                yield "".join(buffer)
+                buffer, size = [], 0
+
+    if buffer:
+        yield "".join(buffer)
+
+
+def StreamingHTMLResponse(
+    *content: Any,
+    title: str = None,
+    hdrs: Iterable[Any] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    status_code: int = 200,
+    headers: dict[str, str] = None,
+) -> StreamingResponse:
+    """Stream FT content from a FastHTML route.
+
+    Without ``title``/``hdrs`` the content is streamed as a fragment (suitable
+    for HTMX requests). With them it is wrapped in a full HTML document.
+
+    Args:
+        *content: FT elements to stream
+        title: Page title (makes the response a full document)
+        hdrs: Head elements such as ``app.hdrs`` (makes the response a full document)
+        chunk_size: Target chunk size in characters
+        status_code: HTTP status code
+        headers: Extra response headers
+
+    Example:
+        >>> @rt("/catalog")
+        ... def catalog():
+        ...     return StreamingHTMLResponse(
+        ...         Container(H1("Catalog"), stream_many(TimelineCard, load_events())),
+        ...         title="Catalog",
+        ...         hdrs=app.hdrs,
+        ...     )
+    """
+    if title is not None or hdrs is not None:
+        head = Head(Title(title) if title is not None else None, *(hdrs or ()))
+        content = ("<!doctype html>", Html(head, Body(*content)))
+
+    return StreamingResponse(
+        iter_html(*content, chunk_size=chunk_size),
+        status_code=status_code,
+        headers=headers,
+        media_type="text/html",
+    )
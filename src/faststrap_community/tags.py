@@ -0,0 +1,328 @@
+"""Indexed tag vocabulary for TagInput autocomplete.
+
+``TagIndex`` keeps a large, growing tag vocabulary in a compact form:
+
+- Tags sorted by their case-folded form are stored back to back in a single
+  string, with their start offsets and use counts in ``array`` buffers, so a
+  tag costs its characters plus about 16 bytes instead of a Python object.
+- A prefix is a contiguous range, found by binary search. A max-count segment
+  tree over that range returns the ``k`` most used tags in ``O(k log n)`` and
+  takes a use-count increment in ``O(log n)``.
+- New tags go to a small sorted buffer that is merged into the block once it
+  grows past a fraction of the vocabulary.
+- When a prefix has fewer than ``k`` matches, tags one edit away from the
+  query (a typo: one character deleted, inserted, replaced or two swapped)
+  fill the remaining slots. Inserted and replacing characters are only those
+  that actually follow the unchanged part of the query in known tags, the
+  number of variants tried is capped, and the lock is taken per lookup, so a
+  miss stays cheap with a large alphabet and doesn't hold up ``add()``.
+
+Rendered suggestion fragments are cached until the vocabulary changes.
+"""
+
+import heapq
+import threading
+from array import array
+from bisect import bisect_left, insort
+from collections import OrderedDict
+from collections.abc import Iterable, Mapping
+from itertools import accumulate
+
+from fasthtml.common import Button, Div, NotStr, to_xml
+
+# Sorts after any character that can follow a prefix
+_PREFIX_END = "\U0010ffff"
+
+# Minimum number of buffered new tags before they are merged into the block
+_MIN_MERGE = 4096
+
+# Shortest query that gets typo-tolerant matches
+_MIN_FUZZY_LENGTH = 3
+
+# Most one-edit variants of a query looked up per suggestion
+_MAX_VARIANTS = 256
+
+
+def _clean(tag: str) -> str:
+    """Strip and collapse whitespace; tags are stored and matched in this form."""
+    return " ".join(tag.split())
+
+
+class TagIndex:
+    """Frequency-ranked, typo-tolerant tag vocabulary with incremental inserts.
+
+    Args:
+        tags: Initial tags, or a mapping of tag to use count
+        cache_size: Number of rendered suggestion fragments to keep
+
+    Example:
+        >>> index = TagIndex({"python": 1200, "pytest": 310, "fasthtml": 95})
+        >>> index.add("htmx")
+        >>> index.suggest("py")
+        ['python', 'pytest']
+    """
+
+    def __init__(self, tags: Iterable[str] | Mapping[str, int] = (), cache_size: int = 512):
+        self._lock = threading.RLock()
+        self._block = ""
+        self._offsets = array("I", [0])
+        self._counts = array("I")
+        self._tree = array("I")
+        # Buffered new tags: sorted folded keys, and folded key -> [tag, count]
+        self._pending_keys: list[str] = []
+        self._pending: dict[str, list] = {}
+        self._version = 0
+        self._fragments: OrderedDict[tuple, NotStr] = OrderedDict()
+        self._cache_size = cache_size
+
+        counts = tags if isinstance(tags, Mapping) else dict.fromkeys(tags, 1)
+        for tag, count in counts.items():
+            tag = _clean(tag)
+            if tag:
+                entry = self._pending.setdefault(tag.casefold(), [tag, 0])
+                entry[1] += count
+        self._merge()
+
+    # Storage
+
+    def __len__(self) -> int:
+        return len(self._counts) + len(self._pending)
+
+    def __contains__(self, tag: str) -> bool:
+        return self.count(tag) > 0
+
+    def _tag(self, position: int) -> str:
+        return self._block[self._offsets[position] : self._offsets[position + 1]]
+
+    def _fold(self, position: int) -> str:
+        return self._tag(position).casefold()
+
+    def _find(self, key: str) -> int:
+        """Block position of a folded key, or -1."""
+        n = len(self._counts)
+        position = bisect_left(range(n), key, key=self._fold)
+        return position if position < n and self._fold(position) == key else -1
+
+    def _block_range(self, prefix: str) -> tuple[int, int]:
+        positions = range(len(self._counts))
+        lo = bisect_left(positions, prefix, key=self._fold)
+        return lo, bisect_left(positions, prefix + _PREFIX_END, lo, key=self._fold)
+
+    def _add_pending(self, tag: str, count: int) -> None:
+        key = tag.casefold()
+        entry = self._pending.get(key)
+        if entry is None:
+            self._pending[key] = [tag, count]
+            insort(self._pending_keys, key)
+        else:
+            entry[1] += count
+
+    def _merge(self) -> None:
+        """Fold the buffered tags into the block and rebuild the tree."""
+        tags = [(self._fold(i), self._tag(i), self._counts[i]) for i in range(len(self._counts))]
+        tags += [(key, tag, count) for key, (tag, count) in self._pending.items()]
+        tags.sort()
+        self._block = "".join(tag for _, tag, _ in tags)
+        self._offsets = array("I", accumulate((len(tag) for _, tag, _ in tags), initial=0))
+        self._counts = array("I", (count for _, _, count in tags))
+        self._pending.clear()
+        self._pending_keys.clear()
+
+        n = len(self._counts)
+        self._tree = array("I", [0]) * (2 * n)
+        for position in range(n):
+            self._tree[n + position] = position
+        for node in range(n - 1, 0, -1):
+            self._tree[node] = self._better(self._tree[2 * node], self._tree[2 * node + 1])
+
+    def _better(self, a: int, b: int) -> int:
+        # Higher count first, then alphabetical
+        ca, cb = self._counts[a], self._counts[b]
+        return a if ca > cb or (ca == cb and a < b) else b
+
+    def add(self, tag: str, count: int = 1) -> None:
+        """Insert a tag, or add to its use count if it is already known."""
+        tag = _clean(tag)
+        if not tag:
+            return
+        with self._lock:
+            position = self._find(tag.casefold())
+            if position >= 0:
+                self._counts[position] += count
+                n = len(self._counts)
+                node = (n + position) // 2
+                while node:
+                    self._tree[node] = self._better(self._tree[2 * node], self._tree[2 * node + 1])
+                    node //= 2
+            else:
+                self._add_pending(tag, count)
+                if len(self._pending) > max(_MIN_MERGE, len(self._counts) // 8):
+                    self._merge()
+            self._version += 1
+
+    def update(self, tags: Iterable[str]) -> None:
+        """Add every tag in ``tags`` (e.g. the tags of a submitted form)."""
+        for tag in tags:
+            self.add(tag)
+
+    def count(self, tag: str) -> int:
+        """Return how often a tag was added (0 if unknown)."""
+        key = _clean(tag).casefold()
+        with self._lock:
+            entry = self._pending.get(key)
+            if entry is not None:
+                return entry[1]
+            position = self._find(key)
+            return self._counts[position] if position >= 0 else 0
+
+    # Queries
+
+    def _best(self, lo: int, hi: int) -> int:
+        """Block position of the most used tag in ``[lo, hi)``."""
+        tree = self._tree
+        n = len(self._counts)
+        best = -1
+        lo += n
+        hi += n
+        while lo < hi:
+            if lo & 1:
+                best = tree[lo] if best < 0 else self._better(best, tree[lo])
+                lo += 1
+            if hi & 1:
+                hi -= 1
+                best = tree[hi] if best < 0 else self._better(best, tree[hi])
+            lo >>= 1
+            hi >>= 1
+        return best
+
+    def _prefix_matches(self, prefix: str, k: int) -> list[tuple[int, str]]:
+        """Up to ``k`` ``(count, tag)`` pairs starting with ``prefix``, most used first."""
+        found = []
+        lo, hi = self._block_range(prefix)
+        if lo < hi:
+            # Pop ranges by their most used tag, splitting each around it
+            best = self._best(lo, hi)
+            heap = [(-self._counts[best], best, lo, hi)]
+            while heap and len(found) < k:
+                _, position, start, end = heapq.heappop(heap)
+                found.append((self._counts[position], self._tag(position)))
+                for a, b in ((start, position), (position + 1, end)):
+                    if a < b:
+                        best = self._best(a, b)
+                        heapq.heappush(heap, (-self._counts[best], best, a, b))
+
+        lo = bisect_left(self._pending_keys, prefix)
+        hi = bisect_left(self._pending_keys, prefix + _PREFIX_END, lo)
+        for key in self._pending_keys[lo:hi]:
+            tag, count = self._pending[key]
+            found.append((count, tag))
+
+        found.sort(key=lambda item: (-item[0], item[1].casefold()))
+        return found[:k]
+
+    def _next_chars(self, prefix: str) -> set[str]:
+        """Characters following ``prefix`` in known tags (one binary search per character)."""
+        chars: set[str] = set()
+        i = len(prefix)
+        positions = range(len(self._counts))
+        lo, hi = self._block_range(prefix)
+        while lo < hi:
+            key = self._fold(lo)
+            if len(key) == i:
+                lo += 1
+                continue
+            chars.add(key[i])
+            lo = bisect_left(positions, prefix + key[i] + _PREFIX_END, lo, hi, key=self._fold)
+
+        keys = self._pending_keys
+        lo = bisect_left(keys, prefix)
+        hi = bisect_left(keys, prefix + _PREFIX_END, lo)
+        while lo < hi:
+            if len(keys[lo]) == i:
+                lo += 1
+                continue
+            chars.add(keys[lo][i])
+            lo = bisect_left(keys, prefix + keys[lo][i] + _PREFIX_END, lo, hi)
+        return chars
+
+    def _variants(self, query: str) -> list[str]:
+        """Up to ``_MAX_VARIANTS`` strings one edit away from ``query`` that can match a tag.
+
+        Deletions and swaps come first; insertions and replacements follow,
+        from the end of the query (where the unchanged prefix is longest and
+        the candidates fewest) to its start.
+        """
+        variants = dict.fromkeys(query[:i] + query[i + 1 :] for i in range(len(query)))
+        for i in range(len(query) - 1):
+            variants[query[:i] + query[i + 1] + query[i] + query[i + 2 :]] = None
+        for i in range(len(query), -1, -1):
+            if len(variants) >= _MAX_VARIANTS:
+                break
+            with self._lock:
+                chars = self._next_chars(query[:i])
+            for c in sorted(chars):
+                variants[query[:i] + c + query[i:]] = None
+                if i < len(query):
+                    variants[query[:i] + c + query[i + 1 :]] = None
+        variants.pop(query, None)
+        return list(variants)[:_MAX_VARIANTS]
+
+    def suggest(self, query: str, k: int = 8, fuzzy: bool = True) -> list[str]:
+        """Return up to ``k`` tags for what the user typed, most used first.
+
+        Tags starting with ``query`` (ignoring case) come first. If there are
+        fewer than ``k`` and ``fuzzy`` is set, tags whose start is one typo
+        away from ``query`` fill the rest.
+        """
+        key = _clean(query).casefold()
+        if not key or k <= 0:
+            return []
+        with self._lock:
+            matches = self._prefix_matches(key, k)
+        if fuzzy and len(matches) < k and len(key) >= _MIN_FUZZY_LENGTH:
+            seen = {tag for _, tag in matches}
+            extra: dict[str, int] = {}
+            for variant in self._variants(key):
+                # Locked per lookup so inserts aren't held up by a long fuzzy fill
+                with self._lock:
+                    found = self._prefix_matches(variant, k)
+                for count, tag in found:
+                    if tag not in seen:
+                        extra[tag] = count
+            ranked = sorted(extra.items(), key=lambda item: (-item[1], item[0].casefold()))
+            matches += [(count, tag) for tag, count in ranked[: k - len(matches)]]
+        return [tag for _, tag in matches]
+
+    def render_suggestions(self, query: str, k: int = 8) -> NotStr:
+        """Render the suggestion list TagInput shows for ``query``.
+
+        Fragments are cached per query and dropped whenever a tag is added.
+        """
+        key = (_clean(query).casefold(), k)
+        with self._lock:
+            cache_key = (self._version, *key)
+            fragment = self._fragments.get(cache_key)
+            if fragment is not None:
+                self._fragments.move_to_end(cache_key)
+                return fragment
+
+        buttons = [
+            Button(
+                tag,
+                type="button",
+                cls="fs-comm-tag-suggestion list-group-item list-group-item-action",
+                data_tag=tag,
+            )
+            for tag in self.suggest(query, k)
+        ]
+        fragment = NotStr(to_xml(Div(*buttons, cls="list-group")) if buttons else "")
+        with self._lock:
+            if self._version != cache_key[0]:
+                # Tags were added meanwhile: don't cache a possibly stale list
+                return fragment
+            if self._fragments and next(iter(self._fragments))[0] != self._version:
+                self._fragments.clear()
+            self._fragments[cache_key] = fragment
+            if len(self._fragments) > self._cache_size:
+                self._fragments.popitem(last=False)
+            return fragment
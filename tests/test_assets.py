@@ -0,0 +1,112 @@
+"""Tests for the CSS asset pipeline."""
+
+import shutil
+
+import pytest
+from fasthtml.common import fast_app
+from faststrap import add_bootstrap
+from starlette.testclient import TestClient
+
+from faststrap_community import setup_community
+from faststrap_community.assets import (
+    CSS_BUNDLE,
+    CSS_SOURCES,
+    STATIC_DIR,
+    build_css_bundle,
+    clear_bundle_cache,
+    get_css_bundle,
+    load_manifest,
+    main,
+    minify_css,
+)
+
+
+def _copy_static(tmp_path):
+    static = tmp_path / "static"
+    (static / "css").mkdir(parents=True)
+    for name in CSS_SOURCES:
+        shutil.copy(STATIC_DIR / name, static / name)
+    return static
+
+
+class TestMinifyCss:
+    def test_strips_comments_and_whitespace(self):
+        css = "/* header */\n.a  >  .b ,\n.c {\n  color : red ;\n  margin: 0 auto;\n}\n"
+        assert minify_css(css) == ".a>.b,.c{color :red;margin:0 auto}"
+
+    def test_preserves_strings_and_media_queries(self):
+        css = '.x::before { content: "a  /* b */ ;" }\n@media (max-width: 768px) and (hover) {}'
+        assert (
+            minify_css(css)
+            == '.x::before{content:"a  /* b */ ;"}@media (max-width:768px) and (hover){}'
+        )
+
+    def test_keeps_calc_operators(self):
+        assert minify_css(".a { width: calc(100% - 2rem); }") == ".a{width:calc(100% - 2rem)}"
+
+
+class TestBundle:
+    def setup_method(self):
+        clear_bundle_cache()
+
+    def teardown_method(self):
+        clear_bundle_cache()
+
+    def test_shipped_bundle_is_current(self):
+        # Rebuild with `python -m faststrap_community.assets` after editing CSS
+        manifest = load_manifest()
+        bundle = manifest[CSS_BUNDLE]["file"]
+        assert (STATIC_DIR / bundle).is_file()
+        assert get_css_bundle() == bundle
+
+    def test_build_writes_fingerprinted_bundle(self, tmp_path):
+        static = _copy_static(tmp_path)
+        manifest = build_css_bundle(static)
+
+        bundle = manifest[CSS_BUNDLE]["file"]
+        assert bundle.startswith("css/community.") and bundle.endswith(".css")
+        assert load_manifest(static) == manifest
+        css = (static / bundle).read_text()
+        assert "/*" in css.splitlines()[0]
+        assert ".fs-comm-flip-card{" in css
+
+    def test_stale_bundle_is_not_rebuilt_at_runtime(self, tmp_path):
+        static = _copy_static(tmp_path)
+        first = build_css_bundle(static)[CSS_BUNDLE]["file"]
+        manifest = (static / "manifest.json").read_text()
+
+        with open(static / "css/cards.css", "a") as f:
+            f.write("\n.fs-comm-extra { color: red; }\n")
+
+        with pytest.warns(RuntimeWarning, match="stale"):
+            assert get_css_bundle(static) is None
+        assert (static / first).exists()
+        assert (static / "manifest.json").read_text() == manifest
+        assert sorted(p.name for p in (static / "css").glob("community.*.css")) == [
+            first.rsplit("/", 1)[1]
+        ]
+
+    def test_check_command(self, capsys):
+        assert main(["--check"]) == 0
+        assert "up to date" in capsys.readouterr().out
+
+
+class TestStaticServing:
+    def test_setup_links_bundle_with_immutable_caching(self):
+        app, rt = fast_app()
+        add_bootstrap(app)
+        setup_community(app)
+
+        hrefs = [h.attrs["href"] for h in app.hdrs if hasattr(h, "attrs") and "href" in h.attrs]
+        community = [h for h in hrefs if h.startswith("/community-static/css/")]
+        assert community == [f"/community-static/{get_css_bundle()}"]
+
+        client = TestClient(app)
+        response = client.get(community[0])
+        assert response.status_code == 200
+        assert response.headers["cache-control"] == "public, max-age=31536000, immutable"
+
+        # Unversioned files keep default revalidation
+        response = client.get("/community-static/css/cards.css")
+        assert response.status_code == 200
+        assert "immutable" not in response.headers.get("cache-control", "")
@@ -0,0 +1,80 @@
+"""Tests for batch rendering."""
+
+from fasthtml.common import NotStr, to_xml
+
+from faststrap_community import (
+    PricingCard,
+    ProfileCard,
+    StatCard,
+    TiltCard,
+    TimelineCard,
+    iter_many,
+    render_many,
+    reset_community_defaults,
+    set_community_defaults,
+)
+
+
+def _loop(component, rows, **common):
+    return "".join(to_xml(component(**{**common, **row})) for row in rows)
+
+
+class TestRenderMany:
+    def setup_method(self):
+        reset_community_defaults()
+
+    def test_stat_cards_match_per_call_render(self):
+        rows = [
+            {"title": "Revenue", "value": "$45,231", "trend": "+12.5%", "icon": "💰"},
+            {"title": "Users", "value": 1204, "trend": "-3%", "trend_positive": False},
+            {"title": "Orders", "value": "87", "variant": "success", "id": "orders"},
+            {"title": "<script>", "value": "a & b", "trend": None},
+        ]
+        assert render_many(StatCard, rows) == _loop(StatCard, rows)
+
+    def test_timeline_cards_match_per_call_render(self):
+        rows = [
+            {"title": f"Event {i}", "timestamp": f"{i} min ago", "icon": "🚀"} for i in range(20)
+        ]
+        rows.append({"title": "No icon", "description": "Plain"})
+        assert render_many(TimelineCard, rows, variant="info") == _loop(
+            TimelineCard, rows, variant="info"
+        )
+
+    def test_pricing_and_profile_cards_match_per_call_render(self):
+        pricing = [
+            {"title": "Free", "price": "$0", "features": ["1 project"]},
+            {"title": "Pro", "price": "$29", "features": ["A", "B", "C"], "highlighted": True},
+        ]
+        assert render_many(PricingCard, pricing) == _loop(PricingCard, pricing)
+
+        profiles = [
+            {"name": "Jane", "title": "Dev", "avatar": "/img/jane.jpg"},
+            {"name": "O'Brien", "bio": 'Says "hi"'},
+        ]
+        assert render_many(ProfileCard, profiles) == _loop(ProfileCard, profiles)
+
+    def test_quotes_in_attribute_values(self):
+        rows = [{"name": 'Jo "JJ" Smith'}, {"name": "D'Arcy"}]
+        assert render_many(ProfileCard, rows) == _loop(ProfileCard, rows)
+
+    def test_columnar_input(self):
+        columns = {"title": ["Users", "Orders"], "value": ["1,204", "87"]}
+        rows = [{"title": "Users", "value": "1,204"}, {"title": "Orders", "value": "87"}]
+        assert render_many(StatCard, columns) == _loop(StatCard, rows)
+
+    def test_iter_many_streams_rows(self):
+        chunks = list(iter_many("TimelineCard", [{"title": "A"}, {"title": "B"}]))
+        assert len(chunks) == 2
+        assert "A" in chunks[0]
+
+    def test_components_without_slots_fall_back(self):
+        html = render_many(TiltCard, [{"cls": "p-4"}, {"cls": "p-2"}])
+        assert isinstance(html, NotStr)
+        assert html.count("fs-comm-tilt-card") == 2
+
+    def test_defaults_change_is_picked_up(self):
+        rows = [{"title": "A", "value": "1", "icon": "*"}]
+        render_many(StatCard, rows)
+        set_community_defaults("StatCard", variant="danger")
+        assert "text-danger" in render_many(StatCard, rows)
@@ -1,14 +1,19 @@
 """Tests for faststrap-community components."""
 
+import re
+
 from fasthtml.common import to_xml
 from faststrap import clear_component_defaults, set_component_defaults
 
 from faststrap_community import (
     DotsLoader,
     FlipCard,
+    ParallaxSection,
     RevealCard,
     RingLoader,
     TiltCard,
+    reset_community_defaults,
+    set_community_defaults,
 )
 
 
@@ -219,6 +224,27 @@ class TestRingLoader:
         clear_component_defaults()
 
 
+class TestParallaxSection:
+    """Tests for ParallaxSection component."""
+
+    def teardown_method(self):
+        reset_community_defaults()
+
+    def test_background_is_a_separate_layer(self):
+        html = to_xml(ParallaxSection("Hero", img_src="/bg.jpg", height="60vh"))
+        assert "background-attachment" not in html
+        assert "fs-comm-parallax-layer" in html
+        assert "background-image: url('/bg.jpg');" in html
+        assert "--fs-comm-parallax-height: 60vh;" in html
+
+    def test_speed_uses_defaults_and_is_clamped(self):
+        assert "--fs-comm-parallax-speed: 0.5;" in to_xml(ParallaxSection(img_src="/bg.jpg"))
+        set_community_defaults("ParallaxSection", speed="0.3")
+        assert "--fs-comm-parallax-speed: 0.3;" in to_xml(ParallaxSection(img_src="/bg.jpg"))
+        html = to_xml(ParallaxSection(img_src="/bg.jpg", speed=2))
+        assert "--fs-comm-parallax-speed: 1;" in html
+
+
 class TestIntegration:
     """Integration tests for community components."""
 
@@ -241,8 +267,13 @@ class TestIntegration:
         assets = get_community_assets()
         assert isinstance(assets, list)
         assert len(assets) > 0
-        # Verify CSS files are included
+        # Verify the CSS bundle is included
         hrefs = [asset.attrs.get("href") for asset in assets]
+        assert len(hrefs) == 1
+        assert re.search(r"/css/community\.[0-9a-f]{10}\.css$", hrefs[0])
+
+        # Separate stylesheets remain available
+        hrefs = [asset.attrs.get("href") for asset in get_community_assets(bundle=False)]
         assert any("community-base.css" in href for href in hrefs)
         assert any("cards.css" in href for href in hrefs)
         assert any("loaders.css" in href for href in hrefs)
@@ -0,0 +1,154 @@
+"""Tests for critical CSS inlining."""
+
+import re
+
+from fasthtml.common import Div, Li, NotStr, P, Script, Titled, Ul, fast_app
+from faststrap import add_bootstrap
+from starlette.testclient import TestClient
+
+from faststrap_community import (
+    DotsLoader,
+    Lazy,
+    RingLoader,
+    StreamingHTMLResponse,
+    WaveLoader,
+    setup_community,
+)
+from faststrap_community.critical_css import inject_critical_css
+
+
+def _app(**kwargs):
+    app, rt = fast_app()
+    add_bootstrap(app)
+    setup_community(app, inline_critical=True, **kwargs)
+
+    @rt("/")
+    def get():
+        return Titled("Home", DotsLoader())
+
+    @rt("/stream")
+    def stream():
+        return StreamingHTMLResponse(Div(DotsLoader()), title="Stream")
+
+    @rt("/stream-long")
+    def stream_long():
+        late = Lazy(lambda: [RingLoader() for _ in range(3)])
+        return StreamingHTMLResponse(
+            Div(DotsLoader(), *[P("filler " * 20) for _ in range(5)], late, WaveLoader()),
+            title="Stream",
+            chunk_size=64,
+        )
+
+    @rt("/stream-script")
+    def stream_script():
+        template = NotStr("const tpl = '<div class=\"fs-comm-wave-loader\"></div>';")
+        # A list item carrying a component class: the style can't go inside the <ul>
+        late = Lazy(lambda: [Script(template), Ul(Li("Item", cls="fs-comm-ring-loader"))])
+        return StreamingHTMLResponse(
+            Div(DotsLoader(), *[P("filler " * 20) for _ in range(5)], late),
+            title="Stream",
+            chunk_size=64,
+        )
+
+    @rt("/plain")
+    def plain():
+        return P("No community components")
+
+    return app
+
+
+class TestInjectCriticalCss:
+    def test_inlines_only_used_components(self):
+        html = b'<html><head><title>x</title></head><body><div class="fs-comm-dots-loader"></div></body></html>'
+        result = inject_critical_css(html).decode()
+        style = result[result.index("<style") : result.index("</style>")]
+        assert "</style></head>" in result
+        assert ".fs-comm-dots-loader" in style
+        assert ":root{" in style
+        assert ".fs-comm-flip-card" not in style
+
+    def test_untouched_without_head(self):
+        html = b'<div class="fs-comm-dots-loader"></div>'
+        assert inject_critical_css(html) == html
+
+    def test_not_injected_twice(self):
+        html = b"<html><head></head><body></body></html>"
+        once = inject_critical_css(html)
+        assert inject_critical_css(once) == once
+
+
+class TestCriticalCssMiddleware:
+    def test_page_gets_inline_style_and_async_stylesheet(self):
+        client = TestClient(_app())
+        response = client.get("/")
+        html = response.text
+        assert response.status_code == 200
+        assert int(response.headers["content-length"]) == len(response.content)
+
+        head = html[: html.index("</head>")]
+        assert "<style data-fs-comm-critical>" in head
+        assert ".fs-comm-dots-loader" in head
+        assert '<link rel="preload"' in head and 'as="style"' in head
+        assert "this.rel='stylesheet'" in head
+        assert "<noscript>" in head
+        assert (
+            '<link rel="stylesheet" href="/community-static/css/community.'
+            not in head.split("<noscript>")[0]
+        )
+
+    def test_page_without_components_gets_base_rules_only(self):
+        html = TestClient(_app()).get("/plain").text
+        style = html[html.index("<style data-fs-comm-critical>") : html.index("</head>")]
+        assert ":root{" in style
+        assert ".fs-comm-" not in style.replace("--fs-comm-", "")
+
+    def test_htmx_requests_pass_through(self):
+        client = TestClient(_app())
+        html = client.get("/", headers={"HX-Request": "true"}).text
+        assert "data-fs-comm-critical" not in html
+
+    def test_streaming_page(self):
+        html = TestClient(_app()).get("/stream").text
+        assert "data-fs-comm-critical" in html
+        assert ".fs-comm-dots-loader" in html[: html.index("</head>")]
+
+    def test_streamed_components_after_first_chunk_get_their_css(self):
+        html = TestClient(_app()).get("/stream-long").text
+        styles = re.findall(r"<style data-fs-comm-critical>(.*?)</style>", html)
+        assert len(styles) == 3
+        head, ring, wave = styles
+        assert ".fs-comm-dots-loader" in head and ".fs-comm-ring-loader" not in head
+        assert ".fs-comm-ring-loader" in ring and ":root" not in ring
+        assert ".fs-comm-dots-loader" not in ring
+        assert ".fs-comm-wave-loader" in wave
+        # Each late style comes right before the first element that needs it
+        assert re.search(r'</style>\s*<div class="fs-comm-ring-loader', html)
+        assert re.search(r'</style>\s*<div class="fs-comm-wave-loader', html)
+        assert html.count('class="fs-comm-ring-loader') == 3
+
+    def test_late_styles_skip_scripts_and_stay_out_of_lists(self):
+        html = TestClient(_app()).get("/stream-script").text
+        styles = re.findall(r"<style data-fs-comm-critical>(.*?)</style>", html)
+        assert len(styles) == 2
+        assert ".fs-comm-wave-loader" not in "".join(styles)
+        assert ".fs-comm-ring-loader" in styles[1]
+        assert "const tpl = '<div class=\"fs-comm-wave-loader\"></div>';</script>" in html
+        # Before the list, not between <ul> and <li>
+        assert re.search(r'</style>\s*<ul>\s*<li class="fs-comm-ring-loader">', html)
+
+    def test_subset_stylesheet_is_loaded_async(self):
+        app = _app(css_components=["DotsLoader"])
+        preload = [
+            h
+            for h in app.hdrs
+            if getattr(h, "tag", None) == "link" and h.attrs.get("rel") == "preload"
+        ]
+        assert len(preload) == 1
+        assert "/css/subset/DotsLoader." in preload[0].attrs["href"]
+
+    def test_idempotent(self):
+        app = _app()
+        count, middleware = len(app.hdrs), len(app.user_middleware)
+        setup_community(app, inline_critical=True)
+        assert len(app.hdrs) == count
+        assert len(app.user_middleware) == middleware
@@ -0,0 +1,129 @@
+"""Tests for usage-driven CSS tree-shaking."""
+
+import pytest
+from fasthtml.common import Div, fast_app
+from faststrap import add_bootstrap
+from starlette.testclient import TestClient
+
+from faststrap_community import (
+    CommunityStyles,
+    DotsLoader,
+    FlipCard,
+    RevealCard,
+    ScrollReveal,
+    SkeletonLoader,
+    StatCard,
+    build_css_subset,
+    components_in,
+    list_used_components,
+    partition_css,
+    render_cached,
+    reset_component_usage,
+    setup_community,
+)
+from faststrap_community.css_partitions import parse_css_rules
+from faststrap_community.registry import find_component_by_class
+
+
+class TestPartitioning:
+    def test_longest_class_root_wins(self):
+        assert find_component_by_class("fs-comm-reveal") == "ScrollReveal"
+        assert find_component_by_class("fs-comm-reveal-card") == "RevealCard"
+        assert find_component_by_class("fs-comm-flip-card-inner") == "FlipCard"
+        assert find_component_by_class("fs-comm-revealed") is None
+
+    def test_keyframes_follow_their_users(self):
+        rules = parse_css_rules(
+            ".fs-comm-dots-loader div { animation: fs-comm-dots-bounce 1s; }\n"
+            "@keyframes fs-comm-dots-bounce { 0% { opacity: 0 } }\n"
+            "@keyframes unused { 0% { opacity: 0 } }\n"
+            "@media (max-width: 768px) { .fs-comm-flip-card { height: 1px } }"
+        )
+        owners = [set(r.owners) for r in rules]
+        assert owners == [{"DotsLoader"}, {"DotsLoader"}, set(), {"FlipCard"}]
+
+    def test_partitions(self):
+        partitions = partition_css()
+        assert ":root{" in partitions["base"]
+        assert ".fs-comm-dots-loader" not in partitions["base"]
+        assert "@keyframes fs-comm-dots-bounce" in partitions["DotsLoader"]
+        assert ".skeleton-line" in partitions["SkeletonLoader"]
+        assert (
+            "@media (prefers-reduced-motion:reduce){.fs-comm-parallax"
+            in partitions["ParallaxSection"]
+        )
+        assert "@keyframes fs-comm-parallax-shift" in partitions["ParallaxSection"]
+
+    def test_subset_contains_only_requested_components(self):
+        path, css = build_css_subset(["DotsLoader", "StatCard"])
+        css = css.decode()
+        # StatCard has no stylesheet rules, so it doesn't change the subset
+        assert path.startswith("css/subset/DotsLoader.")
+        assert ":root{" in css
+        assert ".fs-comm-dots-loader" in css
+        assert ".fs-comm-ring-loader" not in css
+        assert ".fs-comm-flip-card" not in css
+        assert len(css) < len(partition_css()["ShadowLoader"])
+
+    def test_unknown_component(self):
+        with pytest.raises(ValueError, match="Unknown community components: Nope"):
+            build_css_subset(["Nope"])
+
+
+class TestUsage:
+    def setup_method(self):
+        reset_component_usage()
+
+    def test_components_in_walks_content(self):
+        content = Div(
+            FlipCard(front="A", back="B"),
+            RevealCard(img_src="/a.png", title="T"),
+            ScrollReveal(StatCard(title="Users", value="1")),
+            render_cached(SkeletonLoader, lines=2),
+        )
+        assert components_in(content) == {
+            "FlipCard",
+            "RevealCard",
+            "ScrollReveal",
+            "SkeletonLoader",
+        }
+        assert list_used_components() == [
+            "FlipCard",
+            "RevealCard",
+            "ScrollReveal",
+            "SkeletonLoader",
+        ]
+
+    def test_community_styles_link(self):
+        link = CommunityStyles(Div(DotsLoader()), static_url="/assets")
+        assert link.attrs["href"].startswith("/assets/css/subset/DotsLoader.")
+
+
+class TestServing:
+    def _client(self, **kwargs):
+        app, rt = fast_app()
+        add_bootstrap(app)
+        setup_community(app, **kwargs)
+        return app, TestClient(app)
+
+    def test_setup_links_precomputed_subset(self):
+        app, client = self._client(css_components=["DotsLoader", "FlipCard"])
+        hrefs = [h.attrs["href"] for h in app.hdrs if hasattr(h, "attrs") and "href" in h.attrs]
+        subset = [h for h in hrefs if "/community-static/css/" in h]
+        assert len(subset) == 1
+        assert "/css/subset/DotsLoader-FlipCard." in subset[0]
+
+        response = client.get(subset[0])
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/css")
+        assert "immutable" in response.headers["cache-control"]
+        assert ".fs-comm-flip-card" in response.text
+
+    def test_subsets_are_served_from_url_alone(self):
+        _, client = self._client(css_components=[])
+        path, css = build_css_subset(["RingLoader"])
+        assert client.get(f"/community-static/{path}").content == css
+        assert (
+            client.get("/community-static/css/subset/RingLoader.0000000000.css").status_code == 404
+        )
+        assert client.get("/community-static/css/subset/Nope.0000000000.css").status_code == 404
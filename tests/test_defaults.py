@@ -1,9 +1,17 @@
 """Tests for community defaults system."""
 
+import pytest
+from faststrap import reset_component_defaults, set_component_defaults
+from faststrap.core.theme import resolve_defaults
+
+from faststrap_community import defaults as defaults_module
 from faststrap_community.defaults import (
     get_community_defaults,
+    get_community_overrides,
+    get_defaults_version,
     list_community_components,
     reset_community_defaults,
+    resolve_community_defaults,
     set_community_defaults,
 )
 
@@ -13,12 +21,42 @@ class TestCommunityDefaults:
         """Reset defaults before each test."""
         reset_community_defaults()
 
-    def test_get_defaults_returns_copy(self):
-        """Ensure get_community_defaults returns a copy, not reference."""
+    def test_get_defaults_is_read_only(self):
+        """Ensure get_community_defaults returns a shared, read-only mapping."""
         defaults1 = get_community_defaults("FlipCard")
         defaults2 = get_community_defaults("FlipCard")
         assert defaults1 == defaults2
-        assert defaults1 is not defaults2  # Different objects
+        assert defaults1 is defaults2  # No per-call copy
+        with pytest.raises(TypeError):
+            defaults1["height"] = "1px"
+
+    def test_set_defaults_does_not_mutate_previous_snapshot(self):
+        """Ensure readers holding a mapping never see it change."""
+        before = get_community_defaults("FlipCard")
+        set_community_defaults("FlipCard", height="500px")
+        assert before["height"] == "300px"
+        assert get_community_defaults("FlipCard")["height"] == "500px"
+
+    def test_reset_restores_pristine_defaults(self):
+        """Ensure set_community_defaults never leaks into the built-in table."""
+        set_community_defaults("FlipCard", height="999px")
+        reset_community_defaults()
+        assert get_community_defaults("FlipCard")["height"] == "300px"
+
+    def test_version_increments_on_change(self):
+        """Ensure every change bumps the defaults version."""
+        version = get_defaults_version()
+        set_community_defaults("FlipCard", height="500px")
+        assert get_defaults_version() == version + 1
+        reset_community_defaults()
+        assert get_defaults_version() == version + 2
+
+    def test_overrides_track_user_values_only(self):
+        """Ensure overrides hold only values set by the user."""
+        set_community_defaults("FlipCard", height="500px")
+        assert dict(get_community_overrides("FlipCard")) == {"height": "500px"}
+        reset_community_defaults()
+        assert dict(get_community_overrides("FlipCard")) == {}
 
     def test_set_defaults(self):
         """Test setting custom defaults."""
@@ -56,3 +94,49 @@ class TestCommunityDefaults:
         """Test that unknown component returns empty dict."""
         defaults = get_community_defaults("NonExistentComponent")
         assert defaults == {}
+
+
+class TestResolveCommunityDefaults:
+    def setup_method(self):
+        reset_community_defaults()
+        reset_component_defaults()
+
+    def teardown_method(self):
+        reset_community_defaults()
+        reset_component_defaults()
+
+    def test_builtin_defaults(self):
+        resolved = resolve_community_defaults("FlipCard")
+        assert resolved["height"] == "300px"
+
+    def test_cached_between_calls(self):
+        assert resolve_community_defaults("FlipCard") is resolve_community_defaults("FlipCard")
+
+    def test_core_defaults_override_builtin(self):
+        set_component_defaults("FlipCard", height="500px")
+        resolved = resolve_community_defaults("FlipCard")
+        assert resolved["height"] == "500px"
+        assert resolved["width"] == "100%"
+
+    def test_core_defaults_use_public_resolver(self, monkeypatch):
+        calls = []
+
+        def spy(component, **kwargs):
+            calls.append(component)
+            return resolve_defaults(component, **kwargs)
+
+        monkeypatch.setattr(defaults_module, "resolve_defaults", spy)
+        resolve_community_defaults("FlipCard")
+        assert calls == ["FlipCard"]
+
+    def test_community_overrides_win_over_core(self):
+        set_component_defaults("FlipCard", height="500px")
+        set_community_defaults("FlipCard", height="700px")
+        assert resolve_community_defaults("FlipCard")["height"] == "700px"
+
+    def test_invalidated_on_change(self):
+        before = resolve_community_defaults("RingLoader")
+        set_community_defaults("RingLoader", size="80px")
+        after = resolve_community_defaults("RingLoader")
+        assert after is not before
+        assert after["size"] == "80px"
@@ -0,0 +1,199 @@
+"""Tests for the responsive image pipeline and the components using it."""
+
+import pytest
+from fasthtml.common import to_xml
+from starlette.applications import Starlette
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from faststrap_community import (
+    ParallaxSection,
+    ProfileCard,
+    RevealCard,
+    render_many,
+    responsive_background,
+    responsive_img,
+    skeleton_for,
+)
+from faststrap_community.images import ResponsiveImage, set_image_pipeline
+
+SAMPLE = ResponsiveImage(
+    width=1200,
+    height=800,
+    src="/community-images/0123456789abcdef-960.webp",
+    sources=(
+        ("image/avif", "/community-images/0123456789abcdef-320.avif 320w"),
+        ("image/webp", "/community-images/0123456789abcdef-320.webp 320w"),
+    ),
+    backgrounds=(
+        ("image/avif", "/community-images/0123456789abcdef-1200.avif"),
+        ("image/webp", "/community-images/0123456789abcdef-1200.webp"),
+    ),
+    lqip="data:image/webp;base64,AAAA",
+)
+
+
+class StaticPipeline:
+    """Describes every ``/static/`` URL as SAMPLE."""
+
+    def describe(self, src):
+        return SAMPLE if src.startswith("/static/") else None
+
+
+@pytest.fixture
+def pipeline():
+    set_image_pipeline(StaticPipeline())
+    yield
+    set_image_pipeline(None)
+
+
+class TestWithoutPipeline:
+    def test_plain_lazy_img(self):
+        html = to_xml(responsive_img("/a.jpg", alt="A", width=10, height=5))
+        assert "<picture" not in html
+        assert 'loading="lazy"' in html
+        assert 'decoding="async"' in html
+        assert 'width="10"' in html
+
+    def test_loading_can_be_overridden(self):
+        assert 'loading="eager"' in to_xml(responsive_img("/a.jpg", loading="eager"))
+
+    def test_background_is_plain_url(self):
+        assert responsive_background("/bg.jpg") == "background-image: url('/bg.jpg');"
+
+    def test_profile_card_has_no_third_party_placeholder(self):
+        html = to_xml(ProfileCard(name="Ada"))
+        assert "via.placeholder.com" not in html
+        assert "data:image/svg+xml" in html
+        assert 'width="100"' in html
+        assert 'height="100"' in html
+
+
+class TestWithPipeline:
+    def test_picture_with_sources(self, pipeline):
+        html = to_xml(responsive_img("/static/a.jpg", alt="A", sizes="50vw"))
+        assert '<picture class="fs-comm-picture">' in html
+        assert html.index('type="image/avif"') < html.index('type="image/webp"')
+        assert 'sizes="50vw"' in html
+        assert 'src="/community-images/0123456789abcdef-960.webp"' in html
+        assert 'width="1200"' in html
+        assert 'height="800"' in html
+        assert "data:image/webp;base64,AAAA" in html
+
+    def test_unhandled_source_stays_plain(self, pipeline):
+        html = to_xml(responsive_img("https://cdn.example.com/a.jpg"))
+        assert "<picture" not in html
+        assert "https://cdn.example.com/a.jpg" in html
+
+    def test_background_image_set(self, pipeline):
+        style = responsive_background("/static/bg.jpg")
+        assert "url('/community-images/0123456789abcdef-1200.webp')" in style
+        assert "type('image/avif')" in style
+        assert style.index("background-image: url(") < style.index("image-set(")
+
+    def test_components(self, pipeline):
+        assert "image-set(" in to_xml(ParallaxSection(img_src="/static/bg.jpg"))
+        reveal = to_xml(RevealCard(img_src="/static/card.jpg", title="T"))
+        assert "fs-comm-reveal-image" in reveal
+        assert "<picture" in reveal
+        profile = to_xml(ProfileCard(name="Ada", avatar="/static/ada.jpg"))
+        assert "<picture" in profile
+        assert 'width="100"' in profile
+
+    def test_skeletons_keep_the_image_size(self, pipeline):
+        profile = str(skeleton_for(ProfileCard, name="Ada", avatar="/static/ada.jpg"))
+        assert "<picture" not in profile and "<img" not in profile
+        assert "width: 100px;" in profile and "height: 100px;" in profile
+        assert "loading=" not in profile and "decoding=" not in profile
+        assert "data:image/webp" not in profile
+
+        reveal = str(skeleton_for(RevealCard, img_src="/static/card.jpg", title="T"))
+        assert "width: 1200px;" in reveal and "height: 800px;" in reveal
+        assert "fs-comm-picture" in reveal and "fs-comm-reveal-image" in reveal
+
+    def test_render_many_matches_per_call(self, pipeline):
+        rows = [
+            {"name": "Ada", "avatar": "/static/ada.jpg"},
+            {"name": "Bob", "avatar": "https://cdn.example.com/bob.jpg"},
+        ]
+        assert render_many(ProfileCard, rows) == [to_xml(ProfileCard(**row)) for row in rows]
+
+
+class TestImagePipeline:
+    @pytest.fixture
+    def images(self, tmp_path):
+        Image = pytest.importorskip("PIL.Image")
+        from faststrap_community import ImagePipeline
+
+        source = tmp_path / "static"
+        source.mkdir()
+        Image.new("RGB", (800, 600), (200, 30, 30)).save(source / "photo.png")
+        return ImagePipeline(
+            source, source_url="/static", cache_dir=tmp_path / "cache", widths=(320, 640, 1280)
+        )
+
+    def test_describe(self, images):
+        info = images.describe("/static/photo.png")
+        assert (info.width, info.height) == (800, 600)
+        assert info.lqip.startswith("data:image/webp;base64,")
+        webp = dict(info.sources)["image/webp"]
+        # Never upscaled: the largest candidate is the source width
+        assert webp.endswith("-800.webp 800w")
+        assert "1280" not in webp
+        assert images.describe("/static/missing.png") is None
+        assert images.describe("/static/../secret.png") is None
+        assert images.describe("https://example.com/static/photo.png") is None
+
+    def test_derive_only_advertised_names(self, images):
+        from PIL import Image
+
+        info = images.describe("/static/photo.png")
+        digest = info.src.rsplit("/", 1)[1].split("-")[0]
+        path = images.derive(f"{digest}-640.webp")
+        with Image.open(path) as im:
+            assert im.size == (640, 480)
+        # Served from the cache afterwards
+        assert images.derive(f"{digest}-640.webp") == path
+        assert images.derive(f"{digest}-500.webp") is None
+        assert images.derive("ffffffffffffffff-640.webp") is None
+        assert images.derive("../photo.png") is None
+
+    def test_other_workers_derive_from_sidecar(self, images):
+        from faststrap_community import ImagePipeline
+
+        info = images.describe("/static/photo.png")
+        digest = info.src.rsplit("/", 1)[1].split("-")[0]
+        # Another worker (or a restart) sharing the cache dir, never described the image
+        worker = ImagePipeline(
+            images.source_dir,
+            source_url="/static",
+            cache_dir=images.cache_dir,
+            widths=images.widths,
+        )
+        assert worker.derive(f"{digest}-320.webp") is not None
+        assert worker.derive(f"{digest}-500.webp") is None
+
+    def test_sidecar_cannot_escape_source_dir(self, images, tmp_path):
+        (tmp_path / "secret.png").write_bytes((images.source_dir / "photo.png").read_bytes())
+        images.cache_dir.mkdir()
+        (images.cache_dir / "0123456789abcdef.json").write_text(
+            '{"source": "../secret.png", "widths": [320]}'
+        )
+        assert images.derive("0123456789abcdef-320.webp") is None
+
+    def test_changed_source_is_not_derived_under_old_name(self, images):
+        from PIL import Image
+
+        info = images.describe("/static/photo.png")
+        digest = info.src.rsplit("/", 1)[1].split("-")[0]
+        Image.new("RGB", (800, 600), (30, 200, 30)).save(images.source_dir / "photo.png")
+        assert images.derive(f"{digest}-320.webp") is None
+
+    def test_endpoint(self, images):
+        client = TestClient(Starlette(routes=[Route(f"{images.url}/{{name}}", images.endpoint)]))
+        info = images.describe("/static/photo.png")
+        response = client.get(info.src)
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "image/webp"
+        assert "immutable" in response.headers["cache-control"]
+        assert client.get(f"{images.url}/ffffffffffffffff-640.webp").status_code == 404
@@ -9,8 +9,7 @@ def test_asset_loading():
 
     # Check if community CSS links are in hdrs
     hrefs = [h.attrs.get("href") for h in app.hdrs if hasattr(h, "attrs") and h.tag == "link"]
-    assert any("community-base.css" in h for h in hrefs)
-    assert any("cards.css" in h for h in hrefs)
+    assert sum("/css/community." in h for h in hrefs) == 1
 
 
 def test_idempotent_setup():
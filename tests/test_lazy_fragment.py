@@ -0,0 +1,190 @@
+"""Tests for LazyFragment and the fragment route cache."""
+
+import asyncio
+
+import pytest
+from fasthtml.common import HtmxResponseHeaders, P, Script, Title, fast_app, to_xml
+from starlette.responses import RedirectResponse
+from starlette.testclient import TestClient
+
+from faststrap_community import FragmentCache, LazyFragment, RingLoader, cache_fragment
+from faststrap_community import fragment_cache as fragment_cache_module
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(fragment_cache_module.time, "monotonic", fake)
+    return fake
+
+
+class TestLazyFragment:
+    def test_renders_skeleton_with_htmx_loading(self):
+        html = to_xml(LazyFragment("/panels/revenue"))
+        assert 'hx-get="/panels/revenue"' in html
+        assert 'hx-trigger="intersect once"' in html
+        assert 'hx-swap="outerHTML"' in html
+        assert "fs-comm-skeleton-loader" in html
+
+    def test_custom_loader_and_trigger(self):
+        html = to_xml(LazyFragment("/p", skeleton=RingLoader(), trigger="revealed", cls="h-100"))
+        assert "fs-comm-ring-loader" in html
+        assert "fs-comm-skeleton-loader" not in html
+        assert 'hx-trigger="revealed"' in html
+        assert "fs-comm-lazy-fragment h-100" in html
+
+
+class TestFragmentCache:
+    def test_ttl_expiry(self, clock):
+        cache = FragmentCache(ttl=10)
+        cache.set("k", "<p>x</p>")
+        clock.now += 9
+        assert cache.get("k") == "<p>x</p>"
+        clock.now += 2
+        assert cache.get("k") is None
+        assert cache.info() == {"hits": 1, "misses": 1, "size": 0, "maxsize": 256}
+
+    def test_lru_eviction(self, clock):
+        cache = FragmentCache(maxsize=2)
+        cache.set("a", "A")
+        cache.set("b", "B")
+        cache.get("a")
+        cache.set("c", "C")
+        assert cache.get("b") is None
+        assert cache.get("a") == "A" and cache.get("c") == "C"
+
+    def test_rejects_invalid_bounds(self):
+        with pytest.raises(ValueError):
+            FragmentCache(ttl=0)
+        with pytest.raises(ValueError):
+            FragmentCache(maxsize=0)
+
+
+class TestCacheFragment:
+    def test_caches_per_bound_parameters(self, clock):
+        calls = []
+
+        @cache_fragment(ttl=30)
+        def panel(name: str, days: int = 7):
+            calls.append((name, days))
+            return P(f"{name} {days}")
+
+        first = panel("revenue")
+        assert str(first) == to_xml(P("revenue 7"))
+        assert panel("revenue", days=7) is first
+        assert panel(name="revenue") is first
+        panel("revenue", 30)
+        assert calls == [("revenue", 7), ("revenue", 30)]
+
+        clock.now += 31
+        panel("revenue")
+        assert len(calls) == 3
+
+    def test_invalidate_by_parameter(self, clock):
+        @cache_fragment()
+        def panel(name: str, days: int = 7):
+            return P(name)
+
+        panel("revenue")
+        panel("revenue", 30)
+        panel("users")
+        assert panel.cache.invalidate(name="revenue") == 2
+        assert panel.cache.info()["size"] == 1
+
+    def test_uncacheable_calls_and_responses_bypass(self):
+        calls = []
+
+        @cache_fragment()
+        def panel(data, go: bool = False):
+            calls.append(data)
+            return RedirectResponse("/") if go else P("x")
+
+        panel({"a": 1})
+        panel({"a": 1})
+        panel("x", go=True)
+        assert len(calls) == 3
+        assert panel.cache.info()["size"] == 0
+
+    def test_excluded_parameters(self):
+        @cache_fragment(exclude=("req",))
+        def panel(req, name: str):
+            return P(name)
+
+        assert panel(object(), "a") is panel(object(), "a")
+
+    def test_async_handler(self):
+        calls = []
+
+        @cache_fragment()
+        async def panel(name: str):
+            calls.append(name)
+            return P(name)
+
+        first = asyncio.run(panel("a"))
+        assert asyncio.run(panel("a")) is first
+        assert calls == ["a"]
+
+    def test_fasthtml_route(self):
+        app, rt = fast_app()
+        calls = []
+
+        @rt("/panels/{name}")
+        @cache_fragment(ttl=30)
+        def get(name: str, days: int = 7):
+            calls.append(name)
+            return P(f"{name} {days}")
+
+        client = TestClient(app)
+        headers = {"HX-Request": "true"}
+        assert "revenue 7" in client.get("/panels/revenue", headers=headers).text
+        assert "revenue 7" in client.get("/panels/revenue?days=7", headers=headers).text
+        assert "revenue 30" in client.get("/panels/revenue?days=30", headers=headers).text
+        assert calls == ["revenue", "revenue"]
+
+    def test_full_page_requests_keep_page_wrapper(self):
+        app, rt = fast_app(hdrs=(Script(src="/app.js"),))
+        calls = []
+
+        @rt("/report")
+        @cache_fragment(ttl=30)
+        def get():
+            calls.append(1)
+            return Title("Report"), P("body")
+
+        client = TestClient(app)
+        for _ in range(2):
+            html = client.get("/report").text
+            assert "<!doctype html>" in html
+            assert '<script src="/app.js"></script>' in html
+            assert html.index("<title>Report</title>") < html.index("</head>")
+            assert html.index("<p>body</p>") > html.index("<body>")
+        fragment = client.get("/report", headers={"HX-Request": "true"}).text
+        assert "<html" not in fragment and "<p>body</p>" in fragment
+        assert calls == [1]
+
+    def test_results_with_response_headers_are_not_cached(self):
+        app, rt = fast_app()
+        calls = []
+
+        @rt("/save")
+        @cache_fragment(ttl=30)
+        def get():
+            calls.append(1)
+            return P("saved"), HtmxResponseHeaders(trigger="done")
+
+        client = TestClient(app)
+        for _ in range(2):
+            response = client.get("/save", headers={"HX-Request": "true"})
+            assert response.headers["hx-trigger"] == "done"
+            assert "HttpHeader" not in response.text
+            assert "<p>saved</p>" in response.text
+        assert calls == [1, 1]
+        assert get.cache.info()["size"] == 0
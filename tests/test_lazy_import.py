@@ -0,0 +1,58 @@
+"""Tests for lazy package exports."""
+
+import subprocess
+import sys
+
+import pytest
+
+import faststrap_community
+from faststrap_community import registry
+
+
+def _run(code: str) -> str:
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return result.stdout.strip()
+
+
+def test_import_does_not_load_components():
+    out = _run(
+        "import sys, faststrap_community\n"
+        "print(sorted(m for m in sys.modules if m.startswith('faststrap_community.')))\n"
+        "print('fasthtml.common' in sys.modules)"
+    )
+    modules, fasthtml_loaded = out.splitlines()
+    assert modules == "['faststrap_community.registry']"
+    assert fasthtml_loaded == "False"
+
+
+def test_attribute_access_loads_defining_module():
+    out = _run(
+        "import sys, faststrap_community as fc\n"
+        "fc.FlipCard\n"
+        "print('faststrap_community.cards.flip_card' in sys.modules,"
+        " 'faststrap_community.cards.stat_card' in sys.modules)"
+    )
+    assert out == "True False"
+
+
+def test_registry_lookup_loads_component():
+    out = _run(
+        "import faststrap_community\n"
+        "from faststrap_community.registry import get_component\n"
+        "print(get_component('StatCard').__name__)"
+    )
+    assert out == "StatCard"
+
+
+def test_exports_resolve():
+    for name in faststrap_community.__all__:
+        assert getattr(faststrap_community, name) is not None
+    assert set(faststrap_community.__all__) <= set(dir(faststrap_community))
+    assert registry.get_component("TagInput") is faststrap_community.TagInput
+
+
+def test_unknown_attribute_raises():
+    with pytest.raises(AttributeError):
+        faststrap_community.NotAComponent  # noqa: B018
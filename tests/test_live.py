@@ -0,0 +1,149 @@
+"""Tests for the live update broadcast hub."""
+
+import asyncio
+import threading
+
+import pytest
+from fasthtml.common import Div, fast_app, to_xml
+from faststrap import add_bootstrap
+from starlette.testclient import TestClient
+
+from faststrap_community import StatCard, TimelineCard, setup_community
+from faststrap_community.live import BroadcastHub, LiveUpdates
+
+
+def _card(value):
+    return StatCard(title="Users", value=value, id="users")
+
+
+def test_update_is_rendered_once_and_shared():
+    async def main():
+        hub = BroadcastHub()
+        subs = [hub.subscribe(["users"]) for _ in range(3)]
+        assert hub.publish("users", _card("1")) == 3
+        messages = [s.drain() for s in subs]
+        assert all(m is messages[0] for m in messages)
+        return messages[0].decode()
+
+    message = asyncio.run(main())
+    assert message.startswith("event: update\ndata: <div")
+    assert 'hx-swap-oob="true"' in message
+
+
+def test_published_element_is_not_modified():
+    async def main():
+        hub = BroadcastHub()
+        card = _card("1")
+        hub.publish("users", card)
+        return card
+
+    assert "hx-swap-oob" not in to_xml(asyncio.run(main()))
+
+
+def test_topic_updates_coalesce():
+    async def main():
+        hub = BroadcastHub()
+        sub = hub.subscribe(["users", "revenue"])
+        for i in range(5):
+            hub.publish("users", _card(str(i)))
+        hub.publish("revenue", StatCard(title="Revenue", value="$1", id="revenue"))
+        return len(sub), sub.drain().decode()
+
+    pending, message = asyncio.run(main())
+    assert pending == 2
+    assert ">4</h2>" in message and ">3</h2>" not in message
+    assert "Revenue" in message
+
+
+@pytest.mark.parametrize(
+    "policy, kept, closed",
+    [
+        ("drop_oldest", ["2", "3"], False),
+        ("drop_newest", ["0", "1"], False),
+        ("disconnect", [], True),
+    ],
+)
+def test_drop_policies(policy, kept, closed):
+    async def main():
+        hub = BroadcastHub()
+        sub = hub.subscribe(["deploys"], maxsize=2, policy=policy)
+        for i in range(4):
+            hub.publish(
+                "deploys", TimelineCard(title=f"#{i}"), swap="afterbegin:#feed", coalesce=False
+            )
+        return sub, sub.drain().decode(), hub.subscriber_count("deploys")
+
+    sub, message, count = asyncio.run(main())
+    assert [n for n in "0123" if f"#{n}" in message] == kept
+    assert sub.closed is closed
+    assert sub.dropped == (1 if closed else 2)
+    assert count == (0 if closed else 1)
+
+
+def test_swap_strategy_wraps_content():
+    hub = BroadcastHub()
+    message = hub.render(TimelineCard(title="Deployed"), swap="afterbegin:#feed").decode()
+    assert 'hx-swap-oob="afterbegin:#feed"' in message.splitlines()[1]
+
+
+def test_requires_ids_for_replacement():
+    with pytest.raises(ValueError, match="id"):
+        BroadcastHub().render(StatCard(title="Users", value="1"))
+
+
+def test_invalid_policy():
+    with pytest.raises(ValueError, match="drop policy"):
+        BroadcastHub(policy="block")
+
+
+def test_new_subscribers_get_latest_value():
+    async def main():
+        hub = BroadcastHub()
+        hub.subscribe(["users"])
+        hub.publish("users", _card("7"))
+        return hub.subscribe(["users"]).drain().decode()
+
+    assert ">7</h2>" in asyncio.run(main())
+
+
+def test_publish_threadsafe_after_loop_closed():
+    hub = BroadcastHub()
+
+    async def main():
+        hub.subscribe(["users"])
+
+    asyncio.run(main())
+    hub.publish_threadsafe("users", _card("5"))
+    assert b"5" in hub._last["users"]
+
+
+def test_publish_threadsafe_and_stream():
+    async def main():
+        hub = BroadcastHub()
+        stream = hub.stream(["users"], keepalive=5)
+        first = asyncio.ensure_future(stream.__anext__())
+        await asyncio.sleep(0)
+        thread = threading.Thread(target=hub.publish_threadsafe, args=("users", _card("9")))
+        thread.start()
+        chunk = await asyncio.wait_for(first, 5)
+        thread.join()
+        await stream.aclose()
+        return chunk, hub.subscriber_count("users")
+
+    chunk, count = asyncio.run(main())
+    assert b">9</h2>" in chunk
+    assert count == 0
+
+
+def test_live_updates_element():
+    html = to_xml(Div(LiveUpdates("users", "revenue")))
+    assert 'sse-connect="/community-live?topic=users&amp;topic=revenue"' in html
+    assert 'sse-swap="update"' in html
+    assert 'hx-swap="none"' in html
+
+
+def test_setup_mounts_route():
+    app, rt = fast_app()
+    add_bootstrap(app)
+    setup_community(app)
+    assert TestClient(app).get("/community-live").status_code == 400
@@ -1,6 +1,19 @@
-from fasthtml.common import to_xml
+import re
 
-from faststrap_community import DotsLoader, RingLoader
+from fasthtml.common import Div, P, to_xml
+
+from faststrap_community import (
+    DotsLoader,
+    ProfileCard,
+    RingLoader,
+    ScrollReveal,
+    StatCard,
+    TimelineCard,
+    reset_community_defaults,
+    script_scope,
+    set_community_defaults,
+    skeleton_for,
+)
 
 
 def test_dots_loader():
@@ -16,3 +29,51 @@ def test_ring_loader():
     assert "fs-comm-ring-loader" in xml
     assert "border-color: var(--bs-success)" in xml
     assert "width: 100px" in xml
+
+
+class TestSkeletonFor:
+    def setup_method(self):
+        reset_community_defaults()
+
+    def teardown_method(self):
+        reset_community_defaults()
+
+    def test_keeps_box_structure_and_masks_text(self):
+        real = to_xml(StatCard(title="Revenue", value="$12,400", trend="+4%"), indent=False)
+        skeleton = str(skeleton_for(StatCard, title="Revenue", value="$12,400", trend="+4%"))
+        tags = re.compile(r"<(\w+)")
+        # Same elements, plus one wrapper per text node
+        assert [t for t in tags.findall(skeleton) if t != "span"] == [
+            t for t in tags.findall(real) if t != "span"
+        ]
+        assert 'class="fs-comm-skeleton fs-comm-stat-card card"' in skeleton
+        assert '<span class="fs-comm-skeleton-text">Revenue</span>' in skeleton
+        assert 'aria-hidden="true"' in skeleton and " inert" in skeleton
+
+    def test_strips_ids_behavior_and_media(self):
+        skeleton = str(
+            skeleton_for(ProfileCard, name="Ada", avatar="/ada.png", id="p", hx_get="/x")
+        )
+        assert "id=" not in skeleton and "hx-get" not in skeleton
+        assert "<img" not in skeleton and "/ada.png" not in skeleton
+        assert "fs-comm-skeleton-block rounded-circle" in skeleton
+        assert "width: 100px; height: 100px;" in skeleton
+
+    def test_cached_per_shape_and_defaults(self):
+        first = skeleton_for("StatCard", title="Users", value="1,204")
+        assert skeleton_for(StatCard, title="Users", value="1,204") is first
+        assert skeleton_for(StatCard, title="Users", value="1,204,000") is not first
+
+        set_community_defaults("ScrollReveal", duration="1s")
+        assert skeleton_for(StatCard, title="Users", value="1,204") is not first
+
+    def test_sample_does_not_consume_script_scope(self):
+        with script_scope():
+            skeleton = str(skeleton_for(ScrollReveal, content=P("Soon")))
+            page = to_xml(Div(ScrollReveal(P("Real")), ScrollReveal(P("Again"))))
+        assert "<script" not in skeleton
+        assert page.count("js/scroll-reveal.js") == 1
+
+    def test_uncacheable_arguments_still_render(self):
+        skeleton = str(skeleton_for(TimelineCard, title="Deployed", description=Div("v1.2")))
+        assert '<span class="fs-comm-skeleton-text">v1.2</span>' in skeleton
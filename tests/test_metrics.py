@@ -0,0 +1,179 @@
+"""Tests for per-component render metrics."""
+
+import threading
+
+import pytest
+from fasthtml.common import Div, fast_app, to_xml
+from faststrap import add_bootstrap
+from starlette.testclient import TestClient
+
+import faststrap_community
+from faststrap_community import Lazy, registry, setup_community
+from faststrap_community.cards import stat_card
+from faststrap_community.metrics import (
+    disable_metrics,
+    enable_metrics,
+    get_metrics,
+    get_response_metrics,
+    metrics_enabled,
+    render_prometheus,
+    reset_metrics,
+)
+from faststrap_community.registry import get_component, register_component
+
+
+@pytest.fixture(autouse=True)
+def _metrics_off():
+    yield
+    disable_metrics()
+    reset_metrics()
+
+
+class TestInstrumentation:
+    def test_disabled_by_default_calls_originals(self):
+        assert not metrics_enabled()
+        assert not hasattr(get_component("StatCard"), "__wrapped__")
+
+    def test_enable_swaps_components_everywhere(self):
+        original = get_component("StatCard")
+        enable_metrics()
+
+        wrapped = get_component("StatCard")
+        assert wrapped.__wrapped__ is original
+        assert stat_card.StatCard is wrapped
+        assert faststrap_community.StatCard is wrapped
+
+        disable_metrics()
+        assert get_component("StatCard") is original
+        assert stat_card.StatCard is original
+        assert faststrap_community.StatCard is original
+
+    def test_enable_is_idempotent(self):
+        enable_metrics()
+        wrapped = get_component("StatCard")
+        enable_metrics()
+        assert get_component("StatCard") is wrapped
+
+    def test_records_calls_time_and_bytes(self):
+        enable_metrics()
+        StatCard = get_component("StatCard")
+        html = to_xml(StatCard(title="Users", value="1,204"))
+        StatCard(title="Users", value="1,204")
+
+        m = get_metrics()["StatCard"]
+        assert m["calls"] == 2
+        assert m["bytes"] == 2 * len(html)
+        assert m["seconds"] > 0
+        assert set(m["quantiles"]) == {0.5, 0.9, 0.99}
+
+    def test_nested_calls_are_sized_once(self):
+        enable_metrics()
+
+        def Panel():
+            return Div(faststrap_community.StatCard(title="Users", value="1"), cls="panel")
+
+        register_component("MetricsPanel", Panel)
+        try:
+            html = to_xml(get_component("MetricsPanel")())
+            metrics = get_metrics()
+            assert metrics["MetricsPanel"]["bytes"] == len(html)
+            assert metrics["StatCard"] == {**metrics["StatCard"], "calls": 1, "bytes": 0}
+        finally:
+            registry._COMMUNITY_COMPONENTS.pop("MetricsPanel")
+
+    def test_lazy_results_are_not_rendered(self):
+        enable_metrics()
+        produced = []
+
+        def rows():
+            produced.append(1)
+            yield "row"
+
+        get_component("ScrollReveal")(Div(Lazy(rows)))
+        assert produced == []
+        assert get_metrics()["ScrollReveal"]["bytes"] == 0
+
+    def test_components_registered_later_are_instrumented(self):
+        enable_metrics()
+
+        def Custom(text="hi"):
+            return faststrap_community.StatCard(title=text, value="1")
+
+        register_component("CustomMetricsCard", Custom)
+        try:
+            get_component("CustomMetricsCard")()
+            assert get_metrics()["CustomMetricsCard"]["calls"] == 1
+        finally:
+            registry._COMMUNITY_COMPONENTS.pop("CustomMetricsCard")
+
+    def test_counters_merge_across_threads(self):
+        enable_metrics()
+        StatCard = get_component("StatCard")
+        threads = [
+            threading.Thread(target=StatCard, kwargs={"title": "T", "value": "1"}) for _ in range(4)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert get_metrics()["StatCard"]["calls"] == 4
+
+    def test_reset(self):
+        enable_metrics()
+        get_component("StatCard")(title="Users", value="1")
+        reset_metrics()
+        assert get_metrics() == {}
+
+
+class TestPrometheus:
+    def test_text_format(self):
+        enable_metrics()
+        get_component("StatCard")(title="Users", value="1")
+        text = render_prometheus()
+        assert "# TYPE faststrap_community_render_seconds summary" in text
+        assert 'faststrap_community_render_seconds_count{component="StatCard"} 1' in text
+        assert 'faststrap_community_render_seconds{component="StatCard",quantile="0.99"}' in text
+        assert 'faststrap_community_render_bytes_total{component="StatCard"}' in text
+
+    def test_setup_mounts_endpoint(self):
+        app, rt = fast_app()
+        add_bootstrap(app)
+        setup_community(app, metrics=True)
+        assert metrics_enabled()
+
+        get_component("StatCard")(title="Users", value="1")
+        response = TestClient(app).get("/community-metrics")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        assert 'component="StatCard"' in response.text
+
+    def test_response_sizes(self):
+        app, rt = fast_app()
+        add_bootstrap(app)
+        setup_community(app, metrics=True)
+
+        @rt("/")
+        def get():
+            return Div("hello")
+
+        client = TestClient(app)
+        page = client.get("/")
+        fragment = client.get("/", headers={"HX-Request": "true"})
+        client.get("/community-metrics")
+
+        totals = get_response_metrics()
+        assert totals["page"] == {"responses": 1, "bytes": len(page.content)}
+        assert totals["fragment"] == {"responses": 1, "bytes": len(fragment.content)}
+        text = client.get("/community-metrics").text
+        assert (
+            f'faststrap_community_html_response_bytes_total{{kind="page"}} {len(page.content)}'
+            in text
+        )
+        assert 'faststrap_community_html_responses_total{kind="fragment"} 1' in text
+
+    def test_setup_without_metrics_has_no_route(self):
+        app, rt = fast_app()
+        add_bootstrap(app)
+        setup_community(app)
+        assert not metrics_enabled()
+        assert not any(getattr(r, "path", "") == "/community-metrics" for r in app.routes)
@@ -0,0 +1,80 @@
+"""Tests for navigation components."""
+
+import pytest
+from fasthtml.common import fast_app, to_xml
+from faststrap import add_bootstrap
+from starlette.testclient import TestClient
+
+from faststrap_community import VerticalMegaMenu, register_menu, setup_community
+
+
+def _tree(depth, breadth=2):
+    """Build a uniform menu tree with labels encoding each item's path."""
+
+    def level(prefix, d):
+        items = []
+        for i in range(breadth):
+            label = f"{prefix}{i}"
+            item = {"label": f"Item {label}", "href": f"/c/{label}"}
+            if d < depth:
+                item["children"] = level(f"{label}-", d + 1)
+            items.append(item)
+        return items
+
+    return level("", 1)
+
+
+class TestVerticalMegaMenu:
+    def test_renders_all_levels_by_default(self):
+        html = to_xml(VerticalMegaMenu(_tree(4)))
+        assert "Item 1-1-1-1" in html
+        assert "hx-get" not in html
+
+    def test_deep_tree_does_not_recurse(self):
+        # A single chain far deeper than Python's recursion limit
+        root = node = {"label": "Level 0"}
+        for i in range(1, 3000):
+            child = {"label": f"Level {i}"}
+            node["children"] = [child]
+            node = child
+
+        register_menu("chain", [root], max_depth=3)
+        html = to_xml(VerticalMegaMenu(menu_id="chain"))
+        assert "Level 2" in html
+        assert "Level 3" not in html
+
+    def test_max_depth_adds_lazy_placeholders(self):
+        register_menu("catalog", _tree(4), max_depth=2)
+        html = to_xml(VerticalMegaMenu(menu_id="catalog"))
+        assert "Item 1-1" in html
+        assert "Item 1-1-0" not in html
+        assert 'hx-get="/community-menu/catalog?path=1.1"' in html
+        assert html.count("hx-get") == 4
+
+    def test_max_depth_without_menu_id_raises(self):
+        # The levels below max_depth would otherwise be dropped silently
+        with pytest.raises(ValueError, match="register_menu"):
+            VerticalMegaMenu(_tree(3), max_depth=1)
+
+    def test_unregistered_menu_id_raises(self):
+        with pytest.raises(ValueError, match="register_menu"):
+            VerticalMegaMenu(_tree(3), max_depth=1, menu_id="never-registered")
+
+    def test_subtree_route(self):
+        app, rt = fast_app()
+        add_bootstrap(app)
+        setup_community(app)
+        # Registered at startup: served without rendering the menu first
+        register_menu("products", _tree(5), max_depth=2)
+        client = TestClient(app)
+
+        response = client.get("/community-menu/products?path=1.0")
+        assert response.status_code == 200
+        assert "Item 1-0-1" in response.text
+        assert "Item 1-0-1-0" in response.text
+        assert "Item 1-0-1-0-0" not in response.text
+        assert 'hx-get="/community-menu/products?path=1.0.1.0"' in response.text
+
+        assert client.get("/community-menu/products?path=9").status_code == 404
+        assert client.get("/community-menu/products?path=x").status_code == 404
+        assert client.get("/community-menu/unknown?path=0").status_code == 404
@@ -0,0 +1,205 @@
+"""Tests for ProgressRing job tracking."""
+
+import asyncio
+import threading
+
+import pytest
+from fasthtml.common import fast_app, to_xml
+from faststrap import add_bootstrap
+from starlette.testclient import TestClient
+
+from faststrap_community import ProgressRing, progress, setup_community
+from faststrap_community.progress import (
+    ProgressStore,
+    finish_progress,
+    progress_events,
+    progress_store,
+    ring_progress,
+    set_progress,
+)
+from faststrap_community.scripts import hoist_scripts, reset_hoisted_scripts
+
+
+@pytest.fixture
+def store():
+    return ProgressStore()
+
+
+async def _collect(events, limit=20):
+    out = []
+    async for event in events:
+        out.append(event)
+        if len(out) >= limit:
+            break
+    return out
+
+
+class TestProgressStore:
+    def test_offset_matches_rendered_ring(self):
+        _, offset = ring_progress(30, 120)
+        assert f'stroke-dashoffset="{offset}"' in to_xml(ProgressRing(value=30, max_value=120))
+
+    def test_only_visible_changes_are_published(self, store):
+        assert store.update("job", 10).version == 0
+        assert store.update("job", 20).version == 1
+        # Same offset (to 2 decimals) and label: nothing to push
+        state = store.update("job", 20.0001)
+        assert state.version == 1
+        assert state.value == 20.0001
+
+    def test_max_value_is_kept(self, store):
+        store.update("job", 1, max_value=4)
+        state = store.update("job", 2)
+        assert state.max_value == 4
+        assert state.percentage == 50
+        assert (
+            state.event == f"event: progress\ndata: {ring_progress(2, 4)[1]:.2f} 50%\n\n".encode()
+        )
+
+    def test_finish_and_remove(self, store):
+        store.update("job", 5, max_value=10)
+        state = store.finish("job")
+        assert state.done and state.value == 10
+        store.remove("job")
+        assert store.get("job") is None
+
+    def test_wait_is_woken_from_another_thread(self, store):
+        store.start("job")
+
+        async def main():
+            timer = threading.Timer(0.05, store.update, args=("job", 50))
+            timer.start()
+            return await store.wait("job", 0, timeout=5)
+
+        state = asyncio.run(main())
+        assert state.percentage == 50
+
+    def test_wait_times_out_unchanged(self, store):
+        store.start("job")
+        state = asyncio.run(store.wait("job", 0, timeout=0.01))
+        assert state.version == 0
+
+    def test_update_survives_closed_subscriber_loop(self, store):
+        store.start("job")
+        loop = asyncio.new_event_loop()
+        store._waiters["job"] = {(loop, loop.create_future())}
+        loop.close()
+        assert store.update("job", 50).percentage == 50
+
+
+class TestEviction:
+    @pytest.fixture(autouse=True)
+    def _sweep_every_write(self, monkeypatch):
+        monkeypatch.setattr(progress, "_SWEEP_INTERVAL", 0)
+
+    def test_finished_jobs_expire(self):
+        store = ProgressStore(finished_ttl=0)
+        store.finish("job")
+        store.start("other")
+        assert store.get("job") is None
+        assert store.get("other") is not None
+
+    def test_finished_jobs_are_kept_for_their_ttl(self):
+        store = ProgressStore(finished_ttl=60)
+        store.finish("job")
+        store.start("other")
+        assert store.get("job").done
+
+    def test_idle_jobs_expire_unless_watched(self):
+        store = ProgressStore(idle_ttl=0)
+        store.start("watched")
+        store.subscribe("watched")
+        store.start("idle")
+        store.start("other")
+        assert store.get("idle") is None
+        assert store.get("watched") is not None
+
+        store.unsubscribe("watched")
+        store.start("other")
+        assert store.get("watched") is None
+
+    def test_stream_counts_as_subscriber(self):
+        store = ProgressStore(idle_ttl=0)
+        store.start("job")
+
+        async def main():
+            events = progress_events("job", store, keepalive=0.01)
+            await events.__anext__()
+            assert store._subscribers == {"job": 1}
+            await events.aclose()
+
+        asyncio.run(main())
+        assert store._subscribers == {}
+
+
+class TestProgressEvents:
+    def test_updates_are_coalesced(self, store):
+        store.start("job")
+
+        async def main():
+            async def producer():
+                for i in range(1, 101):
+                    store.update("job", i)
+                    await asyncio.sleep(0.001)
+                store.finish("job")
+
+            task = asyncio.create_task(producer())
+            events = await _collect(progress_events("job", store, min_interval=0.05))
+            await task
+            return events
+
+        events = asyncio.run(main())
+        progress = [e for e in events if e.startswith(b"event: progress")]
+        # Far fewer events than the 100 updates, and the last one is the final state
+        assert 1 < len(progress) < 20
+        assert progress[-1].endswith(b" 100%\n\n")
+        assert events[-1] == b"event: done\ndata: \n\n"
+
+    def test_removed_job_closes_stream(self, store):
+        events = asyncio.run(_collect(progress_events("missing", store)))
+        assert events == [b"event: done\ndata: \n\n"]
+
+    def test_keepalive(self, store):
+        store.start("job")
+        events = asyncio.run(_collect(progress_events("job", store, keepalive=0.01), limit=2))
+        assert events[1] == b": keepalive\n\n"
+
+
+class TestTrack:
+    def teardown_method(self):
+        progress_store.remove("track-job")
+        reset_hoisted_scripts()
+
+    def test_renders_current_state(self):
+        reset_hoisted_scripts()
+        set_progress("track-job", 40)
+        html = to_xml(ProgressRing.track("track-job", variant="success"))
+        assert 'data-fs-progress-src="/community-progress/track-job"' in html
+        assert "fs-comm-progress-ring-bar" in html
+        assert "40%" in html
+        assert "js/progress-ring.js" in html
+
+    def test_job_id_is_url_encoded(self):
+        html = to_xml(ProgressRing.track("a b/c?d"))
+        progress_store.remove("a b/c?d")
+        assert 'data-fs-progress-src="/community-progress/a%20b%2Fc%3Fd"' in html
+
+    def test_creates_unknown_job_and_skips_hoisted_script(self):
+        hoist_scripts()
+        html = to_xml(ProgressRing.track("track-job"))
+        assert progress_store.get("track-job").value == 0
+        assert "<script" not in html
+
+    def test_endpoint_streams_progress(self):
+        app, rt = fast_app()
+        add_bootstrap(app)
+        setup_community(app)
+
+        set_progress("track-job", 25)
+        finish_progress("track-job")
+        client = TestClient(app)
+        response = client.get("/community-progress/track-job")
+        assert response.headers["content-type"].startswith("text/event-stream")
+        assert response.text.endswith("data: 0.00 100%\n\nevent: done\ndata: \n\n")
+
+        assert client.get("/community-progress/unknown-job").status_code == 404
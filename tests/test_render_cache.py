@@ -0,0 +1,67 @@
+"""Tests for the opt-in render cache."""
+
+from fasthtml.common import Div, to_xml
+
+from faststrap_community import (
+    DotsLoader,
+    PolygonLoader,
+    RingLoader,
+    TiltCard,
+    cached,
+    clear_render_cache,
+    render_cache_info,
+    render_cached,
+    reset_community_defaults,
+    set_community_defaults,
+    set_render_cache_size,
+)
+
+
+class TestRenderCache:
+    def setup_method(self):
+        reset_community_defaults()
+        set_render_cache_size(1024)
+        clear_render_cache()
+
+    def test_matches_uncached_output(self):
+        html = render_cached(RingLoader, variant="success", size="2rem")
+        assert str(html) == to_xml(RingLoader(variant="success", size="2rem"))
+
+    def test_identical_calls_hit(self):
+        first = render_cached(DotsLoader, variant="info")
+        second = render_cached(DotsLoader, variant="info")
+        assert first is second
+        info = render_cache_info()
+        assert info["hits"] == 1
+        assert info["misses"] == 1
+
+    def test_arguments_are_normalized(self):
+        render_cached(DotsLoader)
+        render_cached(DotsLoader, variant=None)
+        render_cached(DotsLoader, None)
+        assert render_cache_info()["size"] == 1
+
+    def test_lookup_by_registered_name(self):
+        assert render_cached("PolygonLoader") == render_cached(PolygonLoader)
+
+    def test_unhashable_arguments_bypass_cache(self):
+        html = render_cached(TiltCard, Div("Content"))
+        assert "Content" in html
+        assert render_cache_info()["size"] == 0
+
+    def test_lru_eviction(self):
+        set_render_cache_size(2)
+        for size in ("1rem", "2rem", "3rem"):
+            render_cached(RingLoader, size=size)
+        assert render_cache_info()["size"] == 2
+
+    def test_set_defaults_invalidates(self):
+        render_cached(DotsLoader)
+        set_community_defaults("DotsLoader", variant="warning")
+        render_cached(DotsLoader)
+        assert render_cache_info()["misses"] == 2
+
+    def test_cached_wrapper(self):
+        Spinner = cached(RingLoader)
+        assert Spinner(size="2rem") is Spinner(size="2rem")
+        assert "fs-comm-ring-loader" in to_xml(Div(Spinner(size="2rem")))
@@ -0,0 +1,110 @@
+"""Tests for the page-level script registry."""
+
+from pathlib import Path
+
+from fasthtml.common import Div, fast_app, to_xml
+from faststrap import add_bootstrap
+from starlette.testclient import TestClient
+
+from faststrap_community import ScrollReveal, TagInput, setup_community
+from faststrap_community.scripts import (
+    get_script_url,
+    list_scripts,
+    require_script,
+    reset_hoisted_scripts,
+    script_scope,
+)
+
+JS_PATH = Path(__file__).parent.parent / "src" / "faststrap_community" / "static" / "js"
+
+
+class TestScriptRegistry:
+    def setup_method(self):
+        reset_hoisted_scripts()
+
+    def teardown_method(self):
+        reset_hoisted_scripts()
+
+    def test_builtin_scripts_registered(self):
+        assert "tag-input" in list_scripts()
+        assert "scroll-reveal" in list_scripts()
+
+    def test_script_url_is_versioned(self):
+        url = get_script_url("tag-input", static_url="/assets/")
+        assert url.startswith("/assets/js/tag-input.js?v=")
+
+    def test_components_reference_external_script(self):
+        html = to_xml(TagInput(name="skills", tags=["Python"]))
+        assert "tag-input.js?v=" in html
+        assert "querySelectorAll" not in html
+
+    def test_tag_input_controller_is_delegated(self):
+        html = to_xml(TagInput(name="skills", tags=["Python"]))
+        assert 'data-fs-tag-input="skills"' in html
+        assert "data-fs-tag-entry" in html and "data-fs-tag-value" in html
+
+        js = (JS_PATH / "tag-input.js").read_text()
+        assert "document.addEventListener('click'" in js
+        assert "querySelectorAll('.fs-comm-tag-input')" not in js
+        assert "DOMContentLoaded" not in js
+
+    def test_scroll_reveal_observes_new_content_only(self):
+        js = (JS_PATH / "scroll-reveal.js").read_text()
+        assert "observer.unobserve(entry.target)" in js
+        assert "MutationObserver" in js and "requestAnimationFrame" in js
+
+        css = (JS_PATH.parent / "css" / "effects.css").read_text()
+        reveal = css[css.index(".fs-comm-reveal {") :]
+        reveal = reveal[: reveal.index("}")]
+        assert "transition-property: opacity, transform;" in reveal
+        assert "transition: all" not in reveal
+
+    def test_scope_emits_once(self):
+        with script_scope():
+            html = to_xml(Div(*[ScrollReveal(f"Item {i}") for i in range(50)]))
+        assert html.count("scroll-reveal.js") == 1
+
+    def test_scope_is_reset_after_exit(self):
+        with script_scope():
+            require_script("tag-input")
+            assert require_script("tag-input") is None
+        assert require_script("tag-input") is not None
+
+    def test_setup_community_hoists_scripts(self):
+        app, rt = fast_app()
+        add_bootstrap(app)
+        setup_community(app)
+
+        srcs = [h.attrs.get("src", "") for h in app.hdrs if hasattr(h, "attrs")]
+        assert sum("tag-input.js" in s for s in srcs) == 1
+        assert sum("scroll-reveal.js" in s for s in srcs) == 1
+
+        @rt("/")
+        def get():
+            return Div(TagInput(name="skills"), ScrollReveal("Content"))
+
+        # Components rendered by this app no longer carry their own script tags
+        html = TestClient(app).get("/").text
+        assert html.count("tag-input.js") == 1
+        assert html.count("scroll-reveal.js") == 1
+
+        # Idempotent
+        count = len(app.hdrs)
+        setup_community(app)
+        assert len(app.hdrs) == count
+        assert TestClient(app).get("/").text.count("tag-input.js") == 1
+
+    def test_hoisting_is_per_app(self):
+        app, rt = fast_app()
+        add_bootstrap(app)
+        setup_community(app)
+
+        other, other_rt = fast_app()
+
+        @other_rt("/")
+        def get():
+            return TagInput(name="skills")
+
+        # An app without the headers (and rendering outside requests) still emits the script
+        assert "tag-input.js" in TestClient(other).get("/").text
+        assert "tag-input.js" in to_xml(TagInput(name="skills"))
@@ -0,0 +1,82 @@
+"""Tests for SearchIndex and SearchBar active search."""
+
+import random
+
+from fasthtml.common import to_xml
+
+from faststrap_community import SearchBar, SearchIndex
+
+FRUITS = ["Apple", "apricot", "Avocado", "banana", "Blackberry", "blueberry", "Cherry"]
+
+
+class TestSearchIndex:
+    def test_prefix_matches_in_alphabetical_order(self):
+        index = SearchIndex(FRUITS)
+        assert index.search("a") == ["Apple", "apricot", "Avocado"]
+        assert index.search("BL") == ["Blackberry", "blueberry"]
+        assert index.search("x") == []
+
+    def test_empty_query_and_k(self):
+        index = SearchIndex(FRUITS)
+        assert index.search("  ") == []
+        assert index.search("b", k=2) == ["banana", "Blackberry"]
+        assert index.search("b", k=0) == []
+
+    def test_weighted_top_k_matches_brute_force(self):
+        rng = random.Random(7)
+        corpus = [
+            {"name": "".join(rng.choices("abc", k=rng.randint(1, 6))), "score": rng.randint(0, 50)}
+            for _ in range(2000)
+        ]
+        index = SearchIndex(corpus, key=lambda e: e["name"], weight=lambda e: e["score"])
+        for prefix in ["a", "ab", "cab", "bbb"]:
+            matches = [e for e in corpus if e["name"].startswith(prefix)]
+            expected = sorted(matches, key=lambda e: (-e["score"], e["name"]))[:10]
+            assert [e["score"] for e in index.search(prefix)] == [e["score"] for e in expected]
+            assert index.count(prefix) == len(matches)
+
+    def test_weighted_search_without_match(self):
+        index = SearchIndex(["apple", "banana"], weight=len)
+        assert index.search("zzz") == []
+        assert index.search("0") == []
+
+    def test_word_prefix(self):
+        index = SearchIndex(["Smart Phone", "Phone Case", "Headphones"], word_prefix=True)
+        assert sorted(index.search("phone")) == ["Phone Case", "Smart Phone"]
+        assert SearchIndex(["Smart Phone"]).search("phone") == []
+
+    def test_entry_matching_several_words_is_returned_once(self):
+        index = SearchIndex(["red red red", "red blue"], weight=len, word_prefix=True)
+        assert index.search("red") == ["red red red", "red blue"]
+
+    def test_normalization(self):
+        index = SearchIndex(["New   York", "Newark"])
+        assert index.search("  NEW y") == ["New   York"]
+
+    def test_results_are_cached(self):
+        index = SearchIndex(FRUITS, cache_size=2)
+        first = index.search("b")
+        assert index.search("B ") is first
+        index.search("a")
+        index.search("c")
+        assert index.cache_info() == {"size": 2, "maxsize": 2}
+        assert index.search("b") is not first
+
+
+class TestSearchBarActiveSearch:
+    def test_plain_form_by_default(self):
+        html = to_xml(SearchBar())
+        assert "hx-get" not in html
+        assert "fs-comm-search-results" not in html
+
+    def test_active_search_attributes(self):
+        html = to_xml(SearchBar(name="q", search_url="/suggest", delay="150ms"))
+        assert 'hx-get="/suggest"' in html
+        assert 'hx-trigger="input changed delay:150ms, search"' in html
+        assert 'hx-sync="this:replace"' in html
+        assert 'hx-target="#q-results"' in html
+        assert 'id="q-results"' in html
+
+    def test_custom_results_container(self):
+        html = to_xml(SearchBar(search_url="/suggest", results_id="hits"))
+        assert 'hx-target="#hits"' in html and 'id="hits"' in html
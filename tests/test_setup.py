@@ -36,7 +36,7 @@ class TestSetupCommunity:
 
         # Check that cache URLs were added
         assert len(app._faststrap_pwa_cache_urls) > 0
-        assert any("community-base.css" in url for url in app._faststrap_pwa_cache_urls)
+        assert any("/css/community." in url for url in app._faststrap_pwa_cache_urls)
 
     def test_no_duplicate_injection(self):
         """Test that calling setup_community twice doesn't duplicate headers."""
@@ -0,0 +1,100 @@
+"""Tests for the in-memory static asset server."""
+
+import gzip
+
+import pytest
+from starlette.applications import Starlette
+from starlette.routing import Mount
+from starlette.testclient import TestClient
+
+from faststrap_community.assets import STATIC_DIR, get_css_bundle
+from faststrap_community.static_server import CommunityStaticApp
+
+
+@pytest.fixture(scope="module")
+def client():
+    app = Starlette(routes=[Mount("/static", CommunityStaticApp(), name="static")])
+    return TestClient(app)
+
+
+def _raw(client, path, **headers):
+    # Disable httpx's transparent decoding to inspect the encoded body
+    with client.stream("GET", path, headers=headers) as response:
+        return response, b"".join(response.iter_raw())
+
+
+class TestCommunityStaticApp:
+    def test_serves_identity(self, client):
+        response, body = _raw(client, "/static/css/cards.css", **{"accept-encoding": "identity"})
+        assert response.status_code == 200
+        assert body == (STATIC_DIR / "css/cards.css").read_bytes()
+        assert response.headers["content-type"] == "text/css; charset=utf-8"
+        assert "content-encoding" not in response.headers
+        assert response.headers["cache-control"] == "no-cache"
+
+    def test_serves_gzip(self, client):
+        response, body = _raw(
+            client, "/static/css/loaders.css", **{"accept-encoding": "gzip, br;q=0"}
+        )
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert int(response.headers["content-length"]) == len(body)
+        assert gzip.decompress(body) == (STATIC_DIR / "css/loaders.css").read_bytes()
+
+    def test_gzip_refused(self, client):
+        response, _ = _raw(client, "/static/css/loaders.css", **{"accept-encoding": "gzip;q=0"})
+        assert "content-encoding" not in response.headers
+
+    def test_etag_revalidation(self, client):
+        first = client.get("/static/js/tag-input.js")
+        etag = first.headers["etag"]
+        assert etag.startswith('"')
+
+        response = client.get("/static/js/tag-input.js", headers={"if-none-match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+        response = client.get("/static/js/tag-input.js", headers={"if-none-match": '"other"'})
+        assert response.status_code == 200
+
+    def test_etags_differ_per_encoding(self, client):
+        plain, _ = _raw(client, "/static/css/loaders.css", **{"accept-encoding": "identity"})
+        gzipped, _ = _raw(client, "/static/css/loaders.css", **{"accept-encoding": "gzip"})
+        assert plain.headers["etag"] != gzipped.headers["etag"]
+
+        # Either variant's ETag revalidates
+        response = client.get(
+            "/static/css/loaders.css", headers={"if-none-match": f'W/{plain.headers["etag"]}'}
+        )
+        assert response.status_code == 304
+
+    def test_fingerprinted_and_versioned_assets_are_immutable(self, client):
+        response = client.get(f"/static/{get_css_bundle()}")
+        assert response.headers["cache-control"] == "public, max-age=31536000, immutable"
+
+        response = client.get("/static/js/scroll-reveal.js?v=0123456789")
+        assert "immutable" in response.headers["cache-control"]
+
+    def test_head_and_methods(self, client):
+        response = client.head("/static/css/cards.css", headers={"accept-encoding": "identity"})
+        assert response.status_code == 200
+        assert response.content == b""
+        assert int(response.headers["content-length"]) > 0
+
+        assert client.post("/static/css/cards.css").status_code == 405
+
+    def test_missing_files(self, client):
+        assert client.get("/static/css/nope.css").status_code == 404
+        assert client.get("/static/../__init__.py").status_code == 404
+        assert client.get("/static/css").status_code == 404
+
+    def test_no_disk_reads_per_request(self, client, monkeypatch):
+        from pathlib import Path
+
+        def fail(*args, **kwargs):
+            raise AssertionError("disk access during request")
+
+        monkeypatch.setattr(Path, "read_bytes", fail)
+        monkeypatch.setattr(Path, "stat", fail)
+        assert client.get("/static/css/effects.css").status_code == 200
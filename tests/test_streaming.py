@@ -0,0 +1,107 @@
+"""Tests for streaming HTML rendering."""
+
+from fasthtml.common import A, Code, Div, Input, Li, NotStr, P, Pre, Span, Ul, fast_app, to_xml
+from starlette.testclient import TestClient
+
+from faststrap_community import (
+    DotsLoader,
+    Lazy,
+    ScrollReveal,
+    StatCard,
+    StreamingHTMLResponse,
+    TimelineCard,
+    VerticalMegaMenu,
+    iter_html,
+    render_many,
+    stream_many,
+)
+
+
+def _page():
+    return Div(
+        P("Intro & <escaped>"),
+        Ul(*[Li(A(f"Link {i}", href=f"/item?id={i}&x=1")) for i in range(5)]),
+        Pre(Code("  keep\n  whitespace")),
+        Input(type="text", disabled=True, value='say "hi"'),
+        NotStr("<b>raw</b>"),
+        Span("inline", Span("nested")),
+        StatCard(title="Users", value="1,204", trend="+3%", icon="👥"),
+        DotsLoader(variant="success"),
+        ScrollReveal(P("Revealed")),
+        VerticalMegaMenu(
+            [{"label": "Home", "children": [{"label": "Sub", "children": [{"label": "Leaf"}]}]}]
+        ),
+        None,
+        cls="page",
+    )
+
+
+class TestIterHtml:
+    def test_matches_to_xml(self):
+        page = _page()
+        assert "".join(iter_html(page)) == to_xml(page)
+
+    def test_attribute_and_whitespace_rules_match_to_xml(self):
+        page = Div(
+            Div("x", hx_vals={"a": 1}, data_q='it\'s "quoted"', title="a < b & c"),
+            Div(Span("s"), Pre("p", Span("inner")), contenteditable="true"),
+            Input(type="checkbox", checked=True, required=False, tabindex=0),
+            NotStr("<!-- raw -->"),
+            Ul(Li(P("deep"), Li(Code("c")))),
+        )
+        assert "".join(iter_html(page)) == to_xml(page)
+
+    def test_multiple_top_level_elements(self):
+        parts = ("<!doctype html>", Div("a"), P("b"))
+        assert "".join(iter_html(*parts)) == to_xml(*parts)
+
+    def test_chunking(self):
+        page = Div(*[P(f"Paragraph {i}") for i in range(500)])
+        chunks = list(iter_html(page, chunk_size=1024))
+        assert len(chunks) > 1
+        assert all(len(c) < 1024 + 100 for c in chunks)
+        assert "".join(chunks) == to_xml(page)
+
+    def test_lazy_children_are_deferred(self):
+        produced = []
+
+        def rows():
+            for i in range(3):
+                produced.append(i)
+                yield TimelineCard(title=f"Event {i}")
+
+        chunks = iter_html(Div(P("Shell"), Lazy(rows)))
+        first = next(chunks)
+        assert "Shell" in first
+        assert produced == []
+        rest = "".join(chunks)
+        assert produced == [0, 1, 2]
+        assert "Event 2" in rest
+
+    def test_lazy_renders_with_to_xml(self):
+        tree = Div(Lazy(lambda: [P("a"), P("b")]))
+        assert to_xml(tree) == "".join(iter_html(Div(Lazy(lambda: [P("a"), P("b")]))))
+
+    def test_stream_many(self):
+        rows = [{"title": f"Event {i}"} for i in range(10)]
+        html = "".join(iter_html(stream_many(TimelineCard, rows)))
+        assert html == str(render_many(TimelineCard, rows))
+
+
+class TestStreamingResponse:
+    def test_route_streams_document(self):
+        app, rt = fast_app()
+
+        @rt("/feed")
+        def get():
+            rows = [{"title": f"Event {i}"} for i in range(100)]
+            return StreamingHTMLResponse(
+                Div(stream_many(TimelineCard, rows)), title="Feed", chunk_size=512
+            )
+
+        response = TestClient(app).get("/feed")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/html")
+        assert response.text.startswith("<!doctype html>")
+        assert "<title>Feed</title>" in response.text
+        assert response.text.count("fs-comm-timeline-card") == 100
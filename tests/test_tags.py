@@ -0,0 +1,125 @@
+"""Tests for TagIndex and TagInput autocomplete."""
+
+import random
+
+from fasthtml.common import to_xml
+
+from faststrap_community import TagIndex, TagInput
+from faststrap_community import tags as tags_module
+
+
+class TestTagIndex:
+    def test_prefix_matches_ranked_by_frequency(self):
+        index = TagIndex({"python": 50, "pytest": 80, "PyPI": 10, "htmx": 5})
+        assert index.suggest("py") == ["pytest", "python", "PyPI"]
+        assert index.suggest("PY", k=1) == ["pytest"]
+        assert index.suggest("  ") == []
+        assert index.suggest("zzz") == []
+
+    def test_add_inserts_and_counts_case_insensitively(self):
+        index = TagIndex(["Python"])
+        index.add("python")
+        index.add("  FastHTML ")
+        index.add("fasthtml", count=5)
+        assert len(index) == 2
+        assert index.count("PYTHON") == 2
+        assert index.count("fasthtml") == 6
+        assert "FastHTML" in index and "django" not in index
+        # The first spelling is kept
+        assert index.suggest("fast") == ["FastHTML"]
+
+    def test_increment_reorders_results(self):
+        index = TagIndex({"rust": 3, "ruby": 2})
+        assert index.suggest("ru") == ["rust", "ruby"]
+        index.add("ruby", count=2)
+        assert index.suggest("ru") == ["ruby", "rust"]
+
+    def test_fuzzy_fills_remaining_slots(self):
+        index = TagIndex({"javascript": 10, "java": 4, "kotlin": 2})
+        # Transposed letters
+        assert index.suggest("jaav") == ["javascript", "java"]
+        # Prefix matches come first
+        assert index.suggest("javs") == ["javascript", "java"]
+        assert index.suggest("jaav", fuzzy=False) == []
+        # Short queries aren't fuzzy matched
+        assert index.suggest("ja", k=3) == ["javascript", "java"]
+
+    def test_fuzzy_replacements_and_insertions(self):
+        index = TagIndex({"python": 5, "pytest": 3})
+        index.add("django")
+        assert index.suggest("pxth") == ["python"]
+        assert index.suggest("pyyth") == ["python"]
+        assert index.suggest("dajngo") == ["django"]
+
+    def test_fuzzy_variants_are_bounded(self):
+        rng = random.Random(5)
+        # Latin, Cyrillic, Greek and CJK: a few hundred distinct characters
+        alphabet = [
+            chr(c)
+            for r in ((97, 123), (0x430, 0x450), (0x3B1, 0x3CA), (0x4E00, 0x4F00))
+            for c in range(*r)
+        ]
+        index = TagIndex("".join(rng.choices(alphabet, k=rng.randint(3, 10))) for _ in range(20000))
+        variants = index._variants("qqqzz")
+        assert len(variants) <= tags_module._MAX_VARIANTS
+
+    def test_fuzzy_variants_only_use_characters_from_tags(self):
+        index = TagIndex(["abcd", "abxy", "zzzz"])
+        assert set(index._variants("abq")) == {
+            # Deletions and swaps
+            "bq",
+            "aq",
+            "ab",
+            "baq",
+            "aqb",
+            # Characters following "ab", "a" and "" in known tags
+            "abcq",
+            "abxq",
+            "abc",
+            "abx",
+            "abbq",
+            "aabq",
+            "zabq",
+            "zbq",
+        }
+
+    def test_matches_brute_force_across_merges(self, monkeypatch):
+        monkeypatch.setattr(tags_module, "_MIN_MERGE", 16)
+        rng = random.Random(3)
+        index = TagIndex()
+        counts: dict[str, int] = {}
+        for _ in range(3000):
+            tag = "".join(rng.choices("abc", k=rng.randint(1, 6)))
+            index.add(tag)
+            counts[tag] = counts.get(tag, 0) + 1
+        assert len(index) == len(counts)
+        for prefix in ["a", "ab", "cab", "bbb"]:
+            matches = [t for t in counts if t.startswith(prefix)]
+            expected = sorted(matches, key=lambda t: (-counts[t], t))[:8]
+            assert index.suggest(prefix, fuzzy=False) == expected
+
+    def test_rendered_fragments_are_cached_until_a_tag_is_added(self):
+        index = TagIndex({"python": 2, "pytest": 1})
+        fragment = index.render_suggestions("py")
+        assert 'data-tag="python"' in fragment and "fs-comm-tag-suggestion" in fragment
+        assert index.render_suggestions("PY ") is fragment
+        index.add("pyramid", count=5)
+        updated = index.render_suggestions("py")
+        assert updated is not fragment
+        assert updated.index("pyramid") < updated.index("python")
+        assert str(index.render_suggestions("zzz")) == ""
+
+
+class TestTagInputSuggestions:
+    def test_suggest_url_adds_htmx_attributes(self):
+        html = to_xml(TagInput(name="skills", suggest_url="/skills/suggest"))
+        assert 'hx-get="/skills/suggest"' in html
+        assert 'hx-trigger="input changed delay:200ms"' in html
+        assert 'hx-target="#skills-suggestions"' in html
+        assert 'hx-sync="this:replace"' in html
+        assert 'id="skills-suggestions"' in html
+
+    def test_plain_tag_input_unchanged(self):
+        html = to_xml(TagInput(name="skills"))
+        assert "hx-get" not in html
+        assert "fs-comm-tag-suggestions" not in html